@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+import logging
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from world import World
+from log_config import get_logger, resolve_level, set_level
+
+# Configure logging (Pyodide-compatible)
+logger = get_logger(__name__)
+set_level(min(resolve_level(), logging.INFO))  # Results are reported at INFO
+
+SEED = 424242
+CHUNK_ROWS = [0, 50, 500, 3000, 6000]  # Sample chunk rows across the depth zones
+CHUNKS_PER_ROW = 7
+ROUNDS = 20
+
+def make_world(use_numpy):
+    """Create a world with a fixed seed and quiet per-chunk logging."""
+    logging.getLogger("world").setLevel(logging.WARNING)
+    world = World(use_numpy=use_numpy)
+    world.set_seed(SEED)
+    return world
+
+def bench(world):
+    """Return chunks generated per second for the sampled chunk rows."""
+    count = 0
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for chunk_y in CHUNK_ROWS:
+            for chunk_x in range(CHUNKS_PER_ROW):
+                world.generate_chunk(chunk_x, chunk_y)
+                count += 1
+    return count / (time.perf_counter() - start)
+
+def main():
+    scalar = make_world(False)
+    vectorized = make_world(True)
+    if not vectorized.use_numpy:
+        logger.error("NumPy is not installed; only the scalar path can be measured")
+        logger.info("scalar: %.1f chunks/s", bench(scalar))
+        return
+
+    # Both paths must produce byte-identical chunks for the same seed
+    for chunk_y in CHUNK_ROWS:
+        for chunk_x in range(CHUNKS_PER_ROW):
+            if scalar.get_chunk(chunk_x, chunk_y) != vectorized.get_chunk(chunk_x, chunk_y):
+                raise SystemExit(f"Chunk ({chunk_x}, {chunk_y}) differs between scalar and NumPy paths")
+
+    scalar_rate = bench(scalar)
+    numpy_rate = bench(vectorized)
+    logger.info("scalar: %.1f chunks/s", scalar_rate)
+    logger.info("numpy:  %.1f chunks/s (%.1fx)", numpy_rate, numpy_rate / scalar_rate)
+
+if __name__ == "__main__":
+    main()
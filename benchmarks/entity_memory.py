@@ -0,0 +1,103 @@
+import os
+import sys
+import time
+import random
+import logging
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import settings
+import world
+from entities import OreItem, FallingRock, Enemy, BlasterShot, Explosion, ParticleSystem
+from game import Game
+from data import load_ores, load_upgrades
+from log_config import get_logger, resolve_level, set_level
+
+# Configure logging (Pyodide-compatible)
+logger = get_logger(__name__)
+set_level(min(resolve_level(), logging.INFO))  # Results are reported at INFO
+
+COUNT = 10000
+TICKS = 10
+DT = 1 / 60
+
+def make_game():
+    """Create a singleplayer game with per-entity logging silenced."""
+    game = Game(load_upgrades(), load_ores())
+    game.mode = "singleplayer"
+    for name in ("game", "world", "entities", "player", "renderer", "ui", "utils"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    return game
+
+def spawn_position(rng):
+    """A pixel position somewhere in the first screen of the world."""
+    return rng.randrange(settings.WIDTH), rng.randrange(settings.HEIGHT)
+
+def builders(game):
+    """Map each entity kind to (create one, update one)."""
+    rng = random.Random(1)
+
+    def pooled(cls, make_args):
+        return lambda: activated(cls(), *make_args(rng))
+
+    return {
+        "OreItem": (pooled(OreItem, lambda r: (*spawn_position(r), "stone", 1, game.ores_cfg)),
+                    lambda entity: entity.update(DT, game)),
+        "Explosion": (pooled(Explosion, lambda r: (*spawn_position(r), 3 * settings.TILE_SIZE)),
+                      lambda entity: entity.update(DT, game)),
+        "BlasterShot": (pooled(BlasterShot, lambda r: (*spawn_position(r), 100, 0)),
+                        lambda entity: entity.update(DT, game)),
+        "Enemy": (lambda: Enemy(*spawn_position(rng), rng.choice(["bat", "goblin"])),
+                  lambda entity: entity.update(DT, game)),
+        "entities.FallingRock": (lambda: FallingRock(*spawn_position(rng), 100, "stone"),
+                                 lambda entity: entity.update(DT, game)),
+        "world.FallingRock": (lambda: activated(world.FallingRock(), *spawn_position(rng), 100, "stone"),
+                              lambda entity: entity.update(DT, game.world, game.ores_cfg)),
+        "RemotePlayer": (lambda: Game.RemotePlayer("remote", *spawn_position(rng), 100),
+                         lambda entity: entity.update(entity.x + 1, entity.y, entity.health)),
+    }
+
+def activated(entity, *args):
+    """Activate a pooled entity and return it."""
+    entity.activate(*args)
+    return entity
+
+def measure(create, update):
+    """Return (bytes per entity, entity updates per second) for COUNT entities of one kind."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [create() for _ in range(COUNT)]
+    size = (tracemalloc.get_traced_memory()[0] - before) / COUNT
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        for entity in entities:
+            update(entity)
+    return size, COUNT * TICKS / (time.perf_counter() - start)
+
+def measure_particles():
+    """Return (bytes per particle, particles spawned and updated per second) for the batched ParticleSystem."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    particles = ParticleSystem(capacity=COUNT)
+    size = (tracemalloc.get_traced_memory()[0] - before) / COUNT
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        particles.count = 0
+        particles.spawn(100, 100, COUNT, particles.kind_id(sparkle=True))
+        particles.update(DT)
+    return size, COUNT * TICKS / (time.perf_counter() - start)
+
+def main():
+    game = make_game()
+    results = {name: measure(create, update) for name, (create, update) in builders(game).items()}
+    results["Particle"] = measure_particles()
+    for name, (size, rate) in results.items():
+        logger.info("%-22s %8.1f bytes/entity %12.0f updates/s", name, size, rate)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import time
+
+class GameClock:
+    """Monotonic simulation time that game logic reads instead of the wall clock."""
+    def __init__(self, scale=1.0, step_dt=None):
+        self.time = 0.0  # Simulated seconds since the clock was created
+        self.scale = scale  # Simulated seconds per real second
+        self.step_dt = step_dt  # Step mode: every tick advances this many seconds, however long it really took
+        self.paused = False
+        self.last_real = time.monotonic()
+
+    def now(self):
+        """Get the current simulation time in seconds."""
+        return self.time
+
+    def tick(self, real_dt=None):
+        """Advance by one frame of real_dt seconds, measured if omitted, and return the simulated seconds that passed."""
+        real_now = time.monotonic()
+        if real_dt is None:
+            real_dt = real_now - self.last_real
+        self.last_real = real_now
+        if self.paused:
+            return 0.0
+        dt = (self.step_dt if self.step_dt is not None else real_dt) * self.scale
+        self.time += dt
+        return dt
@@ -1,94 +1,205 @@
 import pygame
 import random
 import math
-import time
-import logging
-from settings import WIDTH, HEIGHT, TILE_SIZE, NUM_COLS, MAX_DEPTH, ENEMY_DROPS
+import itertools
+from array import array
+from settings import WIDTH, HEIGHT, TILE_SIZE, NUM_COLS, MAX_DEPTH, ENEMY_DROPS, PARTICLE_CAPACITY, SPATIAL_CELL_SIZE
+from log_config import get_logger
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; ParticleSystem falls back to array buffers and loops
+    np = None
 
 # Configure logging (Pyodide-compatible)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 logger.info("Initializing entities.py")
 
-class Particle:
-    def __init__(self, x, y, vx, vy, life, sparkle=False, treasure=False, rock_chip=False):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.life = life
-        self.max_life = life
-        self.sparkle = sparkle
-        self.treasure = treasure
-        self.rock_chip = rock_chip
-
-    def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.life -= dt
+class ParticleSystem:
+    """All particles in preallocated structure-of-arrays buffers, updated and drawn in batches."""
+    ALPHA_BUCKETS = 16  # Distinct fade levels, each with its own cached sprite
+
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        """Allocate buffers for up to capacity live particles."""
+        self.capacity = capacity
+        self.count = 0  # Live particles are packed at the front of every buffer
+        if np is not None:
+            self.x, self.y, self.vx, self.vy, self.life, self.max_life = (np.zeros(capacity) for _ in range(6))
+            self.kind = np.zeros(capacity, dtype=np.int32)
+        else:
+            self.x, self.y, self.vx, self.vy, self.life, self.max_life = (array("d", bytes(8 * capacity)) for _ in range(6))
+            self.kind = array("i", bytes(array("i").itemsize * capacity))
+        self.buffers = [self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.kind]
+        self.kinds = []  # Kind ID: (color, size)
+        self.kind_ids = {}
+        self.sprites = {}  # (kind ID, alpha bucket): pre-tinted surface
+        logger.debug("ParticleSystem initialized with capacity %s", capacity)
+
+    def kind_id(self, sparkle=False, treasure=False, rock_chip=False, color=None):
+        """Get the kind ID for a particle style, registering it on first use."""
+        if treasure:
+            base_color, size = (255, 215, 0), 5
+        elif sparkle:
+            base_color, size = (255, 255, 0), 3
+        elif rock_chip:
+            base_color, size = (80, 80, 80), 2
+        else:
+            base_color, size = (100, 100, 100), 3
+        key = (tuple(color) if color is not None else base_color, size)
+        kind = self.kind_ids.get(key)
+        if kind is None:
+            kind = self.kind_ids[key] = len(self.kinds)
+            self.kinds.append(key)
+        return kind
+
+    def spawn(self, x, y, count, kind):
+        """Add count particles of a kind at (x, y) with random velocity and lifetime; return how many fit."""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return 0
+        draws = [(random.uniform(-50, 50), random.uniform(-50, 50), random.uniform(0.5, 1.0)) for _ in range(count)]
+        vx, vy, life = zip(*draws)
+        start, end = self.count, self.count + count
+        for buffer, values in ((self.x, [x] * count), (self.y, [y] * count), (self.vx, vx), (self.vy, vy),
+                               (self.life, life), (self.max_life, life), (self.kind, [kind] * count)):
+            buffer[start:end] = values if np is not None else array(buffer.typecode, values)
+        self.count = end
+        return count
+
+    def update(self, dt, game=None):
+        """Advance every particle and drop the ones whose life ran out."""
+        n = self.count
+        if not n:
+            return
+        if np is not None:
+            self.x[:n] += self.vx[:n] * dt
+            self.y[:n] += self.vy[:n] * dt
+            self.life[:n] -= dt
+            alive = self.life[:n] > 0
+            if not alive.all():
+                keep = np.flatnonzero(alive)
+                for buffer in self.buffers:
+                    buffer[:len(keep)] = buffer[keep]
+                self.count = len(keep)
+            return
+        kept = 0
+        for i in range(n):
+            life = self.life[i] - dt
+            if life > 0:
+                for buffer in self.buffers:
+                    buffer[kept] = buffer[i]
+                self.x[kept] += self.vx[i] * dt
+                self.y[kept] += self.vy[i] * dt
+                self.life[kept] = life
+                kept += 1
+        self.count = kept
+
+    def sprite(self, kind, bucket):
+        """Get the cached sprite for a kind at a fade level."""
+        sprite = self.sprites.get((kind, bucket))
+        if sprite is None:
+            color, size = self.kinds[kind]
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            sprite.fill((*color, min(255, bucket * (256 // self.ALPHA_BUCKETS) + 8)))
+            self.sprites[(kind, bucket)] = sprite
+        return sprite
 
     def draw(self, screen, camera_x, camera_y):
-        if self.life > 0:
-            alpha = int(255 * (self.life / self.max_life))
-            if self.treasure:
-                color = (255, 215, 0)
-                size = 5
-            elif self.sparkle:
-                color = (255, 255, 0)
-                size = 3
-            elif self.rock_chip:
-                color = (80, 80, 80)
-                size = 2
-            else:
-                color = (100, 100, 100)
-                size = 3
-            surf = pygame.Surface((size, size), pygame.SRCALPHA)
-            surf.fill((*color, alpha))
-            screen.blit(surf, (self.x - camera_x, self.y - camera_y))
+        """Blit every visible particle in one batched call."""
+        n = self.count
+        if not n:
+            return
+        shift = 8 - (self.ALPHA_BUCKETS - 1).bit_length()  # Alpha 0-255 down to a bucket index
+        if np is not None:
+            xs = (self.x[:n] - camera_x).tolist()
+            ys = (self.y[:n] - camera_y).tolist()
+            buckets = ((255 * self.life[:n] / self.max_life[:n]).astype(np.int32) >> shift).tolist()
+            kinds = self.kind[:n].tolist()
+        else:
+            xs = [x - camera_x for x in self.x[:n]]
+            ys = [y - camera_y for y in self.y[:n]]
+            buckets = [int(255 * life / max_life) >> shift for life, max_life in zip(self.life[:n], self.max_life[:n])]
+            kinds = self.kind[:n]
+        width, height = screen.get_size()
+        sprites = self.sprites
+        batch = []
+        for x, y, kind, bucket in zip(xs, ys, kinds, buckets):
+            if -8 < x < width and -8 < y < height:
+                sprite = sprites.get((kind, bucket)) or self.sprite(kind, bucket)
+                batch.append((sprite, (x, y)))
+        screen.blits(batch, doreturn=False)
+
+    @property
+    def rect(self):
+        """Bounding rect of all live particles in world pixels."""
+        n = self.count
+        if not n:
+            return pygame.Rect(0, 0, 0, 0)
+        if np is not None:
+            left, right = float(self.x[:n].min()), float(self.x[:n].max())
+            top, bottom = float(self.y[:n].min()), float(self.y[:n].max())
+        else:
+            left, right = min(self.x[:n]), max(self.x[:n])
+            top, bottom = min(self.y[:n]), max(self.y[:n])
+        return pygame.Rect(int(left), int(top), int(right - left) + 8, int(bottom - top) + 8)
 
 class OreItem:
-    def __init__(self, x, y, ore_type, value, ores_cfg, is_artifact=False, entity_id=None):
-        self.rect = pygame.Rect(x, y, TILE_SIZE // 2, TILE_SIZE // 2)
+    __slots__ = ("rect", "ore_type", "base_value", "color", "life", "vx", "vy", "is_artifact",
+                 "age", "collected", "collecting", "target_player", "collect_timer", "id")
+    ids = itertools.count(1)  # Local IDs stay unique even when pooled instances are reused
+    COLLECT_SPEED = 200  # Pixels per second for collection animation
+
+    def __init__(self):
+        """Initialize an inactive ore item; EntityPool activates it when spawned."""
+        self.rect = pygame.Rect(0, 0, TILE_SIZE // 2, TILE_SIZE // 2)
+        self.ore_type = "stone"
+        self.base_value = 0
+        self.color = (100, 100, 100)
+        self.life = 0.0
+        self.vx = 0.0
+        self.vy = 0.0
+        self.is_artifact = False
+        self.age = 0.0  # Simulated seconds since spawning; drives the pickup delay and the float, spin and pulse animations
+        self.collected = False  # Flag to prevent multiple collections
+        self.collecting = False  # Flag for animation toward player
+        self.target_player = None  # Player to move toward during collection
+        self.collect_timer = 0.5  # Duration of collection animation
+        self.id = None
+
+    def activate(self, x, y, ore_type, value, ores_cfg, is_artifact=False, entity_id=None):
+        """Reset the ore item as a freshly dropped ore at the specified position."""
+        self.rect.x, self.rect.y = x, y
         self.ore_type = ore_type
         self.base_value = value  # Base value from ores_cfg, no multipliers
         self.color = ores_cfg.get(ore_type, {'color': (100, 100, 100)})['color']
         self.life = 10.0
         self.vx = random.uniform(-50, 50)
         self.vy = random.uniform(-50, 50)
-        self.creation_time = time.time()
         self.is_artifact = is_artifact
-        self.float_timer = 0.0
-        self.rotation = 0.0
-        self.pulse_timer = 0.0
-        self.collected = False  # Flag to prevent multiple collections
-        self.collecting = False  # Flag for animation toward player
-        self.target_player = None  # Player to move toward during collection
-        self.collect_speed = 200  # Pixels per second for collection animation
-        self.collect_timer = 0.5  # Duration of collection animation
-        self.id = entity_id if entity_id else f"ore_{id(self)}"  # Use server-provided ID or local fallback
-        logger.debug(f"Spawned OreItem {self.id}: {ore_type} at ({x}, {y}), base_value=${value:.2f}")
+        self.age = 0.0
+        self.collected = False
+        self.collecting = False
+        self.target_player = None
+        self.collect_timer = 0.5
+        self.id = entity_id if entity_id else f"ore_{next(OreItem.ids)}"  # Use server-provided ID or local fallback
+        logger.debug("Spawned OreItem %s: %s at (%s, %s), base_value=$%.2f", self.id, ore_type, x, y, value)
 
     def update(self, dt, game):
         if self.collected:
-            logger.debug(f"OreItem {self.id} already collected, marking for removal")
+            logger.debug("OreItem %s already collected, marking for removal", self.id)
             return True, None  # Already collected, mark for removal
 
         if game.mode == "online_coop":
             # In online co-op, collection is handled by server via messages
             # Only update position for visual consistency
-            self.float_timer += dt
-            self.pulse_timer += dt
-            self.rotation += dt * 2
-            self.rect.y += math.sin(self.float_timer * 3) * 10 * dt
+            self.age += dt
+            self.rect.y += math.sin(self.age * 3) * 10 * dt
             if self.collecting and self.target_player:
                 dx = self.target_player.rect.centerx - self.rect.centerx
                 dy = self.target_player.rect.centery - self.rect.centery
                 distance = math.sqrt(dx**2 + dy**2)
                 if distance > 0:
-                    speed = self.collect_speed
+                    speed = self.COLLECT_SPEED
                     self.vx = (dx / distance) * speed
                     self.vy = (dy / distance) * speed
                     self.rect.x += self.vx * dt
@@ -96,7 +207,7 @@ class OreItem:
                 self.collect_timer -= dt
                 if distance < 10 or self.collect_timer <= 0:
                     self.collected = True  # Mark as collected, expect server to handle logic
-                    logger.debug(f"OreItem {self.id} reached target or timer expired in online_coop, marked collected")
+                    logger.debug("OreItem %s reached target or timer expired in online_coop, marked collected", self.id)
                     return True, self.target_player
             return False, None
 
@@ -107,7 +218,7 @@ class OreItem:
             dy = self.target_player.rect.centery - self.rect.centery
             distance = math.sqrt(dx**2 + dy**2)
             if distance > 0:
-                speed = self.collect_speed
+                speed = self.COLLECT_SPEED
                 self.vx = (dx / distance) * speed
                 self.vy = (dy / distance) * speed
                 self.rect.x += self.vx * dt
@@ -127,7 +238,7 @@ class OreItem:
                     self.collected = True
                     game.cash_earned_today += total_value
                     self.target_player.quota_buffer += total_value
-                    logger.debug(f"Collected OreItem {self.id}: {self.ore_type} into inventory, value_per_unit=${value_per_unit:.2f}, total_value=${total_value:.2f}, pos={ore_pos}")
+                    logger.debug("Collected OreItem %s: %s into inventory, value_per_unit=$%.2f, total_value=$%.2f, pos=%s", self.id, self.ore_type, value_per_unit, total_value, ore_pos)
                     return True, self.target_player
                 else:
                     self.target_player.cash += total_value
@@ -136,57 +247,52 @@ class OreItem:
                     if self.is_artifact:
                         self.target_player.artifacts = getattr(self.target_player, 'artifacts', 0) + 1
                     self.collected = True
-                    logger.debug(f"Inventory full for OreItem {self.id}, added ${total_value:.2f} to cash for {self.ore_type}, pos={ore_pos}")
+                    logger.debug("Inventory full for OreItem %s, added $%.2f to cash for %s, pos=%s", self.id, total_value, self.ore_type, ore_pos)
                     return True, self.target_player
             return False, None
 
         self.life -= dt
-        self.float_timer += dt
-        self.pulse_timer += dt
-        self.rotation += dt * 2
+        self.age += dt
         self.vy += 300 * dt  # Apply gravity
-        self.rect.y += math.sin(self.float_timer * 3) * 10 * dt
+        self.rect.y += math.sin(self.age * 3) * 10 * dt
         closest_player = None
-        min_distance = float('inf')
+        min_distance_sq = float('inf')
         for player in game.players:
             if player.ore_magnet:
                 dx = player.rect.centerx - self.rect.centerx
                 dy = player.rect.centery - self.rect.centery
-                distance = math.sqrt(dx**2 + dy**2)
-                if distance < min_distance:
-                    min_distance = distance
+                distance_sq = dx * dx + dy * dy
+                if distance_sq < min_distance_sq:
+                    min_distance_sq = distance_sq
                     closest_player = player
-        if closest_player and closest_player.ore_magnet:
+        if closest_player and min_distance_sq > 0:
             dx = closest_player.rect.centerx - self.rect.centerx
             dy = closest_player.rect.centery - self.rect.centery
-            distance = math.sqrt(dx**2 + dy**2)
-            if distance > 0:
-                speed = 100
-                self.vx += (dx / distance) * speed * dt
-                self.vy += (dy / distance) * speed * dt
+            distance = math.sqrt(min_distance_sq)  # Only the closest magnet needs a real distance
+            speed = 100
+            self.vx += (dx / distance) * speed * dt
+            self.vy += (dy / distance) * speed * dt
         self.rect.x += self.vx * dt
         self.rect.y += self.vy * dt
         # Check collision with world blocks
-        for block in game.world.get_surrounding_blocks(self.rect):
-            if self.rect.colliderect(block):
-                if self.vy > 0:  # Moving down
-                    self.rect.bottom = block.top
-                    self.vy = -self.vy * 0.5  # Bounce with reduced velocity
-                elif self.vy < 0:  # Moving up
-                    self.rect.top = block.bottom
-                    self.vy = -self.vy * 0.5
-                if self.vx > 0:  # Moving right
-                    self.rect.right = block.left
-                    self.vx = -self.vx * 0.5
-                elif self.vx < 0:  # Moving left
-                    self.rect.left = block.right
-                    self.vx = -self.vx * 0.5
+        for tx, ty in game.world.colliding_tiles(self.rect):
+            if self.vy > 0:  # Moving down
+                self.rect.bottom = ty * TILE_SIZE
+                self.vy = -self.vy * 0.5  # Bounce with reduced velocity
+            elif self.vy < 0:  # Moving up
+                self.rect.top = (ty + 1) * TILE_SIZE
+                self.vy = -self.vy * 0.5
+            if self.vx > 0:  # Moving right
+                self.rect.right = tx * TILE_SIZE
+                self.vx = -self.vx * 0.5
+            elif self.vx < 0:  # Moving left
+                self.rect.left = (tx + 1) * TILE_SIZE
+                self.vx = -self.vx * 0.5
         for player in game.players:
             dx = player.rect.centerx - self.rect.centerx
             dy = player.rect.centery - self.rect.centery
-            distance = math.sqrt(dx**2 + dy**2)
             pickup_range = 3 * TILE_SIZE * player.ore_pickup_range
-            if (self.life <= 0 or (time.time() - self.creation_time > 0.5 and distance <= pickup_range)) and not self.collecting:
+            if (self.life <= 0 or (self.age > 0.5 and dx * dx + dy * dy <= pickup_range * pickup_range)) and not self.collecting:
                 self.collecting = True
                 self.target_player = player
                 self.collect_timer = 0.5
@@ -197,11 +303,11 @@ class OreItem:
                             "ore_id": self.id,
                             "player_id": game.player_id
                         })))
-                        logger.debug(f"Sent collect_ore for OreItem {self.id} in online_coop")
+                        logger.debug("Sent collect_ore for OreItem %s in online_coop", self.id)
                     except Exception as e:
-                        logger.error(f"Failed to send collect_ore for OreItem {self.id}: {e}")
+                        logger.error("Failed to send collect_ore for OreItem %s: %s", self.id, e)
                 else:
-                    logger.debug(f"Started collection of OreItem {self.id} by player at ({player.rect.centerx}, {player.rect.centery})")
+                    logger.debug("Started collection of OreItem %s by player at (%s, %s)", self.id, player.rect.centerx, player.rect.centery)
         return False, None
 
     def draw(self, screen, camera_x, camera_y):
@@ -211,9 +317,9 @@ class OreItem:
             color = (255, 215, 0) if self.is_artifact else self.color
             size = TILE_SIZE if self.is_artifact else TILE_SIZE // 2
             surf = pygame.Surface((size, size), pygame.SRCALPHA)
-            scale = 1.0 + 0.2 * math.sin(self.rotation)
+            scale = 1.0 + 0.2 * math.sin(self.age * 2)
             scaled_size = int(size * scale)
-            alpha = 255 if not self.is_artifact else int(200 + 55 * math.sin(self.pulse_timer * 4))
+            alpha = 255 if not self.is_artifact else int(200 + 55 * math.sin(self.age * 4))
             scaled_surf = pygame.transform.scale(surf, (scaled_size, scaled_size))
             scaled_surf.fill((*color, alpha))
             if self.is_artifact or self.ore_type in ["ruby", "sapphire", "emerald", "mithril"]:
@@ -221,13 +327,15 @@ class OreItem:
             screen.blit(scaled_surf, (self.rect.x - camera_x - (scaled_size - size) // 2, self.rect.y - camera_y - (scaled_size - size) // 2))
 
 class FallingRock:
+    __slots__ = ("rect", "vy", "block_type", "warning_timer", "active")
+
     def __init__(self, x, y, velocity, block_type):
         self.rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
         self.vy = velocity
         self.block_type = block_type
         self.warning_timer = 2.0
         self.active = False
-        logger.debug(f"FallingRock spawned at ({x}, {y}) with type {block_type}")
+        logger.debug("FallingRock spawned at (%s, %s) with type %s", x, y, block_type)
 
     def update(self, dt, game):
         if self.warning_timer > 0:
@@ -237,22 +345,21 @@ class FallingRock:
         if not self.active:
             return
         self.rect.y += self.vy * dt
-        for block in game.world.get_surrounding_blocks(self.rect):
-            if self.rect.colliderect(block):
-                self.vy = 0
-                self.rect.bottom = block.top
-                logger.debug(f"FallingRock stopped at ({self.rect.x}, {self.rect.y})")
-                return
+        for tx, ty in game.world.colliding_tiles(self.rect):
+            self.vy = 0
+            self.rect.bottom = ty * TILE_SIZE
+            logger.debug("FallingRock stopped at (%s, %s)", self.rect.x, self.rect.y)
+            return
         for player in game.players:
             if self.rect.colliderect(player.rect):
                 damage = 10 * (1.0 - player.rock_damage_reduction)
                 player.health -= damage
                 self.vy = 0
-                logger.debug(f"FallingRock hit player at ({self.rect.x}, {self.rect.y}), dealt {damage} damage")
+                logger.debug("FallingRock hit player at (%s, %s), dealt %s damage", self.rect.x, self.rect.y, damage)
                 return
         if self.rect.y > game.world.get_surface_y(self.rect.x // TILE_SIZE) * TILE_SIZE + 1000:
             self.vy = 0
-            logger.debug(f"FallingRock despawned at ({self.rect.x}, {self.rect.y})")
+            logger.debug("FallingRock despawned at (%s, %s)", self.rect.x, self.rect.y)
 
     def draw(self, screen, camera_x, camera_y):
         if self.warning_timer > 0:
@@ -265,12 +372,22 @@ class FallingRock:
             pygame.draw.rect(screen, color, (self.rect.x - camera_x, self.rect.y - camera_y, TILE_SIZE, TILE_SIZE))
 
 class Explosion:
-    def __init__(self, x, y, radius):
+    __slots__ = ("x", "y", "radius", "timer")
+
+    def __init__(self):
+        """Initialize an inactive explosion; EntityPool activates it when spawned."""
+        self.x = 0
+        self.y = 0
+        self.radius = 0
+        self.timer = 0.0
+
+    def activate(self, x, y, radius):
+        """Start the explosion at the specified position."""
         self.x = x
         self.y = y
         self.radius = radius
         self.timer = 0.5
-        logger.debug(f"Explosion created at ({x}, {y}) with radius {radius}")
+        logger.debug("Explosion created at (%s, %s) with radius %s", x, y, radius)
 
     def update(self, dt, game):
         self.timer -= dt
@@ -305,7 +422,7 @@ class OreScanner:
                     block = self.world.block_at(x, y)
                     if block in ["ruby", "sapphire", "emerald", "mithril"]:
                         self.ores.append((x, y))
-        logger.debug(f"OreScanner activated, found {len(self.ores)} valuable ores")
+        logger.debug("OreScanner activated, found %s valuable ores", len(self.ores))
 
     def update(self, current_time):
         if self.active:
@@ -322,6 +439,8 @@ class OreScanner:
                 screen.blit(surf, (x * TILE_SIZE - camera_x, y * TILE_SIZE - camera_y))
 
 class Enemy:
+    __slots__ = ("rect", "type", "vx", "vy", "health", "active", "dropped_items", "stolen_cash")
+
     def __init__(self, x, y, enemy_type):
         self.rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
         self.type = enemy_type
@@ -331,18 +450,17 @@ class Enemy:
         self.active = True
         self.dropped_items = []
         self.stolen_cash = 0
-        logger.debug(f"Enemy {enemy_type} spawned at ({x}, {y})")
+        logger.debug("Enemy %s spawned at (%s, %s)", enemy_type, x, y)
 
     def update(self, dt, game):
         if not self.active:
             return
         self.rect.x += self.vx * dt
         self.rect.y += self.vy * dt
-        for block in game.world.get_surrounding_blocks(self.rect):
-            if self.rect.colliderect(block):
-                self.vx *= -1
-                self.rect.x += self.vx * dt
-                break
+        for tx, ty in game.world.colliding_tiles(self.rect):
+            self.vx *= -1
+            self.rect.x += self.vx * dt
+            break
         for player in game.players:
             if self.rect.colliderect(player.rect) and not player.active_effects.get("shield_generator", {}).get("active", False):
                 player.health -= 5
@@ -352,16 +470,16 @@ class Enemy:
                     stolen = player.cash * 0.05
                     player.cash = max(0, player.cash - stolen)
                     self.stolen_cash += stolen
-                    logger.debug(f"{self.type} stole ${stolen:.2f} from player")
+                    logger.debug("%s stole $%.2f from player", self.type, stolen)
                 self.vx *= -1
-                logger.debug(f"{self.type} hit player at ({self.rect.x}, {self.rect.y}), dropped: {dropped}")
+                logger.debug("%s hit player at (%s, %s), dropped: %s", self.type, self.rect.x, self.rect.y, dropped)
         if self.health <= 0:
             self.active = False
             drop_key = "bat_drop" if self.type == "bat" else "goblin_drop"
             for drop in ENEMY_DROPS.get(drop_key, []):
                 if random.random() < drop["chance"]:
-                    game.entity_manager.add(OreItem(self.rect.x, self.rect.y, drop["ore_type"], drop["value"], game.ores_cfg), "ore_items")
-            logger.debug(f"{self.type} defeated at ({self.rect.x}, {self.rect.y})")
+                    game.entity_manager.spawn("ore_items", self.rect.x, self.rect.y, drop["ore_type"], drop["value"], game.ores_cfg)
+            logger.debug("%s defeated at (%s, %s)", self.type, self.rect.x, self.rect.y)
 
     def draw(self, screen, camera_x, camera_y):
         if self.active:
@@ -370,95 +488,235 @@ class Enemy:
             pygame.draw.rect(screen, color, (self.rect.x - camera_x, self.rect.y - camera_y, TILE_SIZE, TILE_SIZE))
 
 class BlasterShot:
-    def __init__(self, x, y, vx, vy):
-        self.rect = pygame.Rect(x, y, TILE_SIZE // 4, TILE_SIZE // 4)
+    __slots__ = ("rect", "vx", "vy", "life")
+
+    def __init__(self):
+        """Initialize an inactive shot; EntityPool activates it when spawned."""
+        self.rect = pygame.Rect(0, 0, TILE_SIZE // 4, TILE_SIZE // 4)
+        self.vx = 0
+        self.vy = 0
+        self.life = 0.0
+
+    def activate(self, x, y, vx, vy):
+        """Fire the shot from the specified position with the given velocity."""
+        self.rect.x, self.rect.y = x, y
         self.vx = vx
         self.vy = vy
         self.life = 2.0
-        logger.debug(f"BlasterShot spawned at ({x}, {y}) with velocity ({vx}, {vy})")
+        logger.debug("BlasterShot spawned at (%s, %s) with velocity (%s, %s)", x, y, vx, vy)
 
     def update(self, dt, game):
         self.rect.x += self.vx * dt
         self.rect.y += self.vy * dt
         self.life -= dt
-        for enemy in game.entity_manager.entities["enemies"]:
+        for enemy in game.entity_manager.candidates("enemies", self.rect.centerx, self.rect.centery, TILE_SIZE):
             if self.rect.colliderect(enemy.rect):
                 enemy.health -= 5
                 self.life = 0
-                logger.debug(f"BlasterShot hit enemy at ({self.rect.x}, {self.rect.y})")
-                return
-        for block in game.world.get_surrounding_blocks(self.rect):
-            if self.rect.colliderect(block):
-                self.life = 0
-                logger.debug(f"BlasterShot hit block at ({self.rect.x}, {self.rect.y})")
+                logger.debug("BlasterShot hit enemy at (%s, %s)", self.rect.x, self.rect.y)
                 return
+        for tx, ty in game.world.colliding_tiles(self.rect):
+            self.life = 0
+            logger.debug("BlasterShot hit block at (%s, %s)", self.rect.x, self.rect.y)
+            return
 
     def draw(self, screen, camera_x, camera_y):
         if self.life > 0:
             pygame.draw.rect(screen, (255, 0, 0), (self.rect.x - camera_x, self.rect.y - camera_y, self.rect.width, self.rect.height))
 
+def update_ore_item(ore, dt, game):
+    """Step an ore item; return whether it stays in play."""
+    remove, player = ore.update(dt, game)
+    return not remove
+
+def update_explosion(explosion, dt, game):
+    """Step an explosion; return whether it is still fading out."""
+    return not explosion.update(dt, game)
+
+def update_blaster_shot(shot, dt, game):
+    """Step a blaster shot; return whether it is still flying."""
+    shot.update(dt, game)
+    return shot.life > 0
+
+def update_enemy(enemy, dt, game):
+    """Step an enemy; return whether it is still alive."""
+    enemy.update(dt, game)
+    return enemy.active
+
+def update_rock(rock, dt, game):
+    """Step a falling rock; return whether it is still warning or falling."""
+    rock.update(dt, game)
+    return rock.warning_timer > 0 or rock.vy != 0
+
+def update_particles(particles, dt, game):
+    """Step the ParticleSystem, which drops expired particles itself and always stays."""
+    particles.update(dt, game)
+    return True
+
+ENTITY_UPDATERS = {
+    "rocks": update_rock,
+    "explosions": update_explosion,
+    "ore_items": update_ore_item,
+    "particles": update_particles,
+    "enemies": update_enemy,
+    "blaster_shots": update_blaster_shot
+}  # Category: update function returning whether the entity stays
+
+class SpatialHash:
+    """Uniform grid bucketing entities by the cell under their rect center, for proximity queries."""
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y): entities whose center was in that cell
+        self.cell_of = {}  # Entity: its cell key
+
+    def insert(self, entity):
+        """Bucket an entity by its current rect center."""
+        key = (entity.rect.centerx // self.cell_size, entity.rect.centery // self.cell_size)
+        self.cells.setdefault(key, []).append(entity)
+        self.cell_of[entity] = key
+
+    def remove(self, entity):
+        """Drop an entity from its bucket, if it is hashed."""
+        key = self.cell_of.pop(entity, None)
+        if key is not None:
+            self.cells[key].remove(entity)
+
+    def rebuild(self, entities):
+        """Re-bucket every entity at its current position."""
+        self.cells = {}
+        self.cell_of = {}
+        for entity in entities:
+            self.insert(entity)
+
+    def candidates(self, x, y, reach):
+        """Yield entities bucketed in cells within reach of (x, y); callers do the exact test."""
+        size = self.cell_size
+        cells = self.cells
+        # One cell of slack covers entities that moved across a cell edge since the last rebuild
+        for cell_x in range(int(x - reach) // size - 1, int(x + reach) // size + 2):
+            for cell_y in range(int(y - reach) // size - 1, int(y + reach) // size + 2):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    yield from bucket
+
+    def within(self, x, y, radius):
+        """Yield entities whose rect center lies within radius of (x, y), compared squared."""
+        radius_sq = radius * radius
+        for entity in self.candidates(x, y, radius):
+            dx = entity.rect.centerx - x
+            dy = entity.rect.centery - y
+            if dx * dx + dy * dy <= radius_sq:
+                yield entity
+
+class EntityPool:
+    """Free list of inactive entities of one class, reused instead of reallocated."""
+    def __init__(self, entity_class):
+        self.entity_class = entity_class
+        self.free = []
+
+    def acquire(self, *args, **kwargs):
+        """Get an entity from the free list, or allocate one if it is empty, and activate it."""
+        entity = self.free.pop() if self.free else self.entity_class()
+        entity.activate(*args, **kwargs)
+        return entity
+
+    def release(self, entity):
+        """Return an entity to the free list once it has been removed from play."""
+        self.free.append(entity)
+
 class EntityManager:
     def __init__(self):
         self.entities = {
             "rocks": [],
             "explosions": [],
             "ore_items": [],
-            "particles": [],
+            "particles": [],  # Holds the single ParticleSystem
             "enemies": [],
             "blaster_shots": []
         }
+        self.pools = {
+            "explosions": EntityPool(Explosion),
+            "ore_items": EntityPool(OreItem),
+            "blaster_shots": EntityPool(BlasterShot)
+        }
+        self.grids = {
+            "ore_items": SpatialHash(),
+            "enemies": SpatialHash()
+        }  # Proximity index for the categories that pickup, magnet, blaster and melee checks query
+        self.particles = ParticleSystem()
+        self.entities["particles"].append(self.particles)
         logger.info("EntityManager initialized")
 
     def add(self, entity, category):
         """Add an entity to the specified category."""
         if category not in self.entities:
-            logger.error(f"Invalid entity category: {category}")
+            logger.error("Invalid entity category: %s", category)
             return
         self.entities[category].append(entity)
-        logger.debug(f"Added {type(entity).__name__} to {category}, total {category}: {len(self.entities[category])}")
+        if category in self.grids:
+            self.grids[category].insert(entity)
+        logger.debug("Added %s to %s, total %s: %s", type(entity).__name__, category, category, len(self.entities[category]))
+
+    def spawn(self, category, *args, **kwargs):
+        """Activate a pooled entity with the given arguments and add it to a pooled category."""
+        entity = self.pools[category].acquire(*args, **kwargs)
+        self.entities[category].append(entity)
+        if category in self.grids:
+            self.grids[category].insert(entity)
+        return entity
+
+    def remove_at(self, category, index):
+        """Remove the entity at index by swapping the last entity into its slot, returning pooled entities to their pool."""
+        group = self.entities[category]
+        entity = group[index]
+        last = group.pop()
+        if index < len(group):
+            group[index] = last
+        if category in self.grids:
+            self.grids[category].remove(entity)
+        pool = self.pools.get(category)
+        if pool is not None:
+            pool.release(entity)
+        return entity
 
     def update(self, dt, game):
-        """Update all entities and handle removals."""
-        for category in self.entities:
-            logger.debug(f"Updating {category}, count before: {len(self.entities[category])}")
-            entities_to_remove = set()  # Use set to avoid duplicates
-            for entity in self.entities[category][:]:  # Iterate over copy
-                if hasattr(entity, "update"):
-                    if category == "ore_items":
-                        remove, player = entity.update(dt, game)
-                        if remove:
-                            entities_to_remove.add(entity)
-                    elif category == "explosions":
-                        if entity.update(dt, game):
-                            entities_to_remove.add(entity)
-                    else:
-                        entity.update(dt, game)
-                        if hasattr(entity, "active") and not entity.active:
-                            entities_to_remove.add(entity)
-                        elif hasattr(entity, "life") and entity.life <= 0:
-                            entities_to_remove.add(entity)
-            # Remove entities immediately
-            for entity in entities_to_remove:
-                if entity in self.entities[category]:
-                    self.entities[category].remove(entity)
-                    logger.debug(f"Removed {type(entity).__name__} (id: {getattr(entity, 'id', 'N/A')}) from {category}")
-                else:
-                    logger.warning(f"Attempted to remove {type(entity).__name__} (id: {getattr(entity, 'id', 'N/A')}) from {category}, but it was already removed")
-            logger.debug(f"Updated {category}, count after: {len(self.entities[category])}")
+        """Step every entity exactly once, compacting each category in place and pooling the removed ones."""
+        for category, step in ENTITY_UPDATERS.items():
+            group = self.entities[category]
+            pool = self.pools.get(category)
+            count = len(group)  # Entities spawned during this pass wait until the next tick
+            kept = 0
+            for i in range(count):
+                entity = group[i]
+                if step(entity, dt, game):
+                    group[kept] = entity
+                    kept += 1
+                elif pool is not None:
+                    pool.release(entity)
+            del group[kept:count]
+        for category, grid in self.grids.items():
+            grid.rebuild(self.entities[category])
+
+    def nearby(self, category, x, y, radius):
+        """Yield entities of a hashed category whose center lies within radius of (x, y)."""
+        return self.grids[category].within(x, y, radius)
+
+    def candidates(self, category, x, y, reach):
+        """Yield entities of a hashed category that may lie within reach of (x, y), for a caller-side exact test."""
+        return self.grids[category].candidates(x, y, reach)
 
     def draw(self, screen, camera_x, camera_y):
         """Draw all entities using their respective draw methods."""
         for category in self.entities:
             for entity in self.entities[category]:
                 entity.draw(screen, camera_x, camera_y)
-        logger.debug("All entities drawn")
 
     def remove_ore(self, ore_id):
         """Remove an ore item by its ID, typically called for server-driven collection."""
-        for ore in self.entities["ore_items"]:
+        for i, ore in enumerate(self.entities["ore_items"]):
             if ore.id == ore_id:
                 ore.collected = True
-                self.entities["ore_items"].remove(ore)
-                logger.debug(f"Removed OreItem {ore_id} via remove_ore")
+                self.remove_at("ore_items", i)
+                logger.debug("Removed OreItem %s via remove_ore", ore_id)
                 return
-        logger.warning(f"OreItem {ore_id} not found for removal")
\ No newline at end of file
+        logger.warning("OreItem %s not found for removal", ore_id)
@@ -1,14 +1,10 @@
 import pygame
-import logging
 from settings import TILE_SIZE, KEYS
 from utils import spawn_particles, trigger_screen_shake, trigger_screen_flash, aoe_mining
+from log_config import get_logger
 
 # Configure logging (Pyodide-compatible)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 logger.info("Initializing event_handler.py")
 
 class EventHandler:
@@ -19,7 +15,7 @@ class EventHandler:
     def process_events(self):
         """Process all Pygame events and delegate to appropriate game methods."""
         for event in pygame.event.get():
-            logger.debug(f"Processing event: type={event.type}, key={getattr(event, 'key', 'N/A')}, unicode={getattr(event, 'unicode', 'N/A')}")
+            logger.debug("Processing event: type=%s, key=%s, unicode=%s", event.type, getattr(event, 'key', 'N/A'), getattr(event, 'unicode', 'N/A'))
             if event.type == pygame.QUIT:
                 self.game.save_and_quit()
                 logger.info("Quit event triggered")
@@ -29,7 +25,7 @@ class EventHandler:
                             self.game.ui.show_upgrade_menu, self.game.ui.game_over,
                             self.game.ui.show_post_day_upgrades, self.game.ui.show_inventory]):
                     self.game.handle_mining(event.pos)
-                    logger.debug(f"Mouse button down at {event.pos}")
+                    logger.debug("Mouse button down at %s", event.pos)
             elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
                 self.game.stop_mining()
                 logger.debug("Mouse button up, stopped mining")
@@ -54,7 +50,7 @@ class EventHandler:
             if action == "start":
                 if self.game.mode != "online_coop":
                     self.game.state_manager.set_state("playing", self.game)
-                    logger.info(f"Started game in {self.game.mode} mode")
+                    logger.info("Started game in %s mode", self.game.mode)
             return
         if self.game.ui.show_lobby_menu:
             self.game.ui.handle_lobby_input(event, self.game)
@@ -89,31 +85,31 @@ class EventHandler:
                 self.game.ui.menu_mode = "shop" if self.game.ui.menu_mode == "pickaxes" else "pickaxes"
                 self.game.ui.selected_upgrade = 0
                 self.game.ui.shop_offset = 0
-                logger.info(f"Switched to {self.game.ui.menu_mode} menu")
+                logger.info("Switched to %s menu", self.game.ui.menu_mode)
             elif event.key == pygame.K_UP:
                 if self.game.ui.menu_mode == "pickaxes":
                     if self.game.upgrades_cfg.get("pickaxes", []):
                         self.game.ui.selected_upgrade = max(0, self.game.ui.selected_upgrade - 1)
-                        logger.debug(f"Selected pickaxe index: {self.game.ui.selected_upgrade}")
+                        logger.debug("Selected pickaxe index: %s", self.game.ui.selected_upgrade)
                 else:
                     shop_items = self.game.upgrades_cfg.get("shop", [])
                     if shop_items:
                         self.game.ui.selected_upgrade = max(0, self.game.ui.selected_upgrade - 1)
                         if self.game.ui.selected_upgrade < self.game.ui.shop_offset:
                             self.game.ui.shop_offset = max(0, self.game.ui.shop_offset - 1)
-                        logger.debug(f"Selected shop item index: {self.game.ui.selected_upgrade}, offset: {self.game.ui.shop_offset}")
+                        logger.debug("Selected shop item index: %s, offset: %s", self.game.ui.selected_upgrade, self.game.ui.shop_offset)
             elif event.key == pygame.K_DOWN:
                 if self.game.ui.menu_mode == "pickaxes":
                     if self.game.upgrades_cfg.get("pickaxes", []):
                         self.game.ui.selected_upgrade = min(len(self.game.upgrades_cfg["pickaxes"]) - 1, self.game.ui.selected_upgrade + 1)
-                        logger.debug(f"Selected pickaxe index: {self.game.ui.selected_upgrade}")
+                        logger.debug("Selected pickaxe index: %s", self.game.ui.selected_upgrade)
                 else:
                     shop_items = self.game.upgrades_cfg.get("shop", [])
                     if shop_items:
                         self.game.ui.selected_upgrade = min(len(shop_items) - 1, self.game.ui.selected_upgrade + 1)
                         if self.game.ui.selected_upgrade >= self.game.ui.shop_offset + 8:
                             self.game.ui.shop_offset = min(len(shop_items) - 8, self.game.ui.shop_offset + 1)
-                        logger.debug(f"Selected shop item index: {self.game.ui.selected_upgrade}, offset: {self.game.ui.shop_offset}")
+                        logger.debug("Selected shop item index: %s, offset: %s", self.game.ui.selected_upgrade, self.game.ui.shop_offset)
             elif event.key == pygame.K_RETURN:
                 self.game.purchase_upgrade()
                 logger.debug("Attempted to purchase upgrade")
@@ -125,11 +121,11 @@ class EventHandler:
             elif event.key == pygame.K_UP:
                 item_list = list(self.game.players[0].inventory.items())
                 self.game.ui.selected_item = max(0, self.game.ui.selected_item - 1)
-                logger.debug(f"Selected inventory item index: {self.game.ui.selected_item}")
+                logger.debug("Selected inventory item index: %s", self.game.ui.selected_item)
             elif event.key == pygame.K_DOWN:
                 item_list = list(self.game.players[0].inventory.items())
                 self.game.ui.selected_item = min(len(item_list) - 1, self.game.ui.selected_item + 1) if item_list else 0
-                logger.debug(f"Selected inventory item index: {self.game.ui.selected_item}")
+                logger.debug("Selected inventory item index: %s", self.game.ui.selected_item)
             elif event.key == pygame.K_RETURN:
                 self.game.use_inventory_item()
                 logger.debug("Used selected inventory item")
@@ -141,19 +137,19 @@ class EventHandler:
             logger.debug("Toggled pause menu")
         elif event.key == KEYS.get("UPGRADE", pygame.K_u) and not any([self.game.ui.show_post_day_upgrades, self.game.ui.show_inventory]):
             self.game.toggle_upgrade_menu()
-            logger.info(f"{'Opened' if self.game.ui.show_upgrade_menu else 'Closed'} upgrade menu")
+            logger.info("%s upgrade menu", 'Opened' if self.game.ui.show_upgrade_menu else 'Closed')
         elif event.key == KEYS.get("INVENTORY", pygame.K_i) and not any([self.game.ui.show_post_day_upgrades, self.game.ui.show_upgrade_menu]):
             self.game.toggle_inventory_menu()
-            logger.info(f"{'Opened' if self.game.ui.show_inventory else 'Closed'} inventory menu")
+            logger.info("%s inventory menu", 'Opened' if self.game.ui.show_inventory else 'Closed')
         elif event.key == KEYS.get("DEBUG", pygame.K_F1):
             self.game.show_debug = not self.game.show_debug
-            logger.info(f"Debug overlay {'enabled' if self.game.show_debug else 'disabled'}")
+            logger.info("Debug overlay %s", 'enabled' if self.game.show_debug else 'disabled')
         elif event.key == KEYS.get("MINIMAP", pygame.K_m):
             self.game.show_minimap = not self.game.show_minimap
-            logger.info(f"Minimap {'shown' if self.game.show_minimap else 'hidden'}")
+            logger.info("Minimap %s", 'shown' if self.game.show_minimap else 'hidden')
         elif event.key == KEYS.get("SECOND_PLAYER", pygame.K_2):
             self.game.toggle_second_player()
-            logger.info(f"{'Added' if len(self.game.players) > 1 else 'Removed'} second player")
+            logger.info("%s second player", 'Added' if len(self.game.players) > 1 else 'Removed')
         elif event.key == KEYS.get("LEFT", pygame.K_LEFT):
             self.game.players[0].target_vx = -self.game.move_speed
             logger.debug("Player 1 moving left")
@@ -166,7 +162,7 @@ class EventHandler:
             self.game.players[0].coyote_timer = 0.0
             logger.debug("Player 1 jumped")
         elif event.key == KEYS.get("THROW", pygame.K_t):
-            self.game.players[0].throw_item(self.game, self.game.ore_items)
+            self.game.players[0].throw_item(self.game)
             if self.game.drop_sound:
                 self.game.drop_sound.play()
             logger.info("Player 1 threw item")
@@ -182,7 +178,7 @@ class EventHandler:
             self.game.players[1].coyote_timer = 0.0
             logger.debug("Player 2 jumped")
         elif event.key == KEYS.get("P2_THROW", pygame.K_g) and len(self.game.players) > 1:
-            self.game.players[1].throw_item(self.game, self.game.ore_items)
+            self.game.players[1].throw_item(self.game)
             if self.game.drop_sound:
                 self.game.drop_sound.play()
             logger.info("Player 2 threw item")
@@ -207,7 +203,7 @@ class EventHandler:
                         self.game.cash_earned_today += total_value
                         self.game.ore_collect_notification = f"Dropped off ore: ${total_value:.2f}"
                         self.game.notification_timer = 2.0
-                        logger.info(f"Player dropped off ores for ${total_value:.2f}")
+                        logger.info("Player dropped off ores for $%.2f", total_value)
         elif event.key == KEYS.get("MELEE", pygame.K_SPACE) and not any([self.game.ui.show_upgrade_menu, self.game.ui.show_post_day_upgrades, self.game.ui.show_inventory]) and self.game.players[0].melee_upgrade:
             self.game.use_melee()
             logger.debug("Player 1 used melee attack")
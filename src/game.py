@@ -1,7 +1,6 @@
 import asyncio
 import pygame
 import platform
-import logging
 import random
 import math
 import time
@@ -10,24 +9,25 @@ import settings
 from event_handler import EventHandler
 from renderer import Renderer
 from state_manager import StateManager
-from entities import EntityManager, OreScanner, OreItem, BlasterShot, Explosion, Enemy
-from utils import load_sound, calculate_distance, trigger_screen_shake, trigger_screen_flash, spawn_ore_item, spawn_particles, aoe_mining
+from entities import EntityManager, OreScanner, Enemy
+from utils import load_sound, calculate_distance, trigger_screen_shake, trigger_screen_flash, spawn_ore_item, spawn_particles, aoe_mining, square_tiles, column_tiles
 from world import World
 from player import Player
 from ui import UI
+from profiler import FrameProfiler
+from clock import GameClock
 from data import load_ores, load_upgrades
 from save_load import load_game, save_game
+from log_config import get_logger
 
 # Configure logging (Pyodide-compatible)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 logger.info("Initializing game.py")
 
 class Game:
     class RemotePlayer:
+        __slots__ = ("player_id", "x", "y", "health", "rect")
+
         def __init__(self, player_id, x, y, health):
             self.player_id = player_id
             self.x = x
@@ -42,8 +42,8 @@ class Game:
             self.rect.x = x
             self.rect.y = y
 
-    def __init__(self, upgrades_cfg, ores_cfg):
-        """Initialize the game with configurations and core components."""
+    def __init__(self, upgrades_cfg, ores_cfg, load_save=True):
+        """Initialize the game with configurations and core components, resuming the save file unless load_save is False."""
         logger.info("Initializing Game")
         pygame.init()
         pygame.mixer.init()
@@ -54,7 +54,8 @@ class Game:
         self.state_manager = StateManager()
         self.entity_manager = EntityManager()
         self.world = World()
-        self.players = [Player(upgrades_cfg, self.world)]
+        self.clock = GameClock(scale=settings.TIME_SCALE)  # Simulation time; only advances while the game is being played
+        self.players = [Player(upgrades_cfg, self.world, self.clock)]
         self.remote_players = {}  # Dictionary to store remote players
         self.ore_scanner = OreScanner(self.players[0], self.world)
         self.ui = UI(pygame.font.SysFont(settings.FONT_NAME, settings.FONT_SIZE))
@@ -77,19 +78,21 @@ class Game:
         self.running = True
         self.shake_timer = 0.0
         self.shake_intensity = 0
-        self.last_sound_time = time.time()
+        self.last_sound_time = self.clock.now()
         self.debug_message = None
         self.debug_message_timer = 0.0
         self.flash_timer = 0.0
         self.flash_color = settings.WHITE
         self.show_debug = False
+        self.read_keys = pygame.key.get_pressed  # Swapped for scripted input in headless runs
+        self.profiler = FrameProfiler()
         self.show_minimap = False
         self.pulse_timer = 0.0
         self.landed = False
         self.day = 1
         self.quota = settings.QUOTA_BASE
         self.cash_earned_today = 0
-        self.day_start_time = time.time()
+        self.day_start_time = self.clock.now()
         self.time_left = settings.DAY_DURATION
         self.grace_period = False
         self.bonus_multiplier = 1.0
@@ -99,7 +102,7 @@ class Game:
         self.treasure_notification_timer = 0.0
         self.lava_hazard_active = False
         self.lava_damage_timer = 0.0
-        self.auto_mined_blocks = []
+        self.auto_mined_blocks = set()
         self.inventory_full_notification = None
         self.inventory_full_timer = 0.0
         self.ore_collect_notification = None
@@ -123,7 +126,7 @@ class Game:
         self.lobby_code = None
         self.mode = None  # Initialize as None until selected
         self.message_queue = []
-        self.last_position_send_time = time.time()
+        self.last_position_send_time = self.clock.now()
         self.position_send_interval = 0.1
         # Load background music
         try:
@@ -132,7 +135,7 @@ class Game:
             pygame.mixer.music.play(-1)
             logger.info("Background music loaded and started")
         except pygame.error as e:
-            logger.error(f"Failed to load background music: {e}")
+            logger.error("Failed to load background music: %s", e)
         # Load sounds
         self.mining_sound = load_sound("mining.wav")
         self.item_sound = load_sound("item_use.wav", "mining.wav")
@@ -147,11 +150,13 @@ class Game:
         self.inventory_full_sound = load_sound("item_use.wav", "mining.wav")
         self.ore_collect_sound = load_sound("item_use.wav", "mining.wav")
         self.fatigue_sound = load_sound("item_use.wav", "mining.wav")
-        loaded = load_game(self.players[0], self.upgrades_cfg)
+        loaded = load_game(self.players[0], self.upgrades_cfg) if load_save else (None,)
         if loaded[0] is not None:
-            self.world.block_cols, self.day, self.quota, self.cash_earned_today, self.time_left = loaded
-            self.world.load_from_block_cols(self.world.block_cols)
-            self.day_start_time = time.time() - (settings.DAY_DURATION + self.players[0].day_extension - self.time_left)
+            block_edits, world_seed, self.day, self.quota, self.cash_earned_today, self.time_left = loaded
+            if world_seed is not None:
+                self.world.set_seed(world_seed)
+            self.world.load_from_block_cols(block_edits)
+            self.day_start_time = self.clock.now() - (settings.DAY_DURATION + self.players[0].day_extension - self.time_left)
             self.mining = False
             self.mine_target = None
             self.mining_progress = 0.0
@@ -172,14 +177,21 @@ class Game:
         """Send request to join a lobby with the given code."""
         if self.websocket and self.mode == "online_coop":
             self.send_message({"action": "join_lobby", "lobby_code": lobby_code.upper()})
-            logger.info(f"Attempting to join lobby {lobby_code}")
+            logger.info("Attempting to join lobby %s", lobby_code)
         else:
             self.ui.lobby_message = "Cannot join lobby: Not in online mode"
             self.ui.lobby_message_timer = 2.0
             logger.warning("Lobby join failed: Not in online mode or no websocket")
 
     def send_message(self, message):
-        """Queue a message to be sent to the server."""
+        """Queue a message to be sent to the server, or apply block mining locally when playing without one."""
+        if self.mode != "online_coop":
+            if message["action"] == "mine_block":
+                self.world.break_block(message["block_x"], message["block_y"], self.players[0], self)
+                return
+            if message["action"] == "mine_region":
+                self.world.break_region(message["tiles"], self)
+                return
         self.message_queue.append(message)
 
     def update_remote_player(self, player_id, x, y, health):
@@ -200,13 +212,12 @@ class Game:
         """Remove a remote player."""
         if player_id in self.remote_players:
             del self.remote_players[player_id]
-            logger.info(f"Removed remote player {player_id}")
+            logger.info("Removed remote player %s", player_id)
 
     def handle_spawn_entity(self, entity_id, entity_data):
         """Handle spawning of entities from server."""
         if entity_data["type"] == "ore":
-            ore = OreItem(entity_data["x"], entity_data["y"], entity_data["ore_type"], entity_data["value"], self.ores_cfg, entity_id=entity_id)
-            self.entity_manager.add(ore, "ore_items")
+            self.entity_manager.spawn("ore_items", entity_data["x"], entity_data["y"], entity_data["ore_type"], entity_data["value"], self.ores_cfg, entity_id=entity_id)
 
     def remove_ore(self, ore_id):
         """Remove an ore item by ID."""
@@ -225,7 +236,7 @@ class Game:
         for i, slot in enumerate(player.ore_slots):
             if slot is None:
                 player.ore_slots[i] = {'type': ore_type, 'count': count, 'value_per_unit': base_value}
-                logger.debug(f"Added {count} {ore_type} to slot {i}, value_per_unit=${base_value:.2f}, pos={ore_pos}")
+                logger.debug("Added %s %s to slot %s, value_per_unit=$%.2f, pos=%s", count, ore_type, i, base_value, ore_pos)
                 self.ore_collect_notification = f"Collected {count} {ore_type}"
                 self.ore_collect_timer = 2.0
                 if self.ore_collect_sound:
@@ -233,7 +244,7 @@ class Game:
                 return True
             elif slot['type'] == ore_type and abs(slot['value_per_unit'] - base_value) < 0.01 and slot['count'] < 64:
                 slot['count'] += count
-                logger.debug(f"Added {count} {ore_type} to existing slot {i}, new count={slot['count']}, value_per_unit=${base_value:.2f}, pos={ore_pos}")
+                logger.debug("Added %s %s to existing slot %s, new count=%s, value_per_unit=$%.2f, pos=%s", count, ore_type, i, slot['count'], base_value, ore_pos)
                 self.ore_collect_notification = f"Collected {count} {ore_type}"
                 self.ore_collect_timer = 2.0
                 if self.ore_collect_sound:
@@ -243,7 +254,7 @@ class Game:
         self.inventory_full_timer = 3.0
         if self.inventory_full_sound:
             self.inventory_full_sound.play()
-        logger.debug(f"Failed to add {count} {ore_type}, inventory full, pos={ore_pos}")
+        logger.debug("Failed to add %s %s, inventory full, pos=%s", count, ore_type, ore_pos)
         return False
 
     def save_and_quit(self):
@@ -267,7 +278,7 @@ class Game:
             logger.warning("Cannot start online_coop: No lobby code")
             return
         if self.mode == "local_coop":
-            self.players.append(Player(self.upgrades_cfg, self.world))
+            self.players.append(Player(self.upgrades_cfg, self.world, self.clock))
             self.players[1].pos_x = self.players[0].pos_x + 50
             self.players[1].rect.x = self.players[1].pos_x
             self.players[1].pick_index = self.players[0].pick_index
@@ -287,20 +298,20 @@ class Game:
             self.players[1].inventory = {'dynamite': 0, 'health_pack': 0, 'earthquake': 0, 'depth_charge': 0, 'bat_wing': 0, 'goblin_tooth': 0}
             self.players[1].ore_slots = [None] * self.players[1].max_ore_slots
             logger.info("Added second player for local co-op")
-        self.day_start_time = time.time()
+        self.day_start_time = self.clock.now()
         self.time_left = settings.DAY_DURATION + self.players[0].day_extension
         self.state_manager.set_state("playing", self)
-        logger.info(f"Started game in {self.mode} mode")
+        logger.info("Started game in %s mode", self.mode)
 
     def toggle_pause(self):
         """Toggle between playing and paused states."""
         if self.state_manager.current_state == "playing":
-            self.time_left = settings.DAY_DURATION + self.players[0].day_extension - (time.time() - self.day_start_time)
+            self.time_left = settings.DAY_DURATION + self.players[0].day_extension - (self.clock.now() - self.day_start_time)
             self.state_manager.set_state("paused", self)
             pygame.mixer.music.pause()
             logger.debug("Game paused, music paused")
         else:
-            self.day_start_time = time.time() - (settings.DAY_DURATION + self.players[0].day_extension - self.time_left)
+            self.day_start_time = self.clock.now() - (settings.DAY_DURATION + self.players[0].day_extension - self.time_left)
             self.state_manager.set_state("playing", self)
             pygame.mixer.music.unpause()
             logger.debug("Game resumed, music unpaused")
@@ -335,7 +346,7 @@ class Game:
             logger.info("Cannot toggle second player: Not in local co-op mode")
             return
         if len(self.players) == 1:
-            self.players.append(Player(self.upgrades_cfg, self.world))
+            self.players.append(Player(self.upgrades_cfg, self.world, self.clock))
             self.players[1].pos_x = self.players[0].pos_x + 50
             self.players[1].rect.x = self.players[1].pos_x
             self.players[1].pick_index = self.players[0].pick_index
@@ -366,7 +377,7 @@ class Game:
             return True
         if self.players[0].use_item(item_id):
             if item_id == "dynamite":
-                self.entity_manager.add(Explosion(self.players[0].rect.centerx, self.players[0].rect.centery, 5 * settings.TILE_SIZE), "explosions")
+                self.entity_manager.spawn("explosions", self.players[0].rect.centerx, self.players[0].rect.centery, 5 * settings.TILE_SIZE)
                 aoe_mining(self, self.players[0].rect.centerx, self.players[0].rect.centery, 5)
                 trigger_screen_flash(self, 0.2, (255, 255, 0))
                 self.debug_message = "Used Dynamite"
@@ -386,17 +397,9 @@ class Game:
                 logger.info("Used health pack")
             elif item_id == "earthquake":
                 center_x = int(self.players[0].rect.centerx // settings.TILE_SIZE)
-                for depth in range(int(self.players[0].rect.centery // settings.TILE_SIZE), settings.MAX_DEPTH):
-                    if 0 <= center_x < settings.NUM_COLS and 0 <= depth < settings.MAX_DEPTH:
-                        block = self.world.block_at(center_x, depth)
-                        if block and block != "empty":
-                            self.send_message({
-                                "action": "mine_block",
-                                "block_x": center_x,
-                                "block_y": depth,
-                                "player_id": self.player_id
-                            })
-                self.entity_manager.add(Explosion(self.players[0].rect.centerx, settings.HEIGHT, 3 * settings.TILE_SIZE), "explosions")
+                top = int(self.players[0].rect.centery // settings.TILE_SIZE)
+                self.world.break_region(column_tiles(center_x, top, top + settings.EARTHQUAKE_DEPTH - 1), self)
+                self.entity_manager.spawn("explosions", self.players[0].rect.centerx, settings.HEIGHT, 3 * settings.TILE_SIZE)
                 trigger_screen_flash(self, 0.2, (255, 255, 0))
                 self.debug_message = "Used Earthquake"
                 self.debug_message_timer = 2.0
@@ -407,7 +410,7 @@ class Game:
                 mx, my = pygame.mouse.get_pos()
                 world_mx = mx + self.camera_x
                 world_my = my + self.camera_y
-                self.entity_manager.add(Explosion(world_mx, world_my, 3 * settings.TILE_SIZE), "explosions")
+                self.entity_manager.spawn("explosions", world_mx, world_my, 3 * settings.TILE_SIZE)
                 aoe_mining(self, world_mx, world_my, 3)
                 trigger_screen_flash(self, 0.2, (255, 255, 0))
                 self.debug_message = "Used Depth Charge"
@@ -417,7 +420,7 @@ class Game:
                 spawn_particles(self, world_mx, world_my, 10, sparkle=True)
                 logger.info("Used depth charge")
             elif item_id == "bat_wing":
-                self.players[0].active_effects['speed_boost'] = {'active': True, 'end_time': time.time() + 30}
+                self.players[0].active_effects['speed_boost'] = {'active': True, 'end_time': self.clock.now() + 30}
                 self.players[0].mining_speed_boost += 0.5
                 trigger_screen_flash(self, 0.2, (128, 0, 128))
                 self.debug_message = "Used Bat Wing: +0.5x Mining Speed (30s)"
@@ -427,7 +430,7 @@ class Game:
                 spawn_particles(self, self.players[0].rect.centerx, self.players[0].rect.centery, 5, sparkle=True, color=(128, 0, 128))
                 logger.info("Used bat wing: Speed boost")
             elif item_id == "goblin_tooth":
-                self.players[0].active_effects['safety_bubble'] = {'active': True, 'end_time': time.time() + 30}
+                self.players[0].active_effects['safety_bubble'] = {'active': True, 'end_time': self.clock.now() + 30}
                 self.players[0].rock_damage_reduction += 0.2
                 trigger_screen_flash(self, 0.2, (0, 128, 128))
                 self.debug_message = "Used Goblin Tooth: +20% Damage Resist (30s)"
@@ -464,11 +467,11 @@ class Game:
                     self.ui.show_upgrade_menu = False
                     if self.item_sound:
                         self.item_sound.play()
-                    logger.info(f"Purchased pickaxe: {upgrade['name']}")
+                    logger.info("Purchased pickaxe: %s", upgrade['name'])
                 else:
                     self.ui.lobby_message = "Cannot afford or already unlocked"
                     self.ui.lobby_message_timer = 2.0
-                    logger.debug(f"Failed to purchase pickaxe: {upgrade['name']}, cash: {self.players[0].cash}, unlocked: {upgrade.get('unlocked', False)}")
+                    logger.debug("Failed to purchase pickaxe: %s, cash: %s, unlocked: %s", upgrade['name'], self.players[0].cash, upgrade.get('unlocked', False))
         else:
             shop_items = self.upgrades_cfg.get("shop", [])
             if shop_items and self.ui.selected_upgrade < len(shop_items):
@@ -476,7 +479,7 @@ class Game:
                 if item.get("permanent", False) and item.get("unlocked", False):
                     self.ui.lobby_message = "Already purchased"
                     self.ui.lobby_message_timer = 2.0
-                    logger.debug(f"Cannot purchase {item['name']}, already unlocked")
+                    logger.debug("Cannot purchase %s, already unlocked", item['name'])
                 else:
                     prereq_met = True
                     if item["id"] == "quantum_pickaxe" and not self.players[0].aoe_mining >= 2:
@@ -509,15 +512,15 @@ class Game:
                         self.ui.show_upgrade_menu = False
                         if self.item_sound:
                             self.item_sound.play()
-                        logger.info(f"Purchased shop item: {item['name']}")
+                        logger.info("Purchased shop item: %s", item['name'])
                     else:
                         self.ui.lobby_message = "Cannot afford or prerequisites not met"
                         self.ui.lobby_message_timer = 2.0
-                        logger.debug(f"Failed to purchase shop item: {item['name']}, cash: {self.players[0].cash}")
+                        logger.debug("Failed to purchase shop item: %s, cash: %s", item['name'], self.players[0].cash)
 
     def use_melee(self):
         """Perform a melee attack on nearby enemies."""
-        for enemy in self.entity_manager.entities["enemies"]:
+        for enemy in self.entity_manager.candidates("enemies", self.players[0].rect.centerx, self.players[0].rect.centery, 2 * settings.TILE_SIZE):
             if abs(enemy.rect.centerx - self.players[0].rect.centerx) <= 2 * settings.TILE_SIZE and abs(enemy.rect.centery - self.players[0].rect.centery) <= 2 * settings.TILE_SIZE:
                 enemy.health -= 10 * (1.5 if self.players[0].melee_upgrade else 1.0)
                 trigger_screen_flash(self, 0.2, (255, 0, 0))
@@ -529,7 +532,7 @@ class Game:
                     self.bat_sound.play()
                 elif self.rare_ore_sound and enemy.type == "abyss_wraith":
                     self.rare_ore_sound.play()
-                logger.debug(f"Melee hit {enemy.type} at ({enemy.rect.x}, {enemy.rect.y})")
+                logger.debug("Melee hit %s at (%s, %s)", enemy.type, enemy.rect.x, enemy.rect.y)
 
     def handle_mining(self, mouse_pos):
         """Start mining at the specified position."""
@@ -537,10 +540,10 @@ class Game:
             self.ui.lobby_message = "Mining Fatigue: Rest to recover"
             self.ui.lobby_message_timer = 1.0
             logger.debug("Mining blocked by fatigue")
-            if self.fatigue_sound and (time.time() - self.last_sound_time) >= 0.5:
+            if self.fatigue_sound and (self.clock.now() - self.last_sound_time) >= 0.5:
                 self.fatigue_sound.set_volume(settings.SOUND_VOLUME * 0.5)
                 self.fatigue_sound.play()
-                self.last_sound_time = time.time()
+                self.last_sound_time = self.clock.now()
             trigger_screen_flash(self, 0.2, (255, 0, 0))
             if self.mining:
                 self.stop_mining()
@@ -563,14 +566,14 @@ class Game:
                     self.mining_fatigue = min(self.mining_fatigue + fatigue_increment, 1.0)
                     self.mining = True
                     self.mine_target = (tx, ty)
-                    self.mine_start = time.time()
+                    self.mine_start = self.clock.now()
                     self.mining_progress = self.world.get_block_state(tx, ty) / 3.0
                     spawn_particles(self, block_x, block_y, 3, rock_chip=True)
-                    if self.mining_sound and (time.time() - self.last_sound_time) >= 0.2:
+                    if self.mining_sound and (self.clock.now() - self.last_sound_time) >= 0.2:
                         self.mining_sound.set_volume(settings.SOUND_VOLUME * settings.BLOCK_PITCHES.get(block_type, 1.0) * 0.7)
                         self.mining_sound.play()
-                        self.last_sound_time = time.time()
-                    logger.debug(f"Started mining {block_type} at ({tx}, {ty}), fatigue: {self.mining_fatigue:.2f}")
+                        self.last_sound_time = self.clock.now()
+                    logger.debug("Started mining %s at (%s, %s), fatigue: %.2f", block_type, tx, ty, self.mining_fatigue)
                 if self.players[0].blaster:
                     self.handle_blaster_shot(world_mx, world_my)
                 elif self.players[0].quantum_pickaxe:
@@ -582,7 +585,7 @@ class Game:
                 self.last_mining_stage = 0
                 self.ui.lobby_message = "Block out of range"
                 self.ui.lobby_message_timer = 1.0
-                logger.debug(f"Block at ({tx}, {ty}) out of mining range")
+                logger.debug("Block at (%s, %s) out of mining range", tx, ty)
         else:
             self.mining = False
             self.mine_target = None
@@ -590,7 +593,7 @@ class Game:
             self.last_mining_stage = 0
             self.ui.lobby_message = "No valid block to mine"
             self.ui.lobby_message_timer = 1.0
-            logger.debug(f"No valid block to mine at ({tx}, {ty})")
+            logger.debug("No valid block to mine at (%s, %s)", tx, ty)
 
     def stop_mining(self):
         """Stop mining and reset state."""
@@ -607,16 +610,16 @@ class Game:
             self.send_message({"action": "mine_block", "block_x": tx, "block_y": ty, "player_id": self.player_id})
         else:
             tx, ty = int(world_mx // settings.TILE_SIZE), int(world_my // settings.TILE_SIZE)
-            self.entity_manager.add(BlasterShot(self.players[0].rect.centerx, self.players[0].rect.centery, 
-                                                (world_mx - self.players[0].rect.centerx) * 3, 
-                                                (world_my - self.players[0].rect.centery) * 3), "blaster_shots")
+            self.entity_manager.spawn("blaster_shots", self.players[0].rect.centerx, self.players[0].rect.centery,
+                                      (world_mx - self.players[0].rect.centerx) * 3,
+                                      (world_my - self.players[0].rect.centery) * 3)
             if 0 <= tx < settings.NUM_COLS and 0 <= ty < settings.MAX_DEPTH:
                 block = self.world.block_at(tx, ty)
                 if block and block not in ["empty", "grass"]:
                     self.send_message({"action": "mine_block", "block_x": tx, "block_y": ty, "player_id": self.player_id})
                     self.debug_message = f"Blaster Shot at ({tx}, {ty})"
                     self.debug_message_timer = 2.0
-            for enemy in self.entity_manager.entities["enemies"]:
+            for enemy in self.entity_manager.candidates("enemies", world_mx, world_my, settings.TILE_SIZE):
                 if enemy.rect.collidepoint(world_mx, world_my):
                     enemy.health -= 5
                     trigger_screen_flash(self, 0.2, (255, 0, 0))
@@ -628,16 +631,13 @@ class Game:
                         self.bat_sound.play()
                     elif self.rare_ore_sound and enemy.type == "abyss_wraith":
                         self.rare_ore_sound.play()
-                    logger.debug(f"Blaster hit {enemy.type} at ({world_mx}, {world_my})")
+                    logger.debug("Blaster hit %s at (%s, %s)", enemy.type, world_mx, world_my)
 
     def handle_quantum_pickaxe(self, world_mx, world_my):
         """Handle quantum pickaxe."""
         if self.mode == "online_coop":
             tx, ty = int(world_mx // settings.TILE_SIZE), int(world_my // settings.TILE_SIZE)
-            for dx in range(-1, 2):
-                for dy in range(-1, 2):
-                    if 0 <= tx + dx < settings.NUM_COLS and 0 <= ty + dy < settings.MAX_DEPTH:
-                        self.send_message({"action": "mine_block", "block_x": tx + dx, "block_y": ty + dy, "player_id": self.player_id})
+            self.send_message({"action": "mine_region", "tiles": square_tiles(tx, ty, 1), "player_id": self.player_id})
         else:
             tx, ty = int(world_mx // settings.TILE_SIZE), int(world_my // settings.TILE_SIZE)
             depth_zone = self.world.get_depth_zone(ty)
@@ -646,12 +646,12 @@ class Game:
             trigger_screen_flash(self, 0.2, (0, 255, 255))
             self.debug_message = "Quantum Pickaxe Used"
             self.debug_message_timer = 2.0
-            if self.mining_sound and (time.time() - self.last_sound_time) >= 0.3:
+            if self.mining_sound and (self.clock.now() - self.last_sound_time) >= 0.3:
                 self.mining_sound.set_volume(settings.SOUND_VOLUME * 0.9)
                 self.mining_sound.play()
-                self.last_sound_time = time.time()
+                self.last_sound_time = self.clock.now()
             spawn_particles(self, world_mx, world_my, 12, sparkle=True, color=(0, 255, 255))
-            logger.debug(f"Quantum Pickaxe used at ({tx}, {ty}), fatigue: {self.mining_fatigue:.2f}")
+            logger.debug("Quantum Pickaxe used at (%s, %s), fatigue: %.2f", tx, ty, self.mining_fatigue)
 
     def handle_auto_mining(self):
         """Handle auto-mining for players with auto-miner upgrade."""
@@ -659,21 +659,13 @@ class Game:
             if player.active_effects.get("auto_miner", {}).get("active", False) and not self.mining and random.random() < 0.05:
                 center_x = int(player.rect.centerx // settings.TILE_SIZE)
                 center_y = int(player.rect.centery // settings.TILE_SIZE)
-                radius = 5
-                for ty in range(center_y - radius, center_y + radius + 1):
-                    for tx in range(center_x - radius, center_x + radius + 1):
-                        if 0 <= tx < settings.NUM_COLS and 0 <= ty < settings.MAX_DEPTH and (tx, ty) not in self.auto_mined_blocks:
-                            block = self.world.block_at(tx, ty)
-                            if block in ['dirt', 'stone', 'cave_wall']:
-                                self.send_message({
-                                    "action": "mine_block",
-                                    "block_x": tx,
-                                    "block_y": ty,
-                                    "player_id": self.player_id
-                                })
-                                self.auto_mined_blocks.append((tx, ty))
-                                self.debug_message = f"Auto-Mining at ({tx}, {ty})"
-                                self.debug_message_timer = 2.0
+                tiles = [(tx, ty) for tx, ty in square_tiles(center_x, center_y, 5)
+                         if (tx, ty) not in self.auto_mined_blocks and self.world.block_at(tx, ty) in ['dirt', 'stone', 'cave_wall']]
+                if tiles:
+                    self.send_message({"action": "mine_region", "tiles": tiles, "player_id": self.player_id})
+                    self.auto_mined_blocks.update(tiles)
+                    self.debug_message = f"Auto-Mining {len(tiles)} blocks at ({center_x}, {center_y})"
+                    self.debug_message_timer = 2.0
 
     def check_milestones(self):
         """Check and apply depth, ore, and diamond mining milestones."""
@@ -691,7 +683,7 @@ class Game:
                 trigger_screen_flash(self, 0.2, (0, 255, 0))
                 self.debug_message = f"Milestone: Reached Depth {milestone_depth} - +$1000, +1 Health Pack"
                 self.debug_message_timer = 2.0
-                logger.info(f"Achieved depth milestone: {milestone_depth}")
+                logger.info("Achieved depth milestone: %s", milestone_depth)
                 if milestone_depth >= 75000:
                     self.lava_hazard_active = True
                     self.debug_message = "Warning: Lava Hazard Activated!"
@@ -706,7 +698,7 @@ class Game:
                 trigger_screen_flash(self, 0.2, (0, 255, 0))
                 self.debug_message = f"Milestone: Mined {milestone_ores} Ores - +$500, +1 Dynamite"
                 self.debug_message_timer = 2.0
-                logger.info(f"Achieved ores mined milestone: {milestone_ores}")
+                logger.info("Achieved ores mined milestone: %s", milestone_ores)
         for milestone_diamonds, achieved in self.milestones["diamonds_mined"].items():
             if self.diamonds_mined >= milestone_diamonds and not achieved:
                 self.milestones["diamonds_mined"][milestone_diamonds] = True
@@ -716,19 +708,19 @@ class Game:
                 trigger_screen_flash(self, 0.3, (185, 242, 255))
                 self.debug_message = f"Milestone: Mined {milestone_diamonds} Diamonds - +$500, +1 Health Pack"
                 self.debug_message_timer = 2.0
-                logger.info(f"Achieved diamonds mined milestone: {milestone_diamonds}")
+                logger.info("Achieved diamonds mined milestone: %s", milestone_diamonds)
 
     def setup(self):
         """Reset game state for a new game."""
         self.world = World()
-        self.players = [Player(self.upgrades_cfg, self.world)]
+        self.players = [Player(self.upgrades_cfg, self.world, self.clock)]
         self.remote_players = {}
         self.ore_scanner = OreScanner(self.players[0], self.world)
         self.entity_manager = EntityManager()
         self.day = 1
         self.quota = settings.QUOTA_BASE
         self.cash_earned_today = 0
-        self.day_start_time = time.time()
+        self.day_start_time = self.clock.now()
         self.time_left = settings.DAY_DURATION
         self.grace_period = False
         self.bonus_multiplier = 1.0
@@ -736,7 +728,7 @@ class Game:
         self.diamonds_mined = 0
         self.lava_hazard_active = False
         self.lava_damage_timer = 0.0
-        self.auto_mined_blocks = []
+        self.auto_mined_blocks = set()
         self.mining_fatigue = 0.0
         self.mining_fatigue_timer = 0.0
         self.inventory_full_notification = None
@@ -772,7 +764,7 @@ class Game:
         self.quota *= settings.QUOTA_INCREASE
         self.cash_earned_today = max(0, self.cash_earned_today - self.quota)
         self.players[0].cash += self.cash_earned_today
-        self.day_start_time = time.time()
+        self.day_start_time = self.clock.now()
         self.grace_period = False
         self.bonus_multiplier = 1.0
         self.mining_fatigue = 0.0
@@ -785,7 +777,7 @@ class Game:
         self.debug_message = f"Day {self.day} started! New quota: ${self.quota:.2f}"
         self.debug_message_timer = 2.0
         self.state_manager.set_state("playing", self)
-        logger.info(f"Starting day {self.day}, new quota: ${self.quota:.2f}")
+        logger.info("Starting day %s, new quota: $%.2f", self.day, self.quota)
 
     def update(self, dt):
         """Update game logic for the playing state."""
@@ -814,7 +806,7 @@ class Game:
 
         # Send position updates
         if self.websocket and self.mode == "online_coop":
-            current_time = time.time()
+            current_time = self.clock.now()
             if current_time - self.last_position_send_time >= self.position_send_interval:
                 self.send_message({
                     "action": "update_position",
@@ -824,11 +816,16 @@ class Game:
                 })
                 self.last_position_send_time = current_time
 
+        # Keep chunks around local players resident in the world's chunk cache
+        self.world.set_focus([player.rect.center for player in self.players])
+
         # Update players and world (singleplayer/local co-op)
         if self.mode != "online_coop":
+            keys = self.read_keys()
             for player in self.players:
-                player.update(dt, self.world, pygame.key.get_pressed(), game=self)
-            total_value = self.world.update(dt)
+                player.update(dt, self.world, keys, game=self)
+            with self.profiler.section("world"):
+                total_value = self.world.update(dt)
             self.cash_earned_today += total_value
             for player in self.players:
                 player.quota_buffer += total_value
@@ -839,15 +836,11 @@ class Game:
             if self.mining_fatigue_timer >= 0.5:
                 self.mining_fatigue = max(0, self.mining_fatigue - 0.2 * dt)
                 self.mining_fatigue_timer = 0.0
-                logger.debug(f"Mining fatigue reduced to {self.mining_fatigue:.2f}")
+                logger.debug("Mining fatigue reduced to %.2f", self.mining_fatigue)
 
         # Update entities
-        for entity_group in self.entity_manager.entities.values():
-            for entity in entity_group[:]:
-                if entity.__class__.__name__ == "Particle":
-                    entity.update(dt)
-                else:
-                    entity.update(dt, self)
+        with self.profiler.section("entities"):
+            self.entity_manager.update(dt, self)
 
         # Handle mining (client-side for singleplayer/local co-op)
         if self.mining and self.mine_target and self.mode != "online_coop":
@@ -860,7 +853,7 @@ class Game:
                 if distance <= self.players[0].mining_range * settings.TILE_SIZE:
                     depth_zone = self.world.get_depth_zone(ty)
                     mining_time = self.ores_cfg.get(block_type, {"time": 1.0})["time"] / (self.players[0].pick_speed * self.players[0].mining_speed_boost * (1.5 if self.players[0].melee_upgrade else 1.0)) * (1 + self.mining_fatigue)
-                    elapsed = time.time() - self.mine_start
+                    elapsed = self.clock.now() - self.mine_start
                     initial_progress = self.world.get_block_state(tx, ty) / 3.0
                     self.mining_progress = initial_progress + (elapsed / mining_time)
                     stage = min(3, int(self.mining_progress * 3))
@@ -868,11 +861,11 @@ class Game:
                         spawn_particles(self, tx * settings.TILE_SIZE, ty * settings.TILE_SIZE, 3, rock_chip=True)
                         self.last_mining_stage = stage
                         self.world.set_block_state(tx, ty, stage)
-                        if self.mining_sound and (time.time() - self.last_sound_time) >= 0.2:
+                        if self.mining_sound and (self.clock.now() - self.last_sound_time) >= 0.2:
                             self.mining_sound.set_volume(settings.SOUND_VOLUME * settings.BLOCK_PITCHES.get(block_type, 1.0) * 0.7)
                             self.mining_sound.play()
-                            self.last_sound_time = time.time()
-                        logger.debug(f"Mining stage {stage} at ({tx}, {ty})")
+                            self.last_sound_time = self.clock.now()
+                        logger.debug("Mining stage %s at (%s, %s)", stage, tx, ty)
                     if self.mining_progress >= 1.0:
                         self.send_message({
                             "action": "mine_block",
@@ -880,7 +873,7 @@ class Game:
                             "block_y": ty,
                             "player_id": self.player_id
                         })
-                        self.mine_start = time.time()
+                        self.mine_start = self.clock.now()
                         self.mine_target = None
                         self.mining_progress = 0.0
                         self.last_mining_stage = 0
@@ -909,6 +902,7 @@ class Game:
         self.target_camera_y = max(0, self.players[0].rect.centery - settings.HEIGHT // 2)
         self.camera_x += (self.target_camera_x - self.camera_x) * self.camera_smoothing
         self.camera_y += (self.target_camera_y - self.camera_y) * self.camera_smoothing
+        self.world.prefetcher.plan(self.players, self.camera_x, self.camera_y)
 
         # Handle timers
         if self.debug_message_timer > 0:
@@ -937,44 +931,63 @@ class Game:
 
     async def run(self):
         """Run the game loop with optimized rendering and multiplayer message sending."""
-        clock = pygame.time.Clock()
+        frame_clock = pygame.time.Clock()
         while self.running:
-            dt = clock.tick(settings.FPS) / 1000.0
-            self.event_handler.process_events()
+            frame_dt = frame_clock.tick(settings.FPS) / 1000.0
+            frame_start = time.perf_counter()
+            profiler = self.profiler
+            with profiler.section("events"):
+                self.event_handler.process_events()
             # Only update game logic if not in menu states
             if not (self.ui.show_start_menu or self.ui.show_mode_menu or self.ui.show_lobby_menu or 
                     self.ui.show_pause_menu or self.ui.show_upgrade_menu or self.ui.show_inventory or 
                     self.ui.show_post_day_upgrades or self.ui.game_over):
-                self.state_manager.update(self, dt)
-            self.screen.fill((0, 0, 0))
-            if not (self.ui.show_start_menu or self.ui.show_mode_menu or self.ui.show_lobby_menu or 
-                    self.ui.show_pause_menu or self.ui.show_upgrade_menu or self.ui.show_inventory or 
-                    self.ui.show_post_day_upgrades or self.ui.game_over):
-                self.renderer.draw_world(self.world, self.camera_x, self.camera_y)
-                self.renderer.draw_entities(self.entity_manager.entities.values(), self.camera_x, self.camera_y)
-                self.renderer.draw_players(self.players, self.remote_players, self.camera_x, self.camera_y)
-                if self.ore_scanner.active:
-                    self.renderer.draw_ore_scanner(self.ore_scanner, self.camera_x, self.camera_y)
-                if self.inventory_full_notification:
-                    notification_surf = self.ui.font.render(self.inventory_full_notification, True, (255, 100, 100))
-                    self.screen.blit(notification_surf, (settings.WIDTH // 2 - notification_surf.get_width() // 2, settings.HEIGHT - 150))
-                if self.ore_collect_notification:
-                    notification_surf = self.ui.font.render(self.ore_collect_notification, True, (0, 255, 0))
-                    self.screen.blit(notification_surf, (settings.WIDTH // 2 - notification_surf.get_width() // 2, settings.HEIGHT - 100))
-            self.renderer.draw_ui(self.ui, self)
-            self.renderer.apply_effects(self.shake_timer, self.shake_intensity, self.flash_timer, self.flash_color)
-            pygame.display.flip()
+                dt = self.clock.tick(frame_dt)
+                with profiler.section("update"):
+                    self.state_manager.update(self, dt)
+            playing = not (self.ui.show_start_menu or self.ui.show_mode_menu or self.ui.show_lobby_menu or 
+                           self.ui.show_pause_menu or self.ui.show_upgrade_menu or self.ui.show_inventory or 
+                           self.ui.show_post_day_upgrades or self.ui.game_over)
+            if (playing and self.renderer.dirty_rects and self.shake_timer <= 0 and self.flash_timer <= 0
+                    and not self.ore_scanner.active and not self.show_debug):
+                with profiler.section("draw_dirty"):
+                    self.renderer.draw_dirty_frame(self)
+            else:
+                self.screen.fill((0, 0, 0))
+                if playing:
+                    with profiler.section("draw_world"):
+                        self.renderer.draw_world(self.world, self.camera_x, self.camera_y)
+                    with profiler.section("draw_entities"):
+                        self.renderer.draw_entities(self.entity_manager.entities.values(), self.camera_x, self.camera_y)
+                    self.renderer.draw_players(self.players, self.remote_players, self.camera_x, self.camera_y)
+                    if self.ore_scanner.active:
+                        self.renderer.draw_ore_scanner(self.ore_scanner, self.camera_x, self.camera_y)
+                    self.renderer.draw_notifications(self)
+                with profiler.section("draw_ui"):
+                    self.renderer.draw_ui(self.ui, self)
+                self.renderer.apply_effects(self.shake_timer, self.shake_intensity, self.flash_timer, self.flash_color)
+                if self.show_debug:
+                    profiler.draw(self.screen, self.ui.text)
+                self.renderer.invalidate_dirty()
+                with profiler.section("flip"):
+                    pygame.display.flip()
+            # Spend what is left of the frame generating chunks ahead of the players
+            prefetch_budget = min(settings.PREFETCH_BUDGET, 1.0 / settings.FPS - (time.perf_counter() - frame_start))
+            if prefetch_budget > 0:
+                self.world.prefetcher.run(prefetch_budget)
             if self.websocket:
                 while self.message_queue:
                     message = self.message_queue.pop(0)
                     try:
                         await self.websocket.send(json.dumps(message))
                     except Exception as e:
-                        logger.error(f"Failed to send message: {e}")
+                        logger.error("Failed to send message: %s", e)
                         self.ui.lobby_message = "Connection error, please reconnect"
                         self.ui.lobby_message_timer = 5.0
                         self.running = False
+            profiler.end_frame()
             await asyncio.sleep(0)
+        self.profiler.dump()
         pygame.mixer.music.stop()
         pygame.quit()
         logger.info("Game loop ended, music stopped")
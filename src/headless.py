@@ -0,0 +1,166 @@
+import os
+import sys
+import json
+import time
+import random
+import zlib
+import argparse
+
+# No window or audio device: SDL's dummy drivers must be chosen before pygame is imported
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import settings
+from game import Game
+from data import load_ores, load_upgrades
+from log_config import get_logger
+
+try:
+    import resource
+except ImportError:  # Not available on Windows or Pyodide; peak RSS is then not reported
+    resource = None
+
+# Configure logging (Pyodide-compatible)
+logger = get_logger(__name__)
+
+# One step per entry: (action, *arguments). Durations are in ticks; the script loops.
+DEFAULT_SCRIPT = [
+    ("dig", 0, 1, 90),  # Tile below the player
+    ("wait", 20),
+    ("move", "right", 20),
+    ("dig", 1, 0, 90),  # Tile to the right
+    ("move", "left", 20),
+    ("jump", 1),
+    ("use_item", "dynamite"),
+    ("wait", 30),
+    ("dig", -1, 0, 90),  # Tile to the left
+]
+
+class ScriptedKeys:
+    """Stand-in for pygame.key.get_pressed() that reports the keys a script is holding."""
+    def __init__(self):
+        self.pressed = set()
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+    def __call__(self):
+        return self
+
+class HeadlessRunner:
+    """Fixed-timestep simulation of a singleplayer game driven by a script, with no rendering."""
+    def __init__(self, seed=0, dt=1.0 / settings.FPS, script=DEFAULT_SCRIPT):
+        random.seed(seed)  # Before Game, which draws from the global RNG while it sets up
+        self.dt = dt
+        self.script = script
+        self.step_index = -1
+        self.step_ticks = 0
+        self.ticks = 0
+        self.keys = ScriptedKeys()
+        game = self.game = Game(load_upgrades(), load_ores(), load_save=False)  # A save file would leak into the run
+        game.world.set_seed(seed)
+        game.clock.step_dt = dt  # Step mode: each tick is exactly dt of simulated time
+        game.clock.scale = 1.0
+        game.read_keys = self.keys
+        game.mode = "singleplayer"
+        game.ui.show_start_menu = False
+        game.start_game()
+        logger.info("Headless run seeded with %s at dt=%.4f", seed, dt)
+
+    def next_step(self):
+        """Release held keys and start the next scripted step."""
+        game = self.game
+        self.keys.pressed.clear()
+        if game.mining:
+            game.stop_mining()
+        self.step_index = (self.step_index + 1) % len(self.script)
+        action, *args = self.script[self.step_index]
+        player = game.players[0]
+        if action == "move":
+            direction, self.step_ticks = args
+            self.keys.pressed.add(pygame.K_LEFT if direction == "left" else pygame.K_RIGHT)
+        elif action == "jump":
+            self.step_ticks = args[0]
+            self.keys.pressed.add(pygame.K_SPACE)
+        elif action == "dig":
+            dx, dy, self.step_ticks = args
+            tx = player.rect.centerx // settings.TILE_SIZE + dx
+            ty = player.rect.centery // settings.TILE_SIZE + dy
+            game.handle_mining((tx * settings.TILE_SIZE + settings.TILE_SIZE // 2 - game.camera_x,
+                                ty * settings.TILE_SIZE + settings.TILE_SIZE // 2 - game.camera_y))
+        elif action == "use_item":
+            self.step_ticks = 1
+            player.inventory[args[0]] = max(1, player.inventory.get(args[0], 0))  # Scripts don't depend on the shop
+            game.use_item(args[0])
+        else:  # wait
+            self.step_ticks = args[0]
+
+    def tick(self):
+        """Advance the script and the simulation by one fixed step."""
+        if self.step_ticks <= 0:
+            self.next_step()
+        self.step_ticks -= 1
+        game = self.game
+        game.update(game.clock.tick())
+        ui = game.ui
+        if ui.show_post_day_upgrades or ui.game_over:  # Roll days over so long runs keep simulating
+            ui.show_post_day_upgrades = False
+            ui.game_over = False
+            game.next_day()
+        self.ticks += 1
+
+    def run(self, ticks):
+        """Run a number of ticks and return a report of throughput and world size."""
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.tick()
+        elapsed = time.perf_counter() - start
+        return self.report(ticks, elapsed)
+
+    def fingerprint(self):
+        """Hash of the simulation state that identical seeds and scripts must reproduce."""
+        game = self.game
+        player = game.players[0]
+        edits = sorted((key, tuple(sorted(tiles.items()))) for key, tiles in game.world.block_edits.items())
+        state = (player.rect.x, player.rect.y, game.ores_mined, round(game.cash_earned_today, 6), edits)
+        return zlib.crc32(repr(state).encode())  # Not hash(), which is salted per process for strings
+
+    def report(self, ticks, elapsed):
+        """Collect throughput, world size and memory figures for a finished run."""
+        game = self.game
+        report = {
+            "ticks": ticks,
+            "seconds": round(elapsed, 3),
+            "ticks_per_second": round(ticks / elapsed, 1) if elapsed > 0 else None,
+            "simulated_seconds": round(game.clock.now(), 2),
+            "chunks_cached": len(game.world.chunks),
+            "chunks_spilled": len(game.world.spill.slots),
+            "entities": {category: len(group) for category, group in game.entity_manager.entities.items() if category != "particles"},
+            "particles": game.entity_manager.particles.count,
+            "ores_mined": game.ores_mined,
+            "fingerprint": self.fingerprint(),
+        }
+        if resource is not None:
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            report["peak_rss_mb"] = round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+        return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the game simulation headless at a fixed timestep.")
+    parser.add_argument("--ticks", type=int, default=3600, help="Simulation steps to run")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the world and every RNG")
+    parser.add_argument("--dt", type=float, default=1.0 / settings.FPS, help="Fixed timestep in seconds")
+    parser.add_argument("--script", help="JSON file with a list of [action, *arguments] steps")
+    parser.add_argument("--log-level", help="Log level; read by log_config")
+    args = parser.parse_args(argv)
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script) as f:
+            script = [tuple(step) for step in json.load(f)]
+    runner = HeadlessRunner(seed=args.seed, dt=args.dt, script=script)
+    print(json.dumps(runner.run(args.ticks), indent=2))
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
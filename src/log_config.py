@@ -0,0 +1,61 @@
+import os
+import sys
+import logging
+from collections import deque
+from settings import LOG_LEVEL, LOG_TRACE_SIZE
+
+FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+def resolve_level(argv=None):
+    """Pick the log level from --log-level, then YEARN_LOG_LEVEL, then settings.LOG_LEVEL."""
+    argv = sys.argv if argv is None else argv
+    name = os.environ.get("YEARN_LOG_LEVEL", LOG_LEVEL)
+    for i, arg in enumerate(argv):
+        if arg.startswith("--log-level="):
+            name = arg.split("=", 1)[1]
+        elif arg == "--log-level" and i + 1 < len(argv):
+            name = argv[i + 1]
+    level = logging.getLevelName(name.upper())
+    return level if isinstance(level, int) else logging.WARNING
+
+class TraceBuffer(logging.Handler):
+    """Bounded in-memory ring of recent log records, formatted only when dumped."""
+    def __init__(self, capacity=LOG_TRACE_SIZE):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def lines(self):
+        """Format the buffered records, oldest first."""
+        return [FORMATTER.format(record) for record in self.records]
+
+    def dump(self, path):
+        """Write the buffered records to a file."""
+        with open(path, "w") as f:
+            f.write("\n".join(self.lines()) + "\n")
+
+level = resolve_level()
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(FORMATTER)
+console_handler.setLevel(max(level, logging.INFO))  # DEBUG traces go to the ring buffer, not the console
+trace_buffer = TraceBuffer()
+loggers = []
+
+def get_logger(name):
+    """Get a module logger wired to the shared console handler and trace buffer at the configured level."""
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    logger.handlers = [console_handler, trace_buffer]
+    logger.propagate = False
+    loggers.append(logger)
+    return logger
+
+def set_level(new_level):
+    """Change the level of every logger created through get_logger."""
+    global level
+    level = new_level
+    console_handler.setLevel(max(level, logging.INFO))
+    for logger in loggers:
+        logger.setLevel(level)
@@ -1,20 +1,17 @@
 import pygame
 import asyncio
-import logging
 import os
 import platform
 import websockets
 import json
 from game import Game
 from data import load_ores, load_upgrades
-from settings import WIDTH, HEIGHT, FPS
+from utils import column_tiles
+from settings import WIDTH, HEIGHT, FPS, BASE_DIR
+from log_config import get_logger, trace_buffer
 
 # Configure logging (Pyodide-compatible)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 logger.info("Initializing main.py")
 
 def verify_files():
@@ -37,12 +34,12 @@ def verify_files():
     if platform.system() != "Emscripten":
         for path in files:
             if os.path.exists(path):
-                logger.info(f"Found: {path}")
+                logger.info("Found: %s", path)
             else:
-                logger.warning(f"Missing: {path}")
+                logger.warning("Missing: %s", path)
     else:
         for path in files:
-            logger.info(f"Assumed present: {path} (file system checks disabled for Pyodide)")
+            logger.info("Assumed present: %s (file system checks disabled for Pyodide)", path)
 
 async def websocket_client(game):
     """Handle WebSocket communication with the server."""
@@ -50,16 +47,16 @@ async def websocket_client(game):
     try:
         async with websockets.connect(uri) as websocket:
             game.websocket = websocket
-            logger.info(f"Connected to WebSocket server at {uri}")
+            logger.info("Connected to WebSocket server at %s", uri)
             try:
                 async for message in websocket:
                     try:
                         data = json.loads(message)
-                        logger.debug(f"Received message: {data['type']}")
+                        logger.debug("Received message: %s", data['type'])
                         if data["type"] == "lobby_created":
                             game.player_id = data["player_id"]
                             game.lobby_code = data["lobby_code"]
-                            game.world.seed = data["world_seed"]
+                            game.world.set_seed(data["world_seed"])
                             game.mode = "online_coop"
                             for pos, block_type in data["world_state"].items():
                                 x, y = map(int, pos.strip('()').split(','))
@@ -76,7 +73,7 @@ async def websocket_client(game):
                         elif data["type"] == "lobby_joined":
                             game.player_id = data["player_id"]
                             game.lobby_code = data["lobby_code"]
-                            game.world.seed = data["world_seed"]
+                            game.world.set_seed(data["world_seed"])
                             game.mode = "online_coop"
                             for pos, block_type in data["world_state"].items():
                                 x, y = map(int, pos.strip('()').split(','))
@@ -107,6 +104,10 @@ async def websocket_client(game):
                             game.ui.lobby_message_timer = 3.0
                         elif data["type"] == "block_mined":
                             game.world.set_block(data["block_x"], data["block_y"], "empty")
+                        elif data["type"] == "column_cleared":
+                            game.world.apply_region(column_tiles(data["block_x"], data["top"], data["bottom"]), "empty")
+                        elif data["type"] == "region_mined":
+                            game.world.apply_region([tuple(tile) for tile in data["tiles"]], "empty")
                         elif data["type"] == "spawn_entity":
                             game.handle_spawn_entity(data["entity_id"], data["entity_data"])
                         elif data["type"] == "ore_collected":
@@ -121,10 +122,10 @@ async def websocket_client(game):
                                 if data["item_id"] == "health_pack":
                                     game.players[0].health = min(game.players[0].max_health, game.players[0].health + 50)
                                 elif data["item_id"] == "bat_wing":
-                                    game.players[0].active_effects["speed_boost"] = {"active": True, "end_time": time.time() + 30}
+                                    game.players[0].active_effects["speed_boost"] = {"active": True, "end_time": game.clock.now() + 30}
                                     game.players[0].mining_speed_boost += 0.5
                                 elif data["item_id"] == "goblin_tooth":
-                                    game.players[0].active_effects["safety_bubble"] = {"active": True, "end_time": time.time() + 30}
+                                    game.players[0].active_effects["safety_bubble"] = {"active": True, "end_time": game.clock.now() + 30}
                                     game.players[0].rock_damage_reduction += 0.2
                         elif data["type"] == "ore_dropped":
                             if data["player_id"] == game.player_id:
@@ -172,15 +173,15 @@ async def websocket_client(game):
                             game.debug_message = "Warning: Lava Hazard Activated!"
                             game.debug_message_timer = 2.0
                     except json.JSONDecodeError:
-                        logger.error(f"Invalid JSON received: {message}")
+                        logger.error("Invalid JSON received: %s", message)
                     except KeyError as e:
-                        logger.error(f"Missing key in message: {e}")
+                        logger.error("Missing key in message: %s", e)
             except websockets.ConnectionClosed:
                 logger.error("WebSocket connection closed")
                 game.ui.lobby_message = "Disconnected from server"
                 game.ui.lobby_message_timer = 5.0
     except Exception as e:
-        logger.error(f"WebSocket connection failed: {e}")
+        logger.error("WebSocket connection failed: %s", e)
         game.ui.lobby_message = "Failed to connect to server"
         game.ui.lobby_message_timer = 5.0
 
@@ -240,4 +241,7 @@ else:
             asyncio.run(main())
         except KeyboardInterrupt:
             logger.info("Game terminated by user")
-            pygame.quit()
\ No newline at end of file
+            pygame.quit()
+        except Exception:
+            trace_buffer.dump(os.path.join(BASE_DIR, "trace.log"))  # Last LOG_TRACE_SIZE records before the crash
+            raise
\ No newline at end of file
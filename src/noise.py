@@ -0,0 +1,105 @@
+import random
+import math
+from log_config import get_logger
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; noise_block_array is only used by the NumPy world generator
+    np = None
+
+# Configure logging (Pyodide-compatible)
+logger = get_logger(__name__)
+
+# Unit gradients on the lattice: four axes and four diagonals
+GRADIENTS = [(1.0, 0.0), (-1.0, 0.0), (0.0, 1.0), (0.0, -1.0),
+             (math.sqrt(0.5), math.sqrt(0.5)), (-math.sqrt(0.5), math.sqrt(0.5)),
+             (math.sqrt(0.5), -math.sqrt(0.5)), (-math.sqrt(0.5), -math.sqrt(0.5))]
+NOISE_RANGE = math.sqrt(0.5)  # Largest magnitude 2D Perlin noise reaches with unit gradients
+
+def fade(t):
+    """Perlin's quintic smoothstep, 6t^5 - 15t^4 + 10t^3."""
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+def axis(coord):
+    """Split a coordinate into its lattice cell, offset within the cell, and fade weight."""
+    cell = math.floor(coord)
+    offset = coord - cell
+    return cell & 255, offset, fade(offset)
+
+class GradientNoise:
+    """Seeded 2D Perlin gradient noise with values in [0, 1]."""
+    def __init__(self, seed):
+        """Build the permutation table for a world seed once."""
+        perm = list(range(256))
+        random.Random(seed).shuffle(perm)
+        self.perm = perm + perm  # Doubled so lattice hashes never need wrapping
+        self.seed = seed
+        if np is not None:
+            self.perm_array = np.array(self.perm)
+            self.gradient_x = np.array([g[0] for g in GRADIENTS])
+            self.gradient_y = np.array([g[1] for g in GRADIENTS])
+        logger.debug("Built gradient noise table for seed %s", seed)
+
+    def cell_gradients(self, cell_x, cell_y):
+        """Get the gradients at the four corners of a lattice cell."""
+        perm = self.perm
+        x1 = (cell_x + 1) & 255
+        y1 = (cell_y + 1) & 255
+        return (GRADIENTS[perm[perm[cell_x] + cell_y] & 7], GRADIENTS[perm[perm[x1] + cell_y] & 7],
+                GRADIENTS[perm[perm[cell_x] + y1] & 7], GRADIENTS[perm[perm[x1] + y1] & 7])
+
+    def blend(self, gradients, offset_x, fade_x, offset_y, fade_y):
+        """Interpolate the corner contributions of one lattice cell and map the result to [0, 1]."""
+        g00, g10, g01, g11 = gradients
+        n00 = g00[0] * offset_x + g00[1] * offset_y
+        n10 = g10[0] * (offset_x - 1) + g10[1] * offset_y
+        n01 = g01[0] * offset_x + g01[1] * (offset_y - 1)
+        n11 = g11[0] * (offset_x - 1) + g11[1] * (offset_y - 1)
+        top = n00 + fade_x * (n10 - n00)
+        bottom = n01 + fade_x * (n11 - n01)
+        return 0.5 + (top + fade_y * (bottom - top)) / NOISE_RANGE * 0.5
+
+    def noise(self, x, y, scale=1.0):
+        """Sample noise at one point."""
+        cell_x, offset_x, fade_x = axis(x * scale)
+        cell_y, offset_y, fade_y = axis(y * scale)
+        return self.blend(self.cell_gradients(cell_x, cell_y), offset_x, fade_x, offset_y, fade_y)
+
+    def noise_block(self, x0, y0, width, height, scale=1.0):
+        """Sample a width x height block of integer points starting at (x0, y0), as a flat row-major list."""
+        columns = [axis((x0 + x) * scale) for x in range(width)]
+        cells = {}  # A chunk spans only a few lattice cells, so corner gradients are looked up once each
+        values = []
+        for y in range(height):
+            cell_y, offset_y, fade_y = axis((y0 + y) * scale)
+            for cell_x, offset_x, fade_x in columns:
+                gradients = cells.get((cell_x, cell_y))
+                if gradients is None:
+                    gradients = cells[(cell_x, cell_y)] = self.cell_gradients(cell_x, cell_y)
+                values.append(self.blend(gradients, offset_x, fade_x, offset_y, fade_y))
+        return values
+
+    def noise_block_array(self, x0, y0, width, height, scale=1.0):
+        """NumPy version of noise_block returning a (height, width) array with the same values."""
+        coord_x = (x0 + np.arange(width)) * scale
+        coord_y = (y0 + np.arange(height)) * scale
+        floor_x, floor_y = np.floor(coord_x), np.floor(coord_y)
+        offset_x = (coord_x - floor_x)[None, :]
+        offset_y = (coord_y - floor_y)[:, None]
+        fade_x, fade_y = fade(offset_x), fade(offset_y)
+        cell_x = floor_x.astype(np.int64) & 255
+        cell_y = floor_y.astype(np.int64) & 255
+        perm, grad_x, grad_y = self.perm_array, self.gradient_x, self.gradient_y
+
+        def corner(cx, cy, dx, dy):
+            index = perm[perm[cx][None, :] + cy[:, None]] & 7
+            return grad_x[index] * dx + grad_y[index] * dy
+
+        x1, y1 = (cell_x + 1) & 255, (cell_y + 1) & 255
+        n00 = corner(cell_x, cell_y, offset_x, offset_y)
+        n10 = corner(x1, cell_y, offset_x - 1, offset_y)
+        n01 = corner(cell_x, y1, offset_x, offset_y - 1)
+        n11 = corner(x1, y1, offset_x - 1, offset_y - 1)
+        top = n00 + fade_x * (n10 - n00)
+        bottom = n01 + fade_x * (n11 - n01)
+        return 0.5 + (top + fade_y * (bottom - top)) / NOISE_RANGE * 0.5
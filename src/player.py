@@ -1,17 +1,12 @@
 import pygame
 import random
-import logging
-import time
 from settings import *
+from log_config import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 
 class Player:
-    def __init__(self, upgrades, world):
+    def __init__(self, upgrades, world, clock):
         self.rect = pygame.Rect(NUM_COLS * TILE_SIZE // 2, 0, 16, 32)
         self.pos_x = self.rect.x
         self.pos_y = self.rect.y
@@ -29,11 +24,12 @@ class Player:
         self.inventory = {'dynamite': 0, 'health_pack': 0, 'earthquake': 0, 'depth_charge': 0, 'bat_wing': 0, 'goblin_tooth': 0}
         self.max_ore_slots = 9
         self.ore_slots = [None] * self.max_ore_slots  # Each slot: {'type': str, 'value_per_unit': float, 'count': int}
-        self.active_effects = {
-            "speed_boost": {"active": False, "duration": 0.0},
-            "safety_bubble": {"active": False, "duration": 0.0},
-            "auto_miner": {"active": False, "duration": 0.0},
-            "xray_vision": {"active": False, "duration": 0.0}
+        self.clock = clock
+        self.active_effects = {  # Effect: {"active": bool, "end_time": clock time it expires at}
+            "speed_boost": {"active": False, "end_time": 0.0},
+            "safety_bubble": {"active": False, "end_time": 0.0},
+            "auto_miner": {"active": False, "end_time": 0.0},
+            "xray_vision": {"active": False, "end_time": 0.0}
         }
         self.mining_range = 2.0
         self.ore_pickup_range = 3.0  # Initial ore pickup range: 3 blocks
@@ -56,31 +52,31 @@ class Player:
         self.pick_speed = upgrades['pickaxes'][0]['speed']
         self.last_ore_added = None  # Track last ore added for debugging
         self.last_ore_pos = None  # Track position of last ore added
-        logger.debug(f"Player initialized with ore_pickup_range={self.ore_pickup_range}, fatigue_reduction={self.fatigue_reduction}")
+        logger.debug("Player initialized with ore_pickup_range=%s, fatigue_reduction=%s", self.ore_pickup_range, self.fatigue_reduction)
 
     def add_ore(self, ore_type, value_per_unit, count=1, ore_pos=None):
         """Add a specified count of ores to the inventory, return True if successful."""
         if count <= 0:
-            logger.warning(f"Invalid count {count} for {ore_type}, skipping add_ore")
+            logger.warning("Invalid count %s for %s, skipping add_ore", count, ore_type)
             return False
         if value_per_unit > 1000:
-            logger.warning(f"Suspiciously high value_per_unit ${value_per_unit} for {ore_type}, possible multiplier error")
+            logger.warning("Suspiciously high value_per_unit $%s for %s, possible multiplier error", value_per_unit, ore_type)
         if self.last_ore_added == (ore_type, value_per_unit) and self.last_ore_pos == ore_pos:
-            logger.warning(f"Repeated add_ore call for {ore_type} at {ore_pos}, value_per_unit=${value_per_unit:.2f}")
+            logger.warning("Repeated add_ore call for %s at %s, value_per_unit=$%.2f", ore_type, ore_pos, value_per_unit)
             return False
         self.last_ore_added = (ore_type, value_per_unit)
         self.last_ore_pos = ore_pos
         for slot in self.ore_slots:
             if slot and slot['type'] == ore_type and abs(slot['value_per_unit'] - value_per_unit) < 0.01 and slot['count'] + count <= 64:
                 slot['count'] += count
-                logger.debug(f"Added {count} {ore_type} to existing slot, count now {slot['count']}, value_per_unit=${value_per_unit:.2f}, pos={ore_pos}")
+                logger.debug("Added %s %s to existing slot, count now %s, value_per_unit=$%.2f, pos=%s", count, ore_type, slot['count'], value_per_unit, ore_pos)
                 return True
         for i in range(self.max_ore_slots):
             if self.ore_slots[i] is None:
                 self.ore_slots[i] = {'type': ore_type, 'value_per_unit': value_per_unit, 'count': count}
-                logger.debug(f"Added {count} {ore_type} to new slot {i}, value_per_unit=${value_per_unit:.2f}, pos={ore_pos}")
+                logger.debug("Added %s %s to new slot %s, value_per_unit=$%.2f, pos=%s", count, ore_type, i, value_per_unit, ore_pos)
                 return True
-        logger.debug(f"Failed to add {count} {ore_type}, inventory full, pos={ore_pos}")
+        logger.debug("Failed to add %s %s, inventory full, pos=%s", count, ore_type, ore_pos)
         return False
 
     def get_ore_inventory(self):
@@ -100,23 +96,23 @@ class Player:
                 slot_value *= self.cash_multiplier * game.bonus_multiplier
                 total_value += slot_value
         self.ore_slots = [None] * self.max_ore_slots
-        logger.debug(f"Cleared ore inventory, total value=${total_value:.2f}")
+        logger.debug("Cleared ore inventory, total value=$%.2f", total_value)
         return total_value
 
     def apply_effect(self, effect, duration):
         if effect in self.active_effects:
             self.active_effects[effect]["active"] = True
-            self.active_effects[effect]["duration"] = duration
-            logger.debug(f"Applied effect {effect} for {duration}s")
+            self.active_effects[effect]["end_time"] = self.clock.now() + duration
+            logger.debug("Applied effect %s for %ss", effect, duration)
 
     def add_to_inventory(self, item_id):
         self.inventory[item_id] = self.inventory.get(item_id, 0) + 1
-        logger.debug(f"Added {item_id} to inventory: {self.inventory[item_id]}")
+        logger.debug("Added %s to inventory: %s", item_id, self.inventory[item_id])
 
     def use_item(self, item_id):
         if item_id in self.inventory and self.inventory[item_id] > 0:
             self.inventory[item_id] -= 1
-            logger.debug(f"Used {item_id}, remaining: {self.inventory[item_id]}")
+            logger.debug("Used %s, remaining: %s", item_id, self.inventory[item_id])
             return True
         return False
 
@@ -133,28 +129,28 @@ class Player:
                 available_items = [(k, v) for k, v in self.inventory.items() if v > 0]
         return dropped
 
-    def throw_item(self, game, ore_items):
+    def throw_item(self, game):
         item_list = [(k, v) for k, v in self.inventory.items() if v > 0]
         if item_list:
             item_type, _ = random.choice(item_list)
             if self.use_item(item_type):
                 value = game.ores_cfg.get(item_type, {"value": 0})["value"]
-                ore_items.append(OreItem(self.rect.centerx, self.rect.centery, item_type, value, game.ores_cfg))
-                logger.debug(f"Threw {item_type} at ({self.rect.centerx}, {self.rect.centery})")
+                game.entity_manager.spawn("ore_items", self.rect.centerx, self.rect.centery, item_type, value, game.ores_cfg)
+                logger.debug("Threw %s at (%s, %s)", item_type, self.rect.centerx, self.rect.centery)
 
     def update(self, dt, world, keys, game=None):
         """Update player state, movement, and ore collection."""
         # Update active effects
+        now = self.clock.now()
         for effect_name, effect in self.active_effects.items():
             if effect["active"]:
-                effect["duration"] -= dt
-                if effect["duration"] <= 0:
+                if now >= effect["end_time"]:
                     effect["active"] = False
                     if effect_name == "speed_boost":
                         self.mining_speed_boost = max(1.0, self.mining_speed_boost - 0.5)
                     elif effect_name == "safety_bubble":
                         self.rock_damage_reduction = max(0.0, self.rock_damage_reduction - 0.2)
-                    logger.debug(f"Effect {effect_name} expired")
+                    logger.debug("Effect %s expired", effect_name)
 
         # Handle movement input
         self.target_vx = 0
@@ -166,7 +162,7 @@ class Player:
             self.vy = -JUMP_VELOCITY * self.jump_boost
             self.on_ground = False
             self.coyote_timer = 0
-            logger.debug(f"Player jumped, vy={self.vy}")
+            logger.debug("Player jumped, vy=%s", self.vy)
 
         # Update velocity and position
         self.vx += (self.target_vx - self.vx) * 0.3
@@ -180,23 +176,27 @@ class Player:
 
         # Handle collisions with world blocks
         self.on_ground = False
-        for block in world.get_surrounding_blocks(self.rect):
-            if self.vy > 0 and self.rect.bottom <= block.top + 8 and self.rect.bottom > block.top - 8 and self.rect.left < block.right and self.rect.right > block.left:
-                self.rect.bottom = block.top
+        for tx, ty in world.solid_tiles_near(self.rect):
+            block_left = tx * TILE_SIZE
+            block_top = ty * TILE_SIZE
+            block_right = block_left + TILE_SIZE
+            block_bottom = block_top + TILE_SIZE
+            if self.vy > 0 and self.rect.bottom <= block_top + 8 and self.rect.bottom > block_top - 8 and self.rect.left < block_right and self.rect.right > block_left:
+                self.rect.bottom = block_top
                 self.pos_y = self.rect.y
                 self.vy = 0
                 self.on_ground = True
                 self.coyote_timer = 0.1
-            elif self.vy < 0 and self.rect.top >= block.bottom - 8 and self.rect.top < block.bottom + 8 and self.rect.left < block.right and self.rect.right > block.left:
-                self.rect.top = block.bottom
+            elif self.vy < 0 and self.rect.top >= block_bottom - 8 and self.rect.top < block_bottom + 8 and self.rect.left < block_right and self.rect.right > block_left:
+                self.rect.top = block_bottom
                 self.pos_y = self.rect.y
                 self.vy = 0
-            elif self.vx > 0 and self.rect.right <= block.left + 8 and self.rect.right > block.left - 8 and self.rect.top < block.bottom and self.rect.bottom > block.top:
-                self.rect.right = block.left
+            elif self.vx > 0 and self.rect.right <= block_left + 8 and self.rect.right > block_left - 8 and self.rect.top < block_bottom and self.rect.bottom > block_top:
+                self.rect.right = block_left
                 self.pos_x = self.rect.x
                 self.vx = 0
-            elif self.vx < 0 and self.rect.left >= block.right - 8 and self.rect.left < block.right + 8 and self.rect.top < block.bottom and self.rect.bottom > block.top:
-                self.rect.left = block.right
+            elif self.vx < 0 and self.rect.left >= block_right - 8 and self.rect.left < block_right + 8 and self.rect.top < block_bottom and self.rect.bottom > block_top:
+                self.rect.left = block_right
                 self.pos_x = self.rect.x
                 self.vx = 0
 
@@ -205,21 +205,15 @@ class Player:
             pickup_range = self.ore_pickup_range * TILE_SIZE
             if self.ore_magnet:
                 pickup_range *= 2  # Double pickup range with ore_magnet
-            for ore_item in game.entity_manager.entities["ore_items"][:]:
+            for ore_item in game.entity_manager.nearby("ore_items", self.rect.centerx, self.rect.centery, pickup_range):
                 if ore_item.collected or ore_item.collecting:
                     continue
-                if time.time() - ore_item.creation_time < 0.5:
+                if ore_item.age < 0.5:
                     continue
-                dx = self.rect.centerx - ore_item.rect.centerx
-                dy = self.rect.centery - ore_item.rect.centery
-                distance = (dx ** 2 + dy ** 2) ** 0.5
-                if distance <= pickup_range:
-                    ore_item.collecting = True
-                    ore_item.target_player = self
-                    ore_item.collect_timer = 0.5  # Reset timer for animation
-                    logger.debug(f"Initiated collection animation for {ore_item.ore_type} at distance {distance:.2f}, pos=({ore_item.rect.x}, {ore_item.rect.y})")
-                else:
-                    logger.debug(f"Ore {ore_item.ore_type} at ({ore_item.rect.x}, {ore_item.rect.y}) outside pickup range {pickup_range:.2f}, distance {distance:.2f}")
+                ore_item.collecting = True
+                ore_item.target_player = self
+                ore_item.collect_timer = 0.5  # Reset timer for animation
+                logger.debug("Initiated collection animation for %s, pos=(%s, %s)", ore_item.ore_type, ore_item.rect.x, ore_item.rect.y)
 
         # Update position constraints
         self.pos_x = max(0, min(self.pos_x, NUM_COLS * TILE_SIZE - self.rect.width))
@@ -0,0 +1,150 @@
+import csv
+import json
+import time
+import pygame
+from collections import deque
+from settings import PROFILER_WINDOW, PROFILER_TRACE, PROFILER_TRACE_BATCH, WIDTH, FPS
+from log_config import get_logger
+
+# Configure logging (Pyodide-compatible)
+logger = get_logger(__name__)
+
+SECTIONS = ["events", "update", "world", "entities", "draw_dirty", "draw_world", "draw_entities", "draw_ui", "flip"]
+
+class Section:
+    """Context manager adding the time spent inside it to one profiler section."""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+class FrameProfiler:
+    """Per-subsystem frame timings with rolling percentiles, an overlay and an optional trace file."""
+    def __init__(self, window=PROFILER_WINDOW, trace_path=PROFILER_TRACE, trace_batch=PROFILER_TRACE_BATCH):
+        self.window = window
+        self.trace_path = trace_path
+        self.trace_batch = trace_batch
+        self.sections = {name: Section(self, name) for name in SECTIONS}
+        self.current = {}  # Section: seconds spent in it this frame
+        self.history = {name: deque(maxlen=window) for name in SECTIONS}
+        self.frames = deque(maxlen=window)  # Whole frame times in seconds
+        self.trace = [] if trace_path else None  # Frames not yet appended to the trace file
+        self.trace_file = None  # Opened by the first flush
+        self.trace_writer = None  # CSV writer, or None for a JSON trace
+        self.traced = 0  # Frames written to the trace file so far
+        self.frame_start = time.perf_counter()
+
+    def section(self, name):
+        """Get the timer for a section, for use in a with block."""
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = Section(self, name)
+            self.history[name] = deque(maxlen=self.window)
+        return section
+
+    def end_frame(self):
+        """Close the current frame, moving its section times into the rolling history."""
+        now = time.perf_counter()
+        frame_time = now - self.frame_start
+        self.frame_start = now
+        self.frames.append(frame_time)
+        for name, samples in self.history.items():
+            samples.append(self.current.get(name, 0.0))
+        if self.trace is not None:
+            self.trace.append({"frame": frame_time, **self.current})
+            if len(self.trace) >= self.trace_batch:
+                self.flush_trace()
+        self.current = {}
+
+    def percentiles(self, samples):
+        """Get the p50, p95 and p99 of a sample window, in milliseconds."""
+        if not samples:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return tuple(ordered[int(last * q + 0.5)] * 1000 for q in (0.5, 0.95, 0.99))
+
+    def summary(self):
+        """Get {name: (p50, p95, p99)} for whole frames and every section."""
+        stats = {"frame": self.percentiles(self.frames)}
+        for name, samples in self.history.items():
+            stats[name] = self.percentiles(samples)
+        return stats
+
+    def draw(self, screen, text):
+        """Draw the percentile table and a frame-time graph in the top-right corner."""
+        width, line_height = 300, text.font.get_height()
+        stats = self.summary()
+        graph_height = 60
+        panel = pygame.Surface((width, line_height * (len(stats) + 1) + graph_height + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        columns = (170, 225, 280)  # Right edges of the p50, p95 and p99 columns
+        panel.blit(text.render("ms", True, (200, 200, 200)), (6, 4))
+        for label, right in zip(("p50", "p95", "p99"), columns):
+            header = text.render(label, True, (200, 200, 200))
+            panel.blit(header, (right - header.get_width(), 4))
+        for i, (name, values) in enumerate(stats.items(), 1):
+            y = 4 + i * line_height
+            panel.blit(text.render(name, True, (255, 255, 255)), (6, y))
+            for value, right in zip(values, columns):
+                number = text.render_changing(f"{value:.1f}", True, (255, 255, 255))
+                panel.blit(number, (right - number.get_width(), y))
+        # Frame times, one column per frame, with the frame budget as a reference line
+        top = panel.get_height() - graph_height - 4
+        budget = 1.0 / FPS
+        scale = graph_height / (2 * budget)
+        for x, frame_time in enumerate(list(self.frames)[-(width - 12):]):
+            height = min(graph_height, int(frame_time * scale))
+            color = (0, 200, 0) if frame_time <= budget else (230, 60, 60)
+            pygame.draw.line(panel, color, (6 + x, top + graph_height), (6 + x, top + graph_height - height))
+        pygame.draw.line(panel, (255, 255, 0), (6, top + graph_height // 2), (width - 6, top + graph_height // 2))
+        screen.blit(panel, (WIDTH - width - 10, 10))
+
+    def flush_trace(self):
+        """Append the buffered frames to the CSV or JSON trace, picked by the file extension."""
+        if not self.trace:
+            return
+        if self.trace_file is None:
+            columns = ["frame"] + list(self.history)  # Sections first timed after this are only kept in JSON traces
+            try:
+                self.trace_file = open(self.trace_path, "w", newline="")
+            except OSError as e:
+                logger.error("Failed to open profiler trace %s: %s", self.trace_path, e)
+                self.trace = None
+                return
+            if self.trace_path.endswith(".json"):
+                self.trace_file.write('{"columns": %s, "frames": [' % json.dumps(columns))
+            else:
+                self.trace_writer = csv.DictWriter(self.trace_file, fieldnames=columns, restval=0.0, extrasaction="ignore")
+                self.trace_writer.writeheader()
+        if self.trace_writer is not None:
+            self.trace_writer.writerows(self.trace)
+        else:
+            self.trace_file.write(("," if self.traced else "") + ",".join(json.dumps(row) for row in self.trace))
+        self.traced += len(self.trace)
+        self.trace.clear()
+
+    def dump(self):
+        """Write the frames still buffered and close the trace; JSON traces end with the percentile summary."""
+        if self.trace is None:
+            return
+        self.flush_trace()
+        if self.trace_file is None:
+            return
+        if self.trace_writer is None:
+            self.trace_file.write('], "summary": %s}' % json.dumps(self.summary()))
+        self.trace_file.close()
+        self.trace_file = None
+        self.trace = None
+        logger.info("Wrote %s profiled frames to %s", self.traced, self.trace_path)
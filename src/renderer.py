@@ -1,16 +1,17 @@
 import pygame
-import logging
 import settings
 from data import load_ores
 import random
+import math
+from collections import OrderedDict
+from log_config import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 logger.info("Initializing renderer.py")
 
+# Attributes that change how an entity looks without moving it, compared between dirty-rect frames
+LOOK_FIELDS = ("active", "collected", "age", "timer", "warning_timer", "count")
+
 class Renderer:
     def __init__(self, screen, settings_module):
         """Initialize the renderer with the screen and settings."""
@@ -36,37 +37,98 @@ class Renderer:
             2: (100, 100, 100, 100),  # Medium cracks for stage 2
             3: (100, 100, 100, 150)  # Heavy cracks for stage 3
         }
+        self.crack_surfaces = {}
+        for stage, (r, g, b, alpha) in self.crack_overlays.items():
+            overlay = pygame.Surface((self.settings.TILE_SIZE, self.settings.TILE_SIZE))
+            overlay.set_alpha(alpha)
+            overlay.fill((r, g, b))
+            self.crack_surfaces[stage] = overlay
+        self.chunk_surfaces = OrderedDict()  # (chunk_x, chunk_y): (revision, surface), least recently drawn first
+        self.chunk_surface_world = None  # World the cached surfaces were rendered from
+        self.dirty_rects = self.settings.DIRTY_RECT_RENDERING
+        self.dirty_offset = None  # Camera offset of the last dirty-rect frame; None forces a full redraw
+        self.dirty_sprites = {}  # Key of each entity, rock and player drawn last frame: (screen bounds, look)
+        self.hud_layer = None  # Transparent surface holding the HUD in dirty-rect mode, redrawn only when it changes
+        self.hud_parts = {}  # Key of each HUD part in the layer: (signature, screen rect)
         logger.info("Renderer initialized")
 
+    def block_color(self, block):
+        """Get the fill color for a block type."""
+        return self.ores.get(block, {}).get("color", self.block_colors.get(block, (255, 255, 255)))
+
+    def render_chunk(self, world, chunk_x, chunk_y):
+        """Pre-render a chunk's tiles and mining cracks onto a single surface."""
+        tile = self.settings.TILE_SIZE
+        size = world.chunk_size
+        surface = pygame.Surface((size * tile, size * tile))
+        surface.fill((0, 0, 0))  # Matches the screen clear behind empty tiles
+        chunk = world.get_chunk(chunk_x, chunk_y)
+        empty_id = world.block_ids["empty"]
+        colors = {}
+        for local_y in range(size):
+            y = chunk_y * size + local_y
+            if y >= self.settings.MAX_DEPTH:
+                break
+            for local_x in range(size):
+                block_id = chunk[local_y * size + local_x]
+                if not block_id or block_id == empty_id:
+                    continue
+                color = colors.get(block_id)
+                if color is None:
+                    color = colors[block_id] = self.block_color(world.block_palette[block_id])
+                surface.fill(color, (local_x * tile, local_y * tile, tile, tile))
+                # Draw mining progress cracks
+                block_state = world.get_block_state(chunk_x * size + local_x, y)
+                if block_state > 0 and block_state in self.crack_surfaces:
+                    surface.blit(self.crack_surfaces[block_state], (local_x * tile, local_y * tile))
+        return surface
+
+    def visible_chunks(self, world, camera_x, camera_y):
+        """Get the (chunk_x, chunk_y) keys of chunks that overlap the screen."""
+        chunk_px = world.chunk_size * self.settings.TILE_SIZE
+        start_x = max(0, int(camera_x // chunk_px))
+        end_x = min((self.settings.NUM_COLS - 1) // world.chunk_size, int((camera_x + self.settings.WIDTH) // chunk_px))
+        start_y = max(0, int(camera_y // chunk_px))
+        end_y = min((self.settings.MAX_DEPTH - 1) // world.chunk_size, int((camera_y + self.settings.HEIGHT) // chunk_px))
+        return [(chunk_x, chunk_y) for chunk_y in range(start_y, end_y + 1) for chunk_x in range(start_x, end_x + 1)]
+
+    def chunk_surfaces_on_screen(self, world, camera_x, camera_y, rerendered=None):
+        """Get (surface, screen position) for the visible chunks, re-rendering any edited since they were cached.
+
+        The screen rects of re-rendered chunks are appended to rerendered when it is given.
+        """
+        if world is not self.chunk_surface_world:
+            self.chunk_surfaces.clear()
+            self.chunk_surface_world = world
+        chunk_px = world.chunk_size * self.settings.TILE_SIZE
+        # Tile positions truncate the same way per-tile drawing did for on-screen tiles
+        offset_x = math.ceil(camera_x)
+        offset_y = math.ceil(camera_y)
+
+        surfaces = []
+        for chunk_x, chunk_y in self.visible_chunks(world, camera_x, camera_y):
+            key = (chunk_x, chunk_y)
+            revision = world.chunk_revision(chunk_x, chunk_y)
+            cached = self.chunk_surfaces.get(key)
+            if cached is None or cached[0] != revision:
+                cached = (revision, self.render_chunk(world, chunk_x, chunk_y))
+                self.chunk_surfaces[key] = cached
+                if rerendered is not None:
+                    rerendered.append(pygame.Rect(chunk_x * chunk_px - offset_x, chunk_y * chunk_px - offset_y, chunk_px, chunk_px))
+            self.chunk_surfaces.move_to_end(key)
+            surfaces.append((cached[1], (chunk_x * chunk_px - offset_x, chunk_y * chunk_px - offset_y)))
+        while len(self.chunk_surfaces) > self.settings.CHUNK_SURFACE_CACHE_SIZE:
+            self.chunk_surfaces.popitem(last=False)
+        return surfaces
+
     def draw_world(self, world, camera_x, camera_y):
-        """Draw the game world with camera offset, rendering only visible tiles."""
-        start_x = max(0, int(camera_x // self.settings.TILE_SIZE))
-        end_x = min(self.settings.NUM_COLS, int((camera_x + self.settings.WIDTH) // self.settings.TILE_SIZE) + 1)
-        start_y = max(0, int(camera_y // self.settings.TILE_SIZE))
-        end_y = min(self.settings.MAX_DEPTH, int((camera_y + self.settings.HEIGHT) // self.settings.TILE_SIZE) + 1)
-
-        for x in range(start_x, end_x):
-            for y in range(start_y, end_y):
-                block = world.block_at(x, y)
-                if block and block != "empty":
-                    screen_x = x * self.settings.TILE_SIZE - camera_x
-                    screen_y = y * self.settings.TILE_SIZE - camera_y
-                    color = self.ores.get(block, {}).get("color", self.block_colors.get(block, (255, 255, 255)))
-                    pygame.draw.rect(
-                        self.screen,
-                        color,
-                        (screen_x, screen_y, self.settings.TILE_SIZE, self.settings.TILE_SIZE)
-                    )
-                    # Draw mining progress cracks
-                    block_state = world.get_block_state(x, y)
-                    if block_state > 0:
-                        overlay = pygame.Surface((self.settings.TILE_SIZE, self.settings.TILE_SIZE))
-                        overlay.set_alpha(self.crack_overlays.get(block_state, (0, 0, 0, 0))[3])
-                        overlay.fill(self.crack_overlays.get(block_state, (0, 0, 0, 0))[:3])
-                        self.screen.blit(overlay, (screen_x, screen_y))
-
-        # Draw falling rocks
-        for rock in world.falling_rocks:
+        """Draw the game world with camera offset, blitting cached surfaces of the visible chunks."""
+        self.screen.blits(self.chunk_surfaces_on_screen(world, camera_x, camera_y), doreturn=False)
+        self.draw_falling_rocks(world.falling_rocks, camera_x, camera_y)
+
+    def draw_falling_rocks(self, rocks, camera_x, camera_y):
+        """Draw the active falling rocks with camera offset."""
+        for rock in rocks:
             if rock.active:
                 screen_x = rock.x - camera_x
                 screen_y = rock.y - camera_y
@@ -117,37 +179,59 @@ class Renderer:
             pygame.draw.rect(self.screen, (0, 255, 0), (screen_x, screen_y - 10, health_width, 5))  # Green fill
             pygame.draw.rect(self.screen, self.settings.WHITE, (screen_x, screen_y - 10, remote_player.rect.width, 5), 1)  # White border
 
-        logger.debug("Rendered local and remote players")
-
     def draw_ore_scanner(self, ore_scanner, camera_x, camera_y):
         """Draw the ore scanner effect."""
         ore_scanner.draw(self.screen, camera_x, camera_y)
 
-    def draw_ui(self, ui, game):
+    def notification_text(self, game):
+        """Get the inventory-full and ore-collected notifications as UI.hud_text entries."""
+        entries = []
+        if game.inventory_full_notification:
+            entries.append((game.inventory_full_notification, (255, 100, 100), None, self.settings.HEIGHT - 150, False))
+        if game.ore_collect_notification:
+            entries.append((game.ore_collect_notification, (0, 255, 0), None, self.settings.HEIGHT - 100, False))
+        return entries
+
+    def draw_notifications(self, game, surface=None):
+        """Draw the inventory-full and ore-collected notifications."""
+        game.ui.draw_text(self.screen if surface is None else surface, self.notification_text(game))
+
+    def draw_ui(self, ui, game, surface=None):
         """Draw the UI elements, including mining fatigue and progress bars."""
-        ui.draw(self.screen, game)
+        surface = self.screen if surface is None else surface
+        ui.draw(surface, game)
+        self.draw_fatigue_bar(ui, game, surface)
+        self.draw_mining_progress(game, surface)
 
-        # Draw mining fatigue bar
+    def draw_fatigue_bar(self, ui, game, surface):
+        """Draw the mining fatigue bar while there is any fatigue."""
         if game.mining_fatigue > 0:
-            pygame.draw.rect(self.screen, (200, 0, 0), (10, self.settings.HEIGHT - 110, 100, 10))  # Red background
-            pygame.draw.rect(self.screen, (255, 165, 0), (10, self.settings.HEIGHT - 110, 100 * game.mining_fatigue, 10))  # Orange fill
-            pygame.draw.rect(self.screen, self.settings.WHITE, (10, self.settings.HEIGHT - 110, 100, 10), 2)  # White border
-            fatigue_text = ui.font.render("Fatigue", True, self.settings.WHITE)
-            self.screen.blit(fatigue_text, (10, self.settings.HEIGHT - 130))
-            logger.debug(f"Rendered fatigue bar: {game.mining_fatigue:.2f}")
-
-        # Draw mining progress bar above targeted block
-        if game.mining and game.mine_target:
-            tx, ty = game.mine_target
-            screen_x = tx * self.settings.TILE_SIZE - game.camera_x
-            screen_y = ty * self.settings.TILE_SIZE - game.camera_y
-            if 0 <= screen_x < self.settings.WIDTH and 0 <= screen_y < self.settings.HEIGHT:
-                pygame.draw.rect(self.screen, (50, 50, 50), (screen_x, screen_y - 10, self.settings.TILE_SIZE, 5))  # Dark gray background
-                pygame.draw.rect(self.screen, (0, 255, 0), (screen_x, screen_y - 10, self.settings.TILE_SIZE * game.mining_progress, 5))  # Green fill
-                pygame.draw.rect(self.screen, self.settings.WHITE, (screen_x, screen_y - 10, self.settings.TILE_SIZE, 5), 1)  # White border
-                logger.debug(f"Rendered mining progress bar at ({tx}, {ty}): {game.mining_progress:.2f}")
-
-        logger.debug("UI rendered with fatigue and progress bars")
+            pygame.draw.rect(surface, (200, 0, 0), (10, self.settings.HEIGHT - 110, 100, 10))  # Red background
+            pygame.draw.rect(surface, (255, 165, 0), (10, self.settings.HEIGHT - 110, 100 * game.mining_fatigue, 10))  # Orange fill
+            pygame.draw.rect(surface, self.settings.WHITE, (10, self.settings.HEIGHT - 110, 100, 10), 2)  # White border
+            fatigue_text = ui.text.render("Fatigue", True, self.settings.WHITE)
+            surface.blit(fatigue_text, (10, self.settings.HEIGHT - 130))
+            logger.debug("Rendered fatigue bar: %.2f", game.mining_fatigue)
+
+    def mining_progress_rect(self, game):
+        """Get the screen rect of the mining progress bar, or None when it isn't shown."""
+        if not (game.mining and game.mine_target):
+            return None
+        tx, ty = game.mine_target
+        screen_x = tx * self.settings.TILE_SIZE - game.camera_x
+        screen_y = ty * self.settings.TILE_SIZE - game.camera_y
+        if 0 <= screen_x < self.settings.WIDTH and 0 <= screen_y < self.settings.HEIGHT:
+            return pygame.Rect(screen_x, screen_y - 10, self.settings.TILE_SIZE, 5)
+        return None
+
+    def draw_mining_progress(self, game, surface):
+        """Draw the mining progress bar above the targeted block."""
+        rect = self.mining_progress_rect(game)
+        if rect is not None:
+            pygame.draw.rect(surface, (50, 50, 50), rect)  # Dark gray background
+            pygame.draw.rect(surface, (0, 255, 0), (rect.x, rect.y, self.settings.TILE_SIZE * game.mining_progress, 5))  # Green fill
+            pygame.draw.rect(surface, self.settings.WHITE, rect, 1)  # White border
+            logger.debug("Rendered mining progress bar at %s: %.2f", game.mine_target, game.mining_progress)
 
     def apply_effects(self, shake_timer, shake_intensity, flash_timer, flash_color):
         """Apply screen shake and flash effects."""
@@ -159,4 +243,165 @@ class Renderer:
             overlay = pygame.Surface((self.settings.WIDTH, self.settings.HEIGHT))
             overlay.set_alpha(int(255 * flash_timer / 0.2))
             overlay.fill(flash_color)
-            self.screen.blit(overlay, (0, 0))
\ No newline at end of file
+            self.screen.blit(overlay, (0, 0))
+
+    def invalidate_dirty(self):
+        """Force the next dirty-rect frame to redraw the whole screen."""
+        self.dirty_offset = None
+
+    def entity_bounds(self, entity, offset_x, offset_y):
+        """Get a screen rect that safely covers everything an entity draws."""
+        tile = self.settings.TILE_SIZE
+        rect = getattr(entity, "rect", None)
+        if rect is not None:
+            return rect.move(-offset_x, -offset_y).inflate(2 * tile, 2 * tile)  # Room for pulsing and health bars
+        radius = int(getattr(entity, "radius", tile // 4))
+        return pygame.Rect(int(entity.x) - offset_x - radius - 2, int(entity.y) - offset_y - radius - 2, 2 * radius + 8, 2 * radius + 8)
+
+    def merge_dirty(self, rects):
+        """Snap dirty rects to the DIRTY_CELL_SIZE grid and merge them into non-overlapping rects."""
+        cell = self.settings.DIRTY_CELL_SIZE
+        screen_rect = self.screen.get_rect()
+        rows = {}
+        for rect in rects:
+            rect = rect.clip(screen_rect)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            columns = range(rect.left // cell, (rect.right - 1) // cell + 1)
+            for row in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                rows.setdefault(row, set()).update(columns)
+        merged = []
+        open_runs = {}  # (first column, last column): rect growing downwards
+        for row in sorted(rows):
+            columns = sorted(rows[row])
+            runs = []
+            start = previous = columns[0]
+            for column in columns[1:]:
+                if column != previous + 1:
+                    runs.append((start, previous))
+                    start = column
+                previous = column
+            runs.append((start, previous))
+            next_runs = {}
+            for run in runs:
+                rect = open_runs.get(run)
+                if rect is not None and rect.bottom == row * cell:
+                    rect.height += cell
+                else:
+                    rect = pygame.Rect(run[0] * cell, row * cell, (run[1] - run[0] + 1) * cell, cell)
+                    merged.append(rect)
+                next_runs[run] = rect
+            open_runs = next_runs
+        return [rect.clip(screen_rect) for rect in merged]
+
+    def hud_signatures(self, game):
+        """Get {part key: signature} for everything the HUD shows while playing, compared instead of its pixels."""
+        ui = game.ui
+        entries = ui.hud_text(game) + ui.prompt_text(game) + self.notification_text(game)
+        signatures = {("text", i): entry[:4] for i, entry in enumerate(entries)}
+        health_percent, quota_percent = ui.hud_bars(game)
+        # Bar widths in whole pixels, truncated the way pygame truncates them
+        fatigue = int(100 * game.mining_fatigue) if game.mining_fatigue > 0 else None
+        signatures["bars"] = (int(100 * health_percent), int(100 * quota_percent), fatigue)
+        return signatures
+
+    def hud_rect(self, ui, key, signature):
+        """Get the screen rect a HUD part covers."""
+        if key == "bars":
+            label_width, label_height = ui.font.size("Fatigue")
+            return pygame.Rect(10, self.settings.HEIGHT - 130, 100, 100).union((10, self.settings.HEIGHT - 130, label_width, label_height))
+        text, color, x, y = signature
+        width, height = ui.font.size(text)
+        if x is None:
+            x = self.settings.WIDTH // 2 - width // 2
+        return pygame.Rect(x, y, width, height)
+
+    def sprite_looks(self, game, offset_x, offset_y):
+        """Get {key: (screen bounds, look)} for everything drawn over the world that can move or change."""
+        tile = self.settings.TILE_SIZE
+        looks = {}
+        now = game.clock.now()
+        for group in game.entity_manager.entities.values():
+            for entity in group:
+                look = tuple(getattr(entity, field, None) for field in LOOK_FIELDS)
+                if getattr(entity, "count", 0):
+                    look += (now,)  # Live particles fade every step, even where they barely move
+                looks[id(entity)] = (self.entity_bounds(entity, offset_x, offset_y), look)
+        for rock in game.world.falling_rocks:
+            if rock.active:
+                looks[id(rock)] = (pygame.Rect(int(rock.x) - offset_x, int(rock.y) - offset_y, tile, tile).inflate(4, 4), ())
+        for player in game.players:
+            looks[id(player)] = (player.rect.move(-offset_x, -offset_y).inflate(tile, tile), (player.health, player.max_health))
+        for remote in game.remote_players.values():
+            looks[id(remote)] = (remote.rect.move(-offset_x, -offset_y).inflate(tile, tile), (remote.x, remote.y, remote.health))
+        rect = self.mining_progress_rect(game)
+        if rect is not None:
+            looks["mining_progress"] = (rect, (int(tile * game.mining_progress),))
+        return looks
+
+    def draw_dirty_frame(self, game):
+        """Redraw only the screen regions that changed since the last frame and push them to the display."""
+        world = game.world
+        camera_x, camera_y = game.camera_x, game.camera_y
+        offset = (math.ceil(camera_x), math.ceil(camera_y))
+        full = offset != self.dirty_offset or world is not self.chunk_surface_world
+        screen = self.screen
+        screen_rect = screen.get_rect()
+        dirty = []
+
+        # HUD parts whose text or bar widths changed; the HUD layer is only redrawn when one did
+        hud_parts = {}
+        for key, signature in self.hud_signatures(game).items():
+            previous = self.hud_parts.get(key)
+            if previous is not None and previous[0] == signature:
+                hud_parts[key] = previous
+                continue
+            hud_parts[key] = (signature, self.hud_rect(game.ui, key, signature))
+            dirty.append(hud_parts[key][1])
+            if previous is not None:
+                dirty.append(previous[1])
+        dirty.extend(rect for key, (signature, rect) in self.hud_parts.items() if key not in hud_parts)
+        self.hud_parts = hud_parts
+        if dirty or self.hud_layer is None or self.hud_layer.get_size() != screen.get_size():
+            if self.hud_layer is None or self.hud_layer.get_size() != screen.get_size():
+                self.hud_layer = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            self.hud_layer.fill((0, 0, 0, 0))
+            self.draw_notifications(game, self.hud_layer)
+            game.ui.draw(self.hud_layer, game)
+            self.draw_fatigue_bar(game.ui, game, self.hud_layer)
+        else:
+            game.ui.update_lobby_message()
+
+        # Entities, rocks and players are redrawn where they were and where they are, but only if they moved or changed
+        looks = self.sprite_looks(game, *offset)
+        for key, look in looks.items():
+            previous = self.dirty_sprites.get(key)
+            if previous != look:
+                dirty.append(look[0])
+                if previous is not None:
+                    dirty.append(previous[0])
+        dirty.extend(look[0] for key, look in self.dirty_sprites.items() if key not in looks)
+        self.dirty_sprites = looks
+
+        # Chunks edited since their surface was cached
+        surfaces = self.chunk_surfaces_on_screen(world, camera_x, camera_y, dirty)
+
+        rects = [screen_rect] if full else self.merge_dirty(dirty)
+        self.dirty_offset = offset
+        if not rects:
+            return
+        groups = game.entity_manager.entities.values()
+        for rect in rects:
+            screen.set_clip(rect)
+            screen.fill((0, 0, 0), rect)
+            screen.blits([(surface, position) for surface, position in surfaces if rect.colliderect(surface.get_rect(topleft=position))], doreturn=False)
+            self.draw_falling_rocks([rock for rock in world.falling_rocks if rock.active and rect.colliderect(looks[id(rock)][0])], camera_x, camera_y)
+            self.draw_entities([[entity for entity in group if rect.colliderect(looks[id(entity)][0])] for group in groups], camera_x, camera_y)
+            self.draw_players(game.players, game.remote_players, camera_x, camera_y)
+            screen.blit(self.hud_layer, rect, rect)
+        screen.set_clip(None)
+        self.draw_mining_progress(game, screen)  # Opaque, so drawing it again where nothing changed is harmless
+        if full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
@@ -1,14 +1,10 @@
 import json
 import os
-import logging
-from settings import BASE_DIR, DAY_DURATION
+from settings import BASE_DIR, DAY_DURATION, WORLDGEN_VERSION
+from log_config import get_logger
 
 # Configure logging (Pyodide-compatible)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 logger.info("Initializing save_load.py")
 
 def save_game(player, world, day, quota, cash_earned_today, upgrades_cfg, time_left):
@@ -35,11 +31,10 @@ def save_game(player, world, day, quota, cash_earned_today, upgrades_cfg, time_l
             "blaster": player.blaster,
             "quantum_pickaxe": player.quantum_pickaxe,
             "shield_generator": player.shield_generator,
-            "active_effects": {
+            "active_effects": {  # Remaining seconds, since end_time is relative to this session's clock
                 effect: {
                     "active": data["active"],
-                    "duration": data["duration"],
-                    "start_time": data["start_time"]
+                    "remaining": max(0.0, data["end_time"] - player.clock.now()) if data["active"] else 0.0
                 } for effect, data in player.active_effects.items()
             },
             "quota_buffer": player.quota_buffer,
@@ -49,7 +44,9 @@ def save_game(player, world, day, quota, cash_earned_today, upgrades_cfg, time_l
             "cash_multiplier": player.cash_multiplier
         },
         "world": {
-            "block_cols": {f"{x},{y}": block_type for (x, y), block_type in world.block_cols.items()}
+            "seed": world.seed,
+            "generator": WORLDGEN_VERSION,
+            "block_edits": {f"{x},{y}": block_type for (x, y), block_type in world.iter_block_edits()}
         },
         "game": {
             "day": day,
@@ -80,16 +77,16 @@ def save_game(player, world, day, quota, cash_earned_today, upgrades_cfg, time_l
             json.dump(save_data, f, indent=4)
         logger.info("Game saved successfully")
     except Exception as e:
-        logger.error(f"Failed to save game: {e}")
+        logger.error("Failed to save game: %s", e)
 
 def load_game(player, upgrades_cfg):
     if os.environ.get("PYODIDE"):
         logger.warning("Loading not supported in Pyodide environment")
-        return None, 1, 200, 0, DAY_DURATION
+        return None, None, 1, 200, 0, DAY_DURATION
     save_path = os.path.join(BASE_DIR, "savegame.json")
     if not os.path.exists(save_path):
         logger.info("No save file found, starting new game")
-        return None, 1, 200, 0, DAY_DURATION
+        return None, None, 1, 200, 0, DAY_DURATION
 
     try:
         with open(save_path, "r") as f:
@@ -117,17 +114,28 @@ def load_game(player, upgrades_cfg):
         player.blaster = player_data.get("blaster", False)
         player.quantum_pickaxe = player_data.get("quantum_pickaxe", False)
         player.shield_generator = player_data.get("shield_generator", False)
-        player.active_effects = player_data.get("active_effects", {})
+        now = player.clock.now()
+        for effect, saved in player_data.get("active_effects", {}).items():
+            # Saves from before the game clock stored the remaining seconds as duration
+            remaining = saved.get("remaining", saved.get("duration", 0.0))
+            player.active_effects[effect] = {"active": saved.get("active", False), "end_time": now + remaining}
         player.quota_buffer = player_data.get("quota_buffer", 0)
         player.day_extension = player_data.get("day_extension", 0)
         player.efficiency_boost = player_data.get("efficiency_boost", 1.0)
         player.ore_scanner = player_data.get("ore_scanner", False)
         player.cash_multiplier = player_data.get("cash_multiplier", 1.0)
 
-        # Load world data
-        block_cols = {
+        # Load world data (saves before the edit journal stored every generated tile as block_cols)
+        world_data = data.get("world", {})
+        world_seed = world_data.get("seed")
+        if "block_edits" in world_data and world_data.get("generator") != WORLDGEN_VERSION:
+            # Journals from before per-chunk seeding (or from another generator) only hold the edits,
+            # so the untouched terrain around them regenerates differently from what was saved
+            logger.warning("Save was made by world generator %s, not %s; terrain outside edited tiles will differ",
+                           world_data.get("generator"), WORLDGEN_VERSION)
+        block_edits = {
             tuple(map(int, k.split(","))): v
-            for k, v in data.get("world", {}).get("block_cols", {}).items()
+            for k, v in world_data.get("block_edits", world_data.get("block_cols", {})).items()
         }
 
         # Load game data
@@ -160,13 +168,13 @@ def load_game(player, upgrades_cfg):
         ]
 
         logger.info("Game state loaded successfully")
-        return block_cols, day, quota, cash_earned_today, time_left
+        return block_edits, world_seed, day, quota, cash_earned_today, time_left
 
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to load save file due to JSON error: {e}")
+        logger.error("Failed to load save file due to JSON error: %s", e)
         logger.info("Starting new game due to corrupted save file")
-        return None, 1, 200, 0, DAY_DURATION
+        return None, None, 1, 200, 0, DAY_DURATION
     except Exception as e:
-        logger.error(f"Unexpected error loading save file: {e}")
+        logger.error("Unexpected error loading save file: %s", e)
         logger.info("Starting new game due to save file error")
-        return None, 1, 200, 0, DAY_DURATION
\ No newline at end of file
+        return None, None, 1, 200, 0, DAY_DURATION
\ No newline at end of file
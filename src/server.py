@@ -1,21 +1,21 @@
 import asyncio
 import websockets
 import json
-import logging
 import random
 import string
-import time
 from datetime import datetime
-from settings import TILE_SIZE, NUM_COLS, MAX_DEPTH, QUOTA_BASE, QUOTA_INCREASE, DAY_DURATION
+from settings import TILE_SIZE, NUM_COLS, MAX_DEPTH, QUOTA_BASE, QUOTA_INCREASE, DAY_DURATION, TIME_SCALE, EARTHQUAKE_DEPTH
+from clock import GameClock
+from log_config import get_logger
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+logger = get_logger(__name__)
 
 # Game state
 LOBBIES = {}  # {lobby_code: {players: {player_id: {...}}, world_state: {}, entities: {}, seed: int, day: int, quota: float, cash_earned_today: float, day_start_time: float, time_left: float, ores_mined: int, diamonds_mined: int, milestones: dict}}
 PLAYERS = {}  # {player_id: {websocket, lobby_code, x, y, health, inventory, ore_slots, cash, upgrades, pick_index, pick_speed, active_effects, mining_speed_boost, jump_boost, aoe_mining, rock_damage_reduction, lucky_miner, ore_magnet, ore_pickup_range, melee_upgrade, blaster, quantum_pickaxe, shield_generator, max_ore_slots, day_extension, quota_buffer}}
 entity_id_counter = 0
+CLOCK = GameClock(scale=TIME_SCALE)  # Shared simulation time for every lobby
 
 def generate_lobby_code():
     """Generate a unique 4-character lobby code."""
@@ -51,16 +51,16 @@ async def handler(websocket, path=None):
         "max_ore_slots": 9,
         "day_extension": 0.0,
         "quota_buffer": 0.0,
-        "last_update": time.time()
+        "last_update": CLOCK.now()
     }
-    logger.info(f"{player_id} connected at {datetime.now()}")
+    logger.info("%s connected at %s", player_id, datetime.now())
 
     try:
         async for message in websocket:
             try:
                 data = json.loads(message)
                 action = data.get("action")
-                logger.debug(f"Received action from {player_id}: {action}")
+                logger.debug("Received action from %s: %s", player_id, action)
 
                 if action == "create_lobby":
                     lobby_code = generate_lobby_code()
@@ -74,7 +74,7 @@ async def handler(websocket, path=None):
                         "day": 1,
                         "quota": QUOTA_BASE,
                         "cash_earned_today": 0.0,
-                        "day_start_time": time.time(),
+                        "day_start_time": CLOCK.now(),
                         "time_left": DAY_DURATION,
                         "ores_mined": 0,
                         "diamonds_mined": 0,
@@ -97,7 +97,7 @@ async def handler(websocket, path=None):
                         "quota": LOBBIES[lobby_code]["quota"],
                         "time_left": LOBBIES[lobby_code]["time_left"]
                     }))
-                    logger.info(f"{player_id} created lobby {lobby_code}")
+                    logger.info("%s created lobby %s", player_id, lobby_code)
 
                 elif action == "join_lobby":
                     lobby_code = data.get("lobby_code").upper()
@@ -123,17 +123,17 @@ async def handler(websocket, path=None):
                             "y": PLAYERS[player_id]["y"],
                             "health": PLAYERS[player_id]["health"]
                         }, exclude=player_id)
-                        logger.info(f"{player_id} joined lobby {lobby_code}")
+                        logger.info("%s joined lobby %s", player_id, lobby_code)
                     else:
                         await websocket.send(json.dumps({"type": "error", "message": "Invalid lobby code"}))
-                        logger.warning(f"{player_id} attempted to join invalid lobby {lobby_code}")
+                        logger.warning("%s attempted to join invalid lobby %s", player_id, lobby_code)
 
                 elif action == "update_position":
                     lobby_code = PLAYERS[player_id]["lobby_code"]
                     if lobby_code and is_valid_position(data.get("x"), data.get("y")):
                         PLAYERS[player_id]["x"] = data["x"]
                         PLAYERS[player_id]["y"] = data["y"]
-                        PLAYERS[player_id]["last_update"] = time.time()
+                        PLAYERS[player_id]["last_update"] = CLOCK.now()
                         await broadcast_to_lobby(lobby_code, {
                             "type": "player_update",
                             "id": player_id,
@@ -160,7 +160,17 @@ async def handler(websocket, path=None):
                             "block_y": block_y
                         })
                         await check_milestones(lobby_code, player_id)
-                        logger.info(f"{player_id} mined block {block_type} at ({block_x}, {block_y}) in lobby {lobby_code}")
+                        logger.info("%s mined block %s at (%s, %s) in lobby %s", player_id, block_type, block_x, block_y, lobby_code)
+
+                elif action == "mine_region":
+                    lobby_code = PLAYERS[player_id]["lobby_code"]
+                    if lobby_code:
+                        tiles = [(bx, by) for bx, by in data["tiles"] if is_valid_mining(player_id, bx, by)]
+                        cleared = clear_tiles(lobby_code, tiles)
+                        if cleared:
+                            await broadcast_to_lobby(lobby_code, {"type": "region_mined", "tiles": cleared})
+                            await check_milestones(lobby_code, player_id)
+                        logger.info("%s mined %s blocks in lobby %s", player_id, len(cleared), lobby_code)
 
                 elif action == "collect_ore":
                     lobby_code = PLAYERS[player_id]["lobby_code"]
@@ -179,7 +189,7 @@ async def handler(websocket, path=None):
                                 "player_id": player_id,
                                 "cash_earned": total_value
                             })
-                            logger.info(f"{player_id} collected ore {ore_id} worth ${total_value:.2f} in lobby {lobby_code}")
+                            logger.info("%s collected ore %s worth $%.2f in lobby %s", player_id, ore_id, total_value, lobby_code)
 
                 elif action == "use_item":
                     lobby_code = PLAYERS[player_id]["lobby_code"]
@@ -187,23 +197,10 @@ async def handler(websocket, path=None):
                     if lobby_code and is_valid_item_use(player_id, item_id):
                         player = PLAYERS[player_id]
                         if item_id == "dynamite":
-                            for dx in range(-5, 6):
-                                for dy in range(-5, 6):
-                                    bx = int(player["x"] // TILE_SIZE + dx)
-                                    by = int(player["y"] // TILE_SIZE + dy)
-                                    if 0 <= bx < NUM_COLS and 0 <= by < MAX_DEPTH:
-                                        block_type = LOBBIES[lobby_code]["world_state"].get((bx, by), get_block_type(by))
-                                        if block_type not in ["empty", "grass"]:
-                                            LOBBIES[lobby_code]["world_state"][(bx, by)] = "empty"
-                                            spawn_ore(lobby_code, bx, by, block_type)
-                                            LOBBIES[lobby_code]["ores_mined"] += 1
-                                            if block_type == "diamond":
-                                                LOBBIES[lobby_code]["diamonds_mined"] += 1
-                                            await broadcast_to_lobby(lobby_code, {
-                                                "type": "block_mined",
-                                                "block_x": bx,
-                                                "block_y": by
-                                            })
+                            px, py = int(player["x"] // TILE_SIZE), int(player["y"] // TILE_SIZE)
+                            cleared = clear_tiles(lobby_code, [(px + dx, py + dy) for dx in range(-5, 6) for dy in range(-5, 6)])
+                            if cleared:
+                                await broadcast_to_lobby(lobby_code, {"type": "region_mined", "tiles": cleared})
                         elif item_id == "health_pack":
                             player["health"] = min(100, player["health"] + 50)
                             await broadcast_to_lobby(lobby_code, {
@@ -215,43 +212,35 @@ async def handler(websocket, path=None):
                             })
                         elif item_id == "earthquake":
                             center_x = int(player["x"] // TILE_SIZE)
-                            for depth in range(int(player["y"] // TILE_SIZE), MAX_DEPTH):
-                                if 0 <= center_x < NUM_COLS:
-                                    block_type = LOBBIES[lobby_code]["world_state"].get((center_x, depth), get_block_type(depth))
+                            top = int(player["y"] // TILE_SIZE)
+                            bottom = min(top + EARTHQUAKE_DEPTH, MAX_DEPTH) - 1
+                            if 0 <= center_x < NUM_COLS:
+                                world_state = LOBBIES[lobby_code]["world_state"]
+                                for depth in range(top, bottom + 1):
+                                    block_type = world_state.get((center_x, depth), get_block_type(depth))
                                     if block_type and block_type != "empty":
-                                        LOBBIES[lobby_code]["world_state"][(center_x, depth)] = "empty"
+                                        world_state[(center_x, depth)] = "empty"
                                         spawn_ore(lobby_code, center_x, depth, block_type)
                                         LOBBIES[lobby_code]["ores_mined"] += 1
                                         if block_type == "diamond":
                                             LOBBIES[lobby_code]["diamonds_mined"] += 1
-                                        await broadcast_to_lobby(lobby_code, {
-                                            "type": "block_mined",
-                                            "block_x": center_x,
-                                            "block_y": depth
-                                        })
+                                await broadcast_to_lobby(lobby_code, {
+                                    "type": "column_cleared",
+                                    "block_x": center_x,
+                                    "top": top,
+                                    "bottom": bottom
+                                })
                         elif item_id == "depth_charge":
                             bx = int(data.get("x", player["x"]) // TILE_SIZE)
                             by = int(data.get("y", player["y"]) // TILE_SIZE)
-                            for dx in range(-3, 4):
-                                for dy in range(-3, 4):
-                                    if 0 <= bx + dx < NUM_COLS and 0 <= by + dy < MAX_DEPTH:
-                                        block_type = LOBBIES[lobby_code]["world_state"].get((bx + dx, by + dy), get_block_type(by + dy))
-                                        if block_type not in ["empty", "grass"]:
-                                            LOBBIES[lobby_code]["world_state"][(bx + dx, by + dy)] = "empty"
-                                            spawn_ore(lobby_code, bx + dx, by + dy, block_type)
-                                            LOBBIES[lobby_code]["ores_mined"] += 1
-                                            if block_type == "diamond":
-                                                LOBBIES[lobby_code]["diamonds_mined"] += 1
-                                            await broadcast_to_lobby(lobby_code, {
-                                                "type": "block_mined",
-                                                "block_x": bx + dx,
-                                                "block_y": by + dy
-                                            })
+                            cleared = clear_tiles(lobby_code, [(bx + dx, by + dy) for dx in range(-3, 4) for dy in range(-3, 4)])
+                            if cleared:
+                                await broadcast_to_lobby(lobby_code, {"type": "region_mined", "tiles": cleared})
                         elif item_id == "bat_wing":
-                            player["active_effects"]["speed_boost"] = {"active": True, "end_time": time.time() + 30}
+                            player["active_effects"]["speed_boost"] = {"active": True, "end_time": CLOCK.now() + 30}
                             player["mining_speed_boost"] += 0.5
                         elif item_id == "goblin_tooth":
-                            player["active_effects"]["safety_bubble"] = {"active": True, "end_time": time.time() + 30}
+                            player["active_effects"]["safety_bubble"] = {"active": True, "end_time": CLOCK.now() + 30}
                             player["rock_damage_reduction"] += 0.2
                         await broadcast_to_lobby(lobby_code, {
                             "type": "item_used",
@@ -259,7 +248,7 @@ async def handler(websocket, path=None):
                             "item_id": item_id
                         })
                         await check_milestones(lobby_code, player_id)
-                        logger.info(f"{player_id} used item {item_id} in lobby {lobby_code}")
+                        logger.info("%s used item %s in lobby %s", player_id, item_id, lobby_code)
 
                 elif action == "drop_ore":
                     lobby_code = PLAYERS[player_id]["lobby_code"]
@@ -278,12 +267,12 @@ async def handler(websocket, path=None):
                             "player_id": player_id,
                             "cash_earned": total_value
                         })
-                        logger.info(f"{player_id} dropped off ores for ${total_value:.2f} in lobby {lobby_code}")
+                        logger.info("%s dropped off ores for $%.2f in lobby %s", player_id, total_value, lobby_code)
 
             except json.JSONDecodeError:
-                logger.error(f"Invalid JSON from {player_id}: {message}")
+                logger.error("Invalid JSON from %s: %s", player_id, message)
             except KeyError as e:
-                logger.error(f"Missing key in message from {player_id}: {e}")
+                logger.error("Missing key in message from %s: %s", player_id, e)
 
     except websockets.ConnectionClosed:
         lobby_code = PLAYERS[player_id]["lobby_code"]
@@ -291,11 +280,11 @@ async def handler(websocket, path=None):
             del LOBBIES[lobby_code]["players"][player_id]
             if not LOBBIES[lobby_code]["players"]:
                 del LOBBIES[lobby_code]
-                logger.info(f"Lobby {lobby_code} closed (no players)")
+                logger.info("Lobby %s closed (no players)", lobby_code)
             else:
                 await broadcast_to_lobby(lobby_code, {"type": "player_left", "id": player_id}, exclude=player_id)
         del PLAYERS[player_id]
-        logger.info(f"{player_id} disconnected at {datetime.now()}")
+        logger.info("%s disconnected at %s", player_id, datetime.now())
 
 async def broadcast_to_lobby(lobby_code, message, exclude=None):
     """Broadcast a message to all players in a lobby, optionally excluding one."""
@@ -309,7 +298,7 @@ async def broadcast_to_lobby(lobby_code, message, exclude=None):
                     del LOBBIES[lobby_code]["players"][player_id]
                     del PLAYERS[player_id]
                     await broadcast_to_lobby(lobby_code, {"type": "player_left", "id": player_id}, exclude=player_id)
-                    logger.info(f"{player_id} disconnected during broadcast")
+                    logger.info("%s disconnected during broadcast", player_id)
 
 def spawn_ore(lobby_code, block_x, block_y, ore_type):
     """Spawn an ore item in the specified lobby."""
@@ -323,14 +312,31 @@ def spawn_ore(lobby_code, block_x, block_y, ore_type):
         "y": block_y * TILE_SIZE + TILE_SIZE // 2,
         "ore_type": ore_type,
         "value": value,
-        "creation_time": time.time()
+        "creation_time": CLOCK.now()
     }
     asyncio.create_task(broadcast_to_lobby(lobby_code, {
         "type": "spawn_entity",
         "entity_id": entity_id,
         "entity_data": LOBBIES[lobby_code]["entities"][entity_id]
     }))
-    logger.debug(f"Spawned ore {entity_id} ({ore_type}) at ({block_x}, {block_y}) in lobby {lobby_code}")
+    logger.debug("Spawned ore %s (%s) at (%s, %s) in lobby %s", entity_id, ore_type, block_x, block_y, lobby_code)
+
+def clear_tiles(lobby_code, tiles):
+    """Empty the minable blocks among tiles in a lobby's world, spawning their ores; return [[x, y]] of tiles cleared."""
+    lobby = LOBBIES[lobby_code]
+    world_state = lobby["world_state"]
+    cleared = []
+    for bx, by in tiles:
+        if 0 <= bx < NUM_COLS and 0 <= by < MAX_DEPTH:
+            block_type = world_state.get((bx, by), get_block_type(by))
+            if block_type not in ["empty", "grass"]:
+                world_state[(bx, by)] = "empty"
+                spawn_ore(lobby_code, bx, by, block_type)
+                lobby["ores_mined"] += 1
+                if block_type == "diamond":
+                    lobby["diamonds_mined"] += 1
+                cleared.append([bx, by])
+    return cleared
 
 def get_block_type(block_y):
     """Determine block type based on depth (simplified for server)."""
@@ -468,12 +474,12 @@ async def check_milestones(lobby_code, player_id):
                 "value": milestone_depth,
                 "reward": {"cash": 1000, "health_pack": 1}
             })
-            logger.info(f"Depth milestone {milestone_depth} achieved in lobby {lobby_code}")
+            logger.info("Depth milestone %s achieved in lobby %s", milestone_depth, lobby_code)
             if milestone_depth >= 75000:
                 await broadcast_to_lobby(lobby_code, {
                     "type": "lava_hazard_activated"
                 })
-                logger.info(f"Lava hazard activated in lobby {lobby_code}")
+                logger.info("Lava hazard activated in lobby %s", lobby_code)
     for milestone_ores, achieved in lobby["milestones"]["ores_mined"].items():
         if lobby["ores_mined"] >= milestone_ores and not achieved:
             lobby["milestones"]["ores_mined"][milestone_ores] = True
@@ -486,7 +492,7 @@ async def check_milestones(lobby_code, player_id):
                 "value": milestone_ores,
                 "reward": {"cash": 500, "dynamite": 1}
             })
-            logger.info(f"Ores mined milestone {milestone_ores} achieved in lobby {lobby_code}")
+            logger.info("Ores mined milestone %s achieved in lobby %s", milestone_ores, lobby_code)
     for milestone_diamonds, achieved in lobby["milestones"]["diamonds_mined"].items():
         if lobby["diamonds_mined"] >= milestone_diamonds and not achieved:
             lobby["milestones"]["diamonds_mined"][milestone_diamonds] = True
@@ -499,7 +505,7 @@ async def check_milestones(lobby_code, player_id):
                 "value": milestone_diamonds,
                 "reward": {"cash": 500, "health_pack": 1}
             })
-            logger.info(f"Diamonds mined milestone {milestone_diamonds} achieved in lobby {lobby_code}")
+            logger.info("Diamonds mined milestone %s achieved in lobby %s", milestone_diamonds, lobby_code)
 
 async def handle_player_death(player_id):
     """Handle player death: respawn and drop items."""
@@ -523,13 +529,15 @@ async def handle_player_death(player_id):
         "y": player["y"],
         "health": player["health"]
     })
-    logger.info(f"{player_id} died and respawned in lobby {lobby_code}")
+    logger.info("%s died and respawned in lobby %s", player_id, lobby_code)
 
 async def update_lobbies():
     """Update lobby states, including day progression and lava hazards."""
+    CLOCK.tick()  # Don't count the time before the loop started
     while True:
+        dt = CLOCK.tick()  # Measured, so the day timer doesn't drift when a pass overruns its sleep
         for lobby_code, lobby in list(LOBBIES.items()):
-            lobby["time_left"] = max(0, lobby["time_left"] - 0.1)
+            lobby["time_left"] = max(0, lobby["time_left"] - dt)
             if lobby["time_left"] <= 0:
                 if lobby["cash_earned_today"] >= lobby["quota"]:
                     lobby["day"] += 1
@@ -544,7 +552,7 @@ async def update_lobbies():
                         "quota": lobby["quota"],
                         "time_left": lobby["time_left"]
                     })
-                    logger.info(f"Lobby {lobby_code} advanced to day {lobby['day']}, new quota ${lobby['quota']:.2f}")
+                    logger.info("Lobby %s advanced to day %s, new quota $%.2f", lobby_code, lobby['day'], lobby['quota'])
                 else:
                     await broadcast_to_lobby(lobby_code, {
                         "type": "game_over",
@@ -553,7 +561,7 @@ async def update_lobbies():
                     del LOBBIES[lobby_code]
                     for pid in list(lobby["players"].keys()):
                         PLAYERS[pid]["lobby_code"] = None
-                    logger.info(f"Lobby {lobby_code} closed: Quota not met")
+                    logger.info("Lobby %s closed: Quota not met", lobby_code)
             if any(lobby["milestones"]["depth"].get(75000, False) for _ in lobby["players"]):
                 for pid, player in list(lobby["players"].items()):
                     if not player["active_effects"].get("safety_bubble", {}).get("active", False):
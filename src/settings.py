@@ -14,6 +14,25 @@ FPS = 60
 TILE_SIZE = 32
 NUM_COLS = 100
 MAX_DEPTH = 100000
+CHUNK_CACHE_SIZE = 1024  # Max chunks kept in memory before LRU eviction
+CHUNK_KEEP_RADIUS = 2  # Chunks within this many chunks of a player are never evicted
+WORLDGEN_VERSION = 2  # Bump whenever a seed generates different terrain; saved edit journals only replay onto the same version
+USE_NUMPY_WORLDGEN = True  # Use the vectorized chunk generator when NumPy is installed
+ORE_NOISE_SCALE = 0.05  # Gradient noise frequency for ore veins; one lattice cell spans 20 tiles
+PREFETCH_LOOKAHEAD = 1.0  # Seconds of player movement to generate chunks ahead of
+PREFETCH_BUDGET = 0.004  # Max seconds per frame spent pre-generating chunks
+CHUNK_SURFACE_CACHE_SIZE = 24  # Pre-rendered chunk surfaces kept by the renderer (about 1 MB each)
+DIRTY_RECT_RENDERING = False  # Redraw and push only changed screen regions while the camera is still
+DIRTY_CELL_SIZE = 32  # Grid in pixels that dirty regions are snapped to before being merged
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept by the UI text cache
+TEXT_CHANGING_CACHE_SIZE = 64  # Surfaces kept for often-changing lines like timers, apart from the main text cache
+PARTICLE_CAPACITY = 4096  # Max live particles; bursts beyond this are dropped
+SPATIAL_CELL_SIZE = 128  # Pixel size of the EntityManager spatial hash cells
+LOG_LEVEL = "WARNING"  # Default log level; override with YEARN_LOG_LEVEL or --log-level
+LOG_TRACE_SIZE = 2000  # Most recent log records kept in memory for trace dumps
+PROFILER_WINDOW = 240  # Frames the F1 profiler overlay computes percentiles over
+PROFILER_TRACE = os.environ.get("YEARN_PROFILE_TRACE")  # CSV or JSON path the profiler streams every frame to
+PROFILER_TRACE_BATCH = 300  # Profiled frames held in memory before they are appended to the trace file
 MOVE_SPEED = 200
 JUMP_VELOCITY = -400
 GRAVITY = 800
@@ -22,7 +41,10 @@ FONT_SIZE = 24
 SOUND_VOLUME = 0.5
 QUOTA_BASE = 1000
 QUOTA_INCREASE = 1.2
+EARTHQUAKE_DEPTH = 64  # Rows an earthquake clears, from the player's row down
+COLLAPSE_DELAY = 2.0  # Seconds an undermined unstable block holds before it falls
 DAY_DURATION = 300  # 5 minutes in seconds
+TIME_SCALE = float(os.environ.get("YEARN_TIME_SCALE", 1.0))  # Simulated seconds per real second
 PLAYER_COLOR = (0, 0, 255)
 PLAYER2_COLOR = (255, 0, 0)
 WHITE = (255, 255, 255)
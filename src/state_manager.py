@@ -1,11 +1,7 @@
-import logging
+from log_config import get_logger
 
 # Configure logging (Pyodide-compatible)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 logger.info("Initializing state_manager.py")
 
 class GameState:
@@ -43,7 +39,6 @@ class PlayingState(GameState):
 
     def update(self, game, dt):
         game.update(dt)
-        logger.debug("Updated PlayingState")
 
 class PausedState(GameState):
     def enter(self, game):
@@ -99,9 +94,9 @@ class StateManager:
     def set_state(self, state_name, game):
         """Transition to a new state."""
         if state_name not in self.states:
-            logger.error(f"Invalid state: {state_name}")
+            logger.error("Invalid state: %s", state_name)
             return
-        logger.info(f"Transitioning from {self.current_state} to {state_name}")
+        logger.info("Transitioning from %s to %s", self.current_state, state_name)
         self.states[self.current_state].exit(game)
         self.current_state = state_name
         self.states[state_name].enter(game)
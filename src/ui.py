@@ -1,21 +1,48 @@
 import pygame
 import random
-import logging
-import time
-from settings import WIDTH, HEIGHT, FONT_SIZE, PLAYER_COLOR, WHITE, DAY_DURATION, TILE_SIZE
+from collections import OrderedDict
+from settings import WIDTH, HEIGHT, FONT_SIZE, PLAYER_COLOR, WHITE, DAY_DURATION, TILE_SIZE, TEXT_CACHE_SIZE, TEXT_CHANGING_CACHE_SIZE
+from log_config import get_logger
 
 # Configure logging (Pyodide-compatible)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 logger.info("Initializing ui.py")
 
+class TextCache:
+    """Memoise rendered text surfaces by (text, antialias, color); returned surfaces must not be drawn on."""
+    def __init__(self, font, max_entries=TEXT_CACHE_SIZE, max_changing=TEXT_CHANGING_CACHE_SIZE):
+        """Initialize empty caches for stable and often-changing text."""
+        self.font = font
+        self.max_entries = max_entries
+        self.max_changing = max_changing
+        self.surfaces = OrderedDict()  # (text, antialias, color): surface, least recently used first
+        self.changing = OrderedDict()  # Same, for text passed to render_changing
+
+    def render(self, text, antialias, color):
+        """Render text like Font.render, rasterising each distinct string only once."""
+        return self.lookup(self.surfaces, self.max_entries, text, antialias, color)
+
+    def render_changing(self, text, antialias, color):
+        """Render text that changes every few frames, such as timers, without evicting stable text from the cache."""
+        return self.lookup(self.changing, self.max_changing, text, antialias, color)
+
+    def lookup(self, cache, max_entries, text, antialias, color):
+        """Get a rendered surface from an LRU cache, rendering and adding it on a miss."""
+        key = (text, antialias, tuple(color))
+        surface = cache.get(key)
+        if surface is None:
+            surface = cache[key] = self.font.render(text, antialias, color)
+            if len(cache) > max_entries:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
+
 class UI:
     def __init__(self, font):
         """Initialize the UI with font and menu states."""
         self.font = font
+        self.text = TextCache(font)
         self.show_start_menu = True
         self.show_mode_menu = False
         self.show_lobby_menu = False
@@ -66,18 +93,10 @@ class UI:
         day = getattr(game, 'day', 1)
         quota = getattr(game, 'quota', 1000)
         cash_earned_today = getattr(game, 'cash_earned_today', 0)
-        day_start_time = getattr(game, 'day_start_time', time.time())
-        debug_message = getattr(game, 'debug_message', None)
-        show_debug = getattr(game, 'show_debug', False)
-        mining_fatigue = getattr(game, 'mining_fatigue', 0.0)
         upgrades_cfg = getattr(game, 'upgrades_cfg', {'pickaxes': [], 'shop': []})
 
         # Draw HUD
-        time_left = max(0, DAY_DURATION + player.day_extension - (time.time() - day_start_time)) if game.mode != "online_coop" else game.time_left
-        minutes = int(time_left // 60)
-        seconds = int(time_left % 60)
-        health_percent = player.health / player.max_health
-        quota_percent = min(cash_earned_today / quota, 1.0) if quota > 0 else 0.0
+        health_percent, quota_percent = self.hud_bars(game)
 
         # Health bar
         pygame.draw.rect(screen, (200, 0, 0), (10, HEIGHT - 50, 100, 20))
@@ -89,52 +108,8 @@ class UI:
         pygame.draw.rect(screen, (255, 215, 0), (10, HEIGHT - 80, 100 * quota_percent, 15))
         pygame.draw.rect(screen, WHITE, (10, HEIGHT - 80, 100, 15), 2)
 
-        # HUD text
-        ui_lines = [
-            f"Cash: ${player.cash:.2f}  Pick: {upgrades_cfg['pickaxes'][player.pick_index]['name']}",
-            f"Day: {day}  Quota: ${cash_earned_today:.2f}/${quota:.2f}",
-            f"Time: {minutes:02d}:{seconds:02d}",
-            f"Health: {int(player.health)}/{player.max_health}",
-            f"Inventory: D:{player.inventory.get('dynamite', 0)} H:{player.inventory.get('health_pack', 0)} "
-            f"E:{player.inventory.get('earthquake', 0)} F:{player.inventory.get('depth_charge', 0)} "
-            f"B:{player.inventory.get('bat_wing', 0)} G:{player.inventory.get('goblin_tooth', 0)}",
-            f"Mode: {game.mode.replace('_', ' ').title() if game.mode else 'Not Selected'}"
-        ]
-
-        for i, line in enumerate(ui_lines):
-            screen.blit(self.font.render(line, True, WHITE), (10, 10 + i * (FONT_SIZE + 2)))
-
-        # Status text with fatigue and ore pickup range
-        status_lines = [
-            f"Mining Speed: {player.mining_speed_boost:.1f}x",
-            f"Mining Range: {player.mining_range:.1f}",
-            f"AOE: {'None' if player.aoe_mining == 0 else '3x3' if player.aoe_mining == 1 else '5x5'}",
-            f"Damage Resist: {player.rock_damage_reduction*100:.0f}%",
-            f"Lucky Miner: {'Yes' if player.lucky_miner else 'No'}",
-            f"Cash Multiplier: {player.cash_multiplier:.1f}x",
-            f"Auto-Miner: {'Yes' if player.active_effects.get('auto_miner', {}).get('active', False) else 'No'}",
-            f"Fatigue: {mining_fatigue*100:.0f}%",
-            f"Fatigue Reduction: {player.fatigue_reduction*100:.0f}%",
-            f"Ore Pickup Range: {player.ore_pickup_range:.1f} blocks"
-        ]
-
-        for i, line in enumerate(status_lines):
-            screen.blit(self.font.render(line, True, (200, 200, 100)), (WIDTH - 200, 10 + i * (FONT_SIZE + 2)))
-
-        # Active effects
-        effect_y = HEIGHT - 50
-        for effect_name, effect_data in player.active_effects.items():
-            if effect_data.get('active', False):
-                effect_time_left = effect_data.get('end_time', time.time()) - time.time()
-                if effect_time_left > 0:
-                    text = f"{effect_name.replace('_', ' ').title()}: {int(effect_time_left)}s"
-                    screen.blit(self.font.render(text, True, (0, 255, 255)), (WIDTH - 200, effect_y))
-                    effect_y -= 20
-
-        # Draw lobby message
-        if self.lobby_message and self.lobby_message_timer > 0:
-            lobby_surf = self.font.render(self.lobby_message, True, (255, 100, 100))
-            screen.blit(lobby_surf, (WIDTH // 2 - lobby_surf.get_width() // 2, HEIGHT - 200))
+        # HUD text, status text, active effects and the lobby message
+        self.draw_text(screen, self.hud_text(game))
 
         # Draw inventory
         if self.show_inventory:
@@ -149,23 +124,23 @@ class UI:
                                  {'name': item_id.replace('_', ' ').title(), 'description': 'No description'})
                 text = f"{item_info['name']}: {count} - {item_info['description']}"
                 color = PLAYER_COLOR if i == self.selected_item else WHITE
-                text_surf = self.font.render(text, True, color)
+                text_surf = self.text.render(text, True, color)
                 screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, y_offset))
                 if i == self.selected_item:
                     pygame.draw.rect(screen, PLAYER_COLOR, (WIDTH // 2 - 180, y_offset - 5, 360, 30), 2)
                 y_offset += 40
             y_offset += 20
-            screen.blit(self.font.render("Ores:", True, WHITE), (WIDTH // 2 - 50, y_offset))
+            screen.blit(self.text.render("Ores:", True, WHITE), (WIDTH // 2 - 50, y_offset))
             y_offset += 30
             for slot in player.get_ore_inventory():
                 if slot:
                     text = f"{slot['type']}: {slot['count']}"
-                    text_surf = self.font.render(text, True, WHITE)
+                    text_surf = self.text.render(text, True, WHITE)
                     screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, y_offset))
                     y_offset += 30
             instructions = ["↑/↓: Navigate  ENTER: Use  ESC: Close"]
             for j, line in enumerate(instructions):
-                inst_surf = self.font.render(line, True, (200, 200, 100))
+                inst_surf = self.text.render(line, True, (200, 200, 100))
                 screen.blit(inst_surf, (WIDTH // 2 - inst_surf.get_width() // 2, HEIGHT - 100 + j * 30))
 
         # Draw upgrade menu
@@ -175,8 +150,8 @@ class UI:
             screen.blit(overlay, (0, 0))
             pick_color = PLAYER_COLOR if self.menu_mode == "pickaxes" else (150, 150, 150)
             shop_color = PLAYER_COLOR if self.menu_mode == "shop" else (150, 150, 150)
-            pick_tab = self.font.render("PICKAXES", True, pick_color)
-            shop_tab = self.font.render("SHOP", True, shop_color)
+            pick_tab = self.text.render("PICKAXES", True, pick_color)
+            shop_tab = self.text.render("SHOP", True, shop_color)
             screen.blit(pick_tab, (WIDTH // 4 - pick_tab.get_width() // 2, 30))
             screen.blit(shop_tab, (3 * WIDTH // 4 - shop_tab.get_width() // 2, 30))
             pygame.draw.line(screen, PLAYER_COLOR, (0, 60), (WIDTH, 60), 2)
@@ -186,7 +161,7 @@ class UI:
                     color = (100, 255, 100) if upgrade.get('unlocked', False) else WHITE if player.cash >= upgrade['cost'] else (150, 150, 150)
                     status = "[OWNED]" if upgrade.get('unlocked', False) else f"[BUY ${upgrade['cost']}]" if player.cash >= upgrade['cost'] else f"${upgrade['cost']}"
                     text = f"{upgrade['name']} - Speed: {upgrade['speed']}x {status}"
-                    text_surf = self.font.render(text, True, color)
+                    text_surf = self.text.render(text, True, color)
                     screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, y_offset))
                     if i == self.selected_upgrade:
                         pygame.draw.rect(screen, PLAYER_COLOR, (WIDTH // 2 - 180, y_offset - 5, 360, 30), 2)
@@ -198,7 +173,7 @@ class UI:
                     color = (100, 255, 100) if item.get('unlocked', False) and item.get('permanent', False) else WHITE if player.cash >= item['cost'] and not (item.get('unlocked', False) and item.get('permanent', False)) else (150, 150, 150)
                     status = "[OWNED]" if item.get('unlocked', False) and item.get('permanent', False) else f"[BUY ${item['cost']}]" if player.cash >= item['cost'] else f"${item['cost']}"
                     text = f"{item['name']} {status}"
-                    text_surf = self.font.render(text, True, color)
+                    text_surf = self.text.render(text, True, color)
                     screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, y_offset))
                     if i + self.shop_offset == self.selected_upgrade:
                         pygame.draw.rect(screen, PLAYER_COLOR, (WIDTH // 2 - 180, y_offset - 5, 360, 30), 2)
@@ -212,7 +187,7 @@ class UI:
                 "ESC: Close Menu"
             ]
             for j, line in enumerate(instructions):
-                inst_surf = self.font.render(line, True, (200, 200, 100))
+                inst_surf = self.text.render(line, True, (200, 200, 100))
                 screen.blit(inst_surf, (WIDTH // 2 - inst_surf.get_width() // 2, HEIGHT - 100 + j * 30))
 
         # Draw post-day upgrades
@@ -225,14 +200,14 @@ class UI:
             for i, upgrade in enumerate(self.post_day_upgrades):
                 color = PLAYER_COLOR if i == self.selected_post_day_upgrade else WHITE
                 text = f"{upgrade['name']}: {upgrade['description']}"
-                text_surf = self.font.render(text, True, color)
+                text_surf = self.text.render(text, True, color)
                 screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, y_offset))
                 if i == self.selected_post_day_upgrade:
                     pygame.draw.rect(screen, PLAYER_COLOR, (WIDTH // 2 - 180, y_offset - 5, 360, 30), 2)
                 y_offset += 40
             instructions = ["↑/↓: Navigate  ENTER: Select  ESC: Skip"]
             for j, line in enumerate(instructions):
-                inst_surf = self.font.render(line, True, (200, 200, 100))
+                inst_surf = self.text.render(line, True, (200, 200, 100))
                 screen.blit(inst_surf, (WIDTH // 2 - inst_surf.get_width() // 2, HEIGHT - 100 + j * 30))
 
         # Draw game over
@@ -241,7 +216,7 @@ class UI:
             overlay.fill((0, 0, 0, 220))
             screen.blit(overlay, (0, 0))
             reason = "YOU DIED!" if player.health <= 0 else "FAILED TO MEET QUOTA!"
-            title = self.font.render(f"GAME OVER - {reason}", True, (255, 50, 50))
+            title = self.text.render(f"GAME OVER - {reason}", True, (255, 50, 50))
             screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 80))
             stats = [
                 f"Day Reached: {day}",
@@ -249,29 +224,103 @@ class UI:
                 f"Quota: ${cash_earned_today:.2f}/${quota:.2f}"
             ]
             for i, line in enumerate(stats):
-                stat_surf = self.font.render(line, True, WHITE)
+                stat_surf = self.text.render(line, True, WHITE)
                 screen.blit(stat_surf, (WIDTH // 2 - stat_surf.get_width() // 2, HEIGHT // 2 - 30 + i * 30))
-            restart = self.font.render("Press R to Restart", True, (100, 255, 100))
+            restart = self.text.render("Press R to Restart", True, (100, 255, 100))
             screen.blit(restart, (WIDTH // 2 - restart.get_width() // 2, HEIGHT - 100))
 
-        # Draw drop-off prompt
-        if player.rect.y < TILE_SIZE:
-            drop_off_surf = self.font.render("Press O to drop off ores", True, (255, 255, 0))
-            screen.blit(drop_off_surf, (WIDTH // 2 - drop_off_surf.get_width() // 2, HEIGHT - 100))
+        # Draw drop-off prompt and debug message
+        self.draw_text(screen, self.prompt_text(game))
+        self.update_lobby_message()
+
+        logger.debug("Rendered UI elements")
+
+    def hud_bars(self, game):
+        """Get the filled fractions of the health and quota bars."""
+        player = game.players[0]
+        quota = getattr(game, 'quota', 1000)
+        cash_earned_today = getattr(game, 'cash_earned_today', 0)
+        health_percent = player.health / player.max_health
+        quota_percent = min(cash_earned_today / quota, 1.0) if quota > 0 else 0.0
+        return health_percent, quota_percent
+
+    def hud_text(self, game):
+        """Get the in-game HUD text as (text, color, x, y, changing) entries; an x of None centres the text."""
+        player = game.players[0]
+        day = getattr(game, 'day', 1)
+        quota = getattr(game, 'quota', 1000)
+        cash_earned_today = getattr(game, 'cash_earned_today', 0)
+        now = game.clock.now()
+        day_start_time = getattr(game, 'day_start_time', now)
+        mining_fatigue = getattr(game, 'mining_fatigue', 0.0)
+        upgrades_cfg = getattr(game, 'upgrades_cfg', {'pickaxes': [], 'shop': []})
+
+        time_left = max(0, DAY_DURATION + player.day_extension - (now - day_start_time)) if game.mode != "online_coop" else game.time_left
+        minutes = int(time_left // 60)
+        seconds = int(time_left % 60)
+        ui_lines = [
+            f"Cash: ${player.cash:.2f}  Pick: {upgrades_cfg['pickaxes'][player.pick_index]['name']}",
+            f"Day: {day}  Quota: ${cash_earned_today:.2f}/${quota:.2f}",
+            f"Time: {minutes:02d}:{seconds:02d}",
+            f"Health: {int(player.health)}/{player.max_health}",
+            f"Inventory: D:{player.inventory.get('dynamite', 0)} H:{player.inventory.get('health_pack', 0)} "
+            f"E:{player.inventory.get('earthquake', 0)} F:{player.inventory.get('depth_charge', 0)} "
+            f"B:{player.inventory.get('bat_wing', 0)} G:{player.inventory.get('goblin_tooth', 0)}",
+            f"Mode: {game.mode.replace('_', ' ').title() if game.mode else 'Not Selected'}"
+        ]
+        # Status text with fatigue and ore pickup range
+        status_lines = [
+            f"Mining Speed: {player.mining_speed_boost:.1f}x",
+            f"Mining Range: {player.mining_range:.1f}",
+            f"AOE: {'None' if player.aoe_mining == 0 else '3x3' if player.aoe_mining == 1 else '5x5'}",
+            f"Damage Resist: {player.rock_damage_reduction*100:.0f}%",
+            f"Lucky Miner: {'Yes' if player.lucky_miner else 'No'}",
+            f"Cash Multiplier: {player.cash_multiplier:.1f}x",
+            f"Auto-Miner: {'Yes' if player.active_effects.get('auto_miner', {}).get('active', False) else 'No'}",
+            f"Fatigue: {mining_fatigue*100:.0f}%",
+            f"Fatigue Reduction: {player.fatigue_reduction*100:.0f}%",
+            f"Ore Pickup Range: {player.ore_pickup_range:.1f} blocks"
+        ]
+        entries = [(line, WHITE, 10, 10 + i * (FONT_SIZE + 2), True) for i, line in enumerate(ui_lines)]
+        entries.extend((line, (200, 200, 100), WIDTH - 200, 10 + i * (FONT_SIZE + 2), False) for i, line in enumerate(status_lines))
 
-        # Draw debug message
-        if debug_message and show_debug:
-            debug_surf = self.font.render(debug_message, True, WHITE)
-            screen.blit(debug_surf, (WIDTH // 2 - debug_surf.get_width() // 2, HEIGHT - 50))
+        # Active effects
+        effect_y = HEIGHT - 50
+        for effect_name, effect_data in player.active_effects.items():
+            if effect_data.get('active', False):
+                effect_time_left = effect_data.get('end_time', now) - now
+                if effect_time_left > 0:
+                    text = f"{effect_name.replace('_', ' ').title()}: {int(effect_time_left)}s"
+                    entries.append((text, (0, 255, 255), WIDTH - 200, effect_y, True))
+                    effect_y -= 20
 
-        # Update lobby message timer
+        if self.lobby_message and self.lobby_message_timer > 0:
+            entries.append((self.lobby_message, (255, 100, 100), None, HEIGHT - 200, False))
+        return entries
+
+    def prompt_text(self, game):
+        """Get the drop-off prompt and debug message, drawn above any open menu, as hud_text entries."""
+        entries = []
+        if game.players[0].rect.y < TILE_SIZE:
+            entries.append(("Press O to drop off ores", (255, 255, 0), None, HEIGHT - 100, False))
+        debug_message = getattr(game, 'debug_message', None)
+        if debug_message and getattr(game, 'show_debug', False):
+            entries.append((debug_message, WHITE, None, HEIGHT - 50, False))
+        return entries
+
+    def draw_text(self, screen, entries):
+        """Blit hud_text entries."""
+        for text, color, x, y, changing in entries:
+            surface = (self.text.render_changing if changing else self.text.render)(text, True, color)
+            screen.blit(surface, (WIDTH // 2 - surface.get_width() // 2 if x is None else x, y))
+
+    def update_lobby_message(self):
+        """Count down the lobby message once per drawn frame and clear it when it runs out."""
         if self.lobby_message_timer > 0:
             self.lobby_message_timer -= 1 / 60  # Assuming 60 FPS
             if self.lobby_message_timer <= 0:
                 self.lobby_message = None
 
-        logger.debug("Rendered UI elements")
-
     def draw_start_menu(self, screen):
         """Draw the start menu."""
         screen.fill((0, 0, 0))
@@ -279,13 +328,13 @@ class UI:
         options = ["Start Game", "Quit"]
         for i, option in enumerate(options):
             color = PLAYER_COLOR if i == self.selected_start_option else WHITE
-            text_surf = self.font.render(option, True, color)
+            text_surf = self.text.render(option, True, color)
             screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, HEIGHT // 2 + i * 40))
             if i == self.selected_start_option:
                 pygame.draw.rect(screen, PLAYER_COLOR, (WIDTH // 2 - 100, HEIGHT // 2 + i * 40 - 5, 200, 30), 2)
         instructions = ["↑/↓: Navigate  ENTER: Select"]
         for j, line in enumerate(instructions):
-            inst_surf = self.font.render(line, True, (200, 200, 100))
+            inst_surf = self.text.render(line, True, (200, 200, 100))
             screen.blit(inst_surf, (WIDTH // 2 - inst_surf.get_width() // 2, HEIGHT - 100 + j * 30))
 
     def draw_mode_menu(self, screen):
@@ -295,13 +344,13 @@ class UI:
         options = ["Singleplayer", "Local Co-op", "Online Co-op"]
         for i, option in enumerate(options):
             color = PLAYER_COLOR if i == self.selected_mode_option else WHITE
-            text_surf = self.font.render(option, True, color)
+            text_surf = self.text.render(option, True, color)
             screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, HEIGHT // 2 + i * 40))
             if i == self.selected_mode_option:
                 pygame.draw.rect(screen, PLAYER_COLOR, (WIDTH // 2 - 100, HEIGHT // 2 + i * 40 - 5, 200, 30), 2)
         instructions = ["↑/↓: Navigate  ENTER: Select  ESC: Back"]
         for j, line in enumerate(instructions):
-            inst_surf = self.font.render(line, True, (200, 200, 100))
+            inst_surf = self.text.render(line, True, (200, 200, 100))
             screen.blit(inst_surf, (WIDTH // 2 - inst_surf.get_width() // 2, HEIGHT - 100 + j * 30))
 
     def draw_lobby_menu(self, screen):
@@ -311,21 +360,21 @@ class UI:
         options = ["Create Lobby", "Join Lobby"]
         for i, option in enumerate(options):
             color = PLAYER_COLOR if i == self.selected_lobby_option else WHITE
-            text_surf = self.font.render(option, True, color)
+            text_surf = self.text.render(option, True, color)
             screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, HEIGHT // 2 + i * 40))
             if i == self.selected_lobby_option:
                 pygame.draw.rect(screen, PLAYER_COLOR, (WIDTH // 2 - 100, HEIGHT // 2 + i * 40 - 5, 200, 30), 2)
         if self.selected_lobby_option == 1:
             lobby_code_text = f"Lobby Code: {self.lobby_code_input or '____'}"
-            text_surf = self.font.render(lobby_code_text, True, WHITE)
+            text_surf = self.text.render(lobby_code_text, True, WHITE)
             screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, HEIGHT // 2 + 100))
             pygame.draw.rect(screen, PLAYER_COLOR, (WIDTH // 2 - 100, HEIGHT // 2 + 95, 200, 30), 2)
         if self.lobby_message and self.lobby_message_timer > 0:
-            lobby_surf = self.font.render(self.lobby_message, True, (255, 100, 100))
+            lobby_surf = self.text.render(self.lobby_message, True, (255, 100, 100))
             screen.blit(lobby_surf, (WIDTH // 2 - lobby_surf.get_width() // 2, HEIGHT // 2 + 140))
         instructions = ["↑/↓: Navigate  ENTER: Select  ESC: Back", "A-Z/0-9: Enter Code (Join)"]
         for j, line in enumerate(instructions):
-            inst_surf = self.font.render(line, True, (200, 200, 100))
+            inst_surf = self.text.render(line, True, (200, 200, 100))
             screen.blit(inst_surf, (WIDTH // 2 - inst_surf.get_width() // 2, HEIGHT - 100 + j * 30))
 
     def draw_pause_menu(self, screen):
@@ -335,13 +384,13 @@ class UI:
         options = ["Resume", "Restart", "Quit"]
         for i, option in enumerate(options):
             color = PLAYER_COLOR if i == self.selected_pause_option else WHITE
-            text_surf = self.font.render(option, True, color)
+            text_surf = self.text.render(option, True, color)
             screen.blit(text_surf, (WIDTH // 2 - text_surf.get_width() // 2, HEIGHT // 2 + i * 40))
             if i == self.selected_pause_option:
                 pygame.draw.rect(screen, PLAYER_COLOR, (WIDTH // 2 - 100, HEIGHT // 2 + i * 40 - 5, 200, 30), 2)
         instructions = ["↑/↓: Navigate  ENTER: Select  ESC/P: Resume"]
         for j, line in enumerate(instructions):
-            inst_surf = self.font.render(line, True, (200, 200, 100))
+            inst_surf = self.text.render(line, True, (200, 200, 100))
             screen.blit(inst_surf, (WIDTH // 2 - inst_surf.get_width() // 2, HEIGHT - 100 + j * 30))
 
     def handle_start_input(self, event):
@@ -349,10 +398,10 @@ class UI:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_start_option = (self.selected_start_option - 1) % 2
-                logger.debug(f"Selected start option: {self.selected_start_option}")
+                logger.debug("Selected start option: %s", self.selected_start_option)
             elif event.key == pygame.K_DOWN:
                 self.selected_start_option = (self.selected_start_option + 1) % 2
-                logger.debug(f"Selected start option: {self.selected_start_option}")
+                logger.debug("Selected start option: %s", self.selected_start_option)
             elif event.key == pygame.K_RETURN:
                 if self.selected_start_option == 0:
                     self.show_start_menu = False
@@ -375,14 +424,14 @@ class UI:
                 return None
             elif event.key == pygame.K_UP:
                 self.selected_mode_option = max(0, self.selected_mode_option - 1)
-                logger.debug(f"Selected mode option: {['Singleplayer', 'Local Co-op', 'Online Co-op'][self.selected_mode_option]}")
+                logger.debug("Selected mode option: %s", ['Singleplayer', 'Local Co-op', 'Online Co-op'][self.selected_mode_option])
             elif event.key == pygame.K_DOWN:
                 self.selected_mode_option = min(2, self.selected_mode_option + 1)
-                logger.debug(f"Selected mode option: {['Singleplayer', 'Local Co-op', 'Online Co-op'][self.selected_mode_option]}")
+                logger.debug("Selected mode option: %s", ['Singleplayer', 'Local Co-op', 'Online Co-op'][self.selected_mode_option])
             elif event.key == pygame.K_RETURN:
                 modes = ["singleplayer", "local_coop", "online_coop"]
                 game.mode = modes[self.selected_mode_option]
-                logger.info(f"Selected {game.mode} mode")
+                logger.info("Selected %s mode", game.mode)
                 self.show_mode_menu = False
                 if game.mode == "online_coop":
                     self.show_lobby_menu = True
@@ -391,7 +440,7 @@ class UI:
                     logger.debug("Transitioned to lobby menu for online co-op")
                 else:
                     game.start_game()
-                    logger.debug(f"Started game in {game.mode} mode")
+                    logger.debug("Started game in %s mode", game.mode)
                 return "start"
         return None
 
@@ -407,10 +456,10 @@ class UI:
                 return None
             elif event.key == pygame.K_UP:
                 self.selected_lobby_option = (self.selected_lobby_option - 1) % 2
-                logger.debug(f"Selected lobby option: {self.selected_lobby_option}")
+                logger.debug("Selected lobby option: %s", self.selected_lobby_option)
             elif event.key == pygame.K_DOWN:
                 self.selected_lobby_option = (self.selected_lobby_option + 1) % 2
-                logger.debug(f"Selected lobby option: {self.selected_lobby_option}")
+                logger.debug("Selected lobby option: %s", self.selected_lobby_option)
             elif event.key == pygame.K_RETURN:
                 if self.selected_lobby_option == 0:
                     game.create_lobby()
@@ -419,7 +468,7 @@ class UI:
                 elif self.selected_lobby_option == 1:
                     if len(self.lobby_code_input) == 4:
                         game.join_lobby(self.lobby_code_input)
-                        logger.info(f"Requested to join lobby {self.lobby_code_input}")
+                        logger.info("Requested to join lobby %s", self.lobby_code_input)
                         return None
                     else:
                         self.lobby_message = "Enter a 4-digit lobby code"
@@ -429,10 +478,10 @@ class UI:
                 char = event.unicode.upper()
                 if char.isalnum():
                     self.lobby_code_input += char
-                    logger.debug(f"Lobby code input: {self.lobby_code_input}")
+                    logger.debug("Lobby code input: %s", self.lobby_code_input)
                 elif event.key == pygame.K_BACKSPACE:
                     self.lobby_code_input = self.lobby_code_input[:-1]
-                    logger.debug(f"Lobby code input: {self.lobby_code_input}")
+                    logger.debug("Lobby code input: %s", self.lobby_code_input)
         return None
 
     def handle_pause_input(self, event):
@@ -444,10 +493,10 @@ class UI:
                 return "resume"
             elif event.key == pygame.K_UP:
                 self.selected_pause_option = (self.selected_pause_option - 1) % 3
-                logger.debug(f"Selected pause option: {self.selected_pause_option}")
+                logger.debug("Selected pause option: %s", self.selected_pause_option)
             elif event.key == pygame.K_DOWN:
                 self.selected_pause_option = (self.selected_pause_option + 1) % 3
-                logger.debug(f"Selected pause option: {self.selected_pause_option}")
+                logger.debug("Selected pause option: %s", self.selected_pause_option)
             elif event.key == pygame.K_RETURN:
                 if self.selected_pause_option == 0:
                     self.show_pause_menu = False
@@ -472,17 +521,17 @@ class UI:
             elif event.key == pygame.K_UP:
                 if self.post_day_upgrades:
                     self.selected_post_day_upgrade = (self.selected_post_day_upgrade - 1) % len(self.post_day_upgrades)
-                    logger.debug(f"Selected post-day upgrade: {self.selected_post_day_upgrade}")
+                    logger.debug("Selected post-day upgrade: %s", self.selected_post_day_upgrade)
             elif event.key == pygame.K_DOWN:
                 if self.post_day_upgrades:
                     self.selected_post_day_upgrade = (self.selected_post_day_upgrade + 1) % len(self.post_day_upgrades)
-                    logger.debug(f"Selected post-day upgrade: {self.selected_post_day_upgrade}")
+                    logger.debug("Selected post-day upgrade: %s", self.selected_post_day_upgrade)
             elif event.key == pygame.K_RETURN:
                 if self.post_day_upgrades and 0 <= self.selected_post_day_upgrade < len(self.post_day_upgrades):
                     selected_upgrade = self.post_day_upgrades[self.selected_post_day_upgrade]
                     self.apply_upgrade(selected_upgrade, player)
                     self.show_post_day_upgrades = False
-                    logger.info(f"Selected post-day upgrade: {selected_upgrade['name']}")
+                    logger.info("Selected post-day upgrade: %s", selected_upgrade['name'])
                     return True
         return False
 
@@ -491,7 +540,7 @@ class UI:
         shop_upgrades = [item for item in upgrades_cfg.get("shop", []) if not (item.get('unlocked', False) and item.get('permanent', False))]
         self.post_day_upgrades = random.sample(shop_upgrades, min(3, len(shop_upgrades))) if shop_upgrades else []
         self.selected_post_day_upgrade = 0
-        logger.debug(f"Selected {len(self.post_day_upgrades)} post-day upgrades")
+        logger.debug("Selected %s post-day upgrades", len(self.post_day_upgrades))
 
     def apply_upgrade(self, upgrade, player):
         """Apply a selected upgrade to the player and mark permanent upgrades as unlocked."""
@@ -500,16 +549,16 @@ class UI:
             if effect["attribute"] == "mining_speed":
                 player.mining_speed_boost += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: mining_speed += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: mining_speed += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "health":
                 player.max_health += effect["value"]
                 player.health += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: health += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: health += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "cash_multiplier":
                 player.cash_multiplier += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: cash_multiplier += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: cash_multiplier += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "lucky_miner":
                 player.lucky_miner = True
                 upgrade["unlocked"] = True
@@ -517,41 +566,41 @@ class UI:
             elif effect["attribute"] == "aoe_mining":
                 player.aoe_mining += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: aoe_mining += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: aoe_mining += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "rock_damage_reduction":
                 player.rock_damage_reduction += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: rock_damage_reduction += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: rock_damage_reduction += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "mining_range":
                 player.mining_range += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: mining_range += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: mining_range += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "fatigue_reduction":
                 player.fatigue_reduction += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: fatigue_reduction += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: fatigue_reduction += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "quota_buffer":
                 player.quota_buffer += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: quota_buffer += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: quota_buffer += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "day_extension":
                 player.day_extension += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: day_extension += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: day_extension += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "jump_boost":
                 player.jump_boost += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: jump_boost += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: jump_boost += %s, marked as unlocked", effect['value'])
             elif effect["attribute"] == "ore_pickup_range":
                 player.ore_pickup_range += effect["value"]
                 upgrade["unlocked"] = True
-                logger.debug(f"Applied permanent upgrade: ore_pickup_range += {effect['value']}, marked as unlocked")
+                logger.debug("Applied permanent upgrade: ore_pickup_range += %s, marked as unlocked", effect['value'])
         elif effect.get("type") == "item":
             player.inventory[effect["item"]] = player.inventory.get(effect["item"], 0) + effect.get("count", 1)
-            logger.debug(f"Added item to inventory: {effect['item']}")
+            logger.debug("Added item to inventory: %s", effect['item'])
         elif effect.get("type") == "effect":
             player.active_effects[effect["attribute"]] = {
                 "active": True,
-                "end_time": time.time() + effect["duration"]
+                "end_time": player.clock.now() + effect["duration"]
             }
-            logger.debug(f"Applied effect: {effect['attribute']} for {effect['duration']} seconds")
\ No newline at end of file
+            logger.debug("Applied effect: %s for %s seconds", effect['attribute'], effect['duration'])
\ No newline at end of file
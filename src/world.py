@@ -1,19 +1,156 @@
+import heapq
 import random
 import pygame
-import logging
 import math
+import logging
+import tempfile
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
 from data import load_ores
+from noise import GradientNoise
+from utils import spawn_ore_item
 from settings import *
+from log_config import get_logger
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; chunks are generated with the scalar path instead
+    np = None
 
 # Configure logging (Pyodide-compatible)
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.handlers = [console_handler]
+logger = get_logger(__name__)
 logger.info("Initializing world.py")
 
+# Block types that world generation can place even when ores.json omits them
+BASE_BLOCK_TYPES = ["empty", "grass", "dirt", "stone", "unstable", "cave_wall", "crystal_wall",
+                    "ruby", "sapphire", "emerald", "mithril", "diamond"]
+CAVE_ITERATIONS = 4  # Smoothing passes of the cave automaton
+CAVE_PAD = CAVE_ITERATIONS + 1  # Border around a chunk that keeps automaton edge effects out of it
+CAVE_SALT = 0x5EEDCA7E  # Separates cave seeds from the chunk content generator
+NEIGHBOURS = [(0, 1), (1, 0), (-1, 0), (0, -1)]  # Tiles that share a side
+
+def build_block_palette(ores):
+    """Build the block palette mapping byte IDs to block type names (ID 0 is an ungenerated tile)."""
+    palette = [None]
+    for name in BASE_BLOCK_TYPES + list(ores.keys()):
+        if name not in palette:
+            palette.append(name)
+    return palette
+
+def chunk_seed(world_seed, chunk_x, chunk_y):
+    """Mix the world seed and chunk coordinates into a stable 64-bit seed.
+
+    Python's built-in hash() differs between 32-bit (Pyodide) and 64-bit builds,
+    so the mix is spelled out to keep clients and the server in agreement.
+    """
+    mask = 0xFFFFFFFFFFFFFFFF
+    h = (world_seed * 0x9E3779B97F4A7C15 + chunk_x * 0xC2B2AE3D27D4EB4F + chunk_y * 0x165667B19E3779F9) & mask
+    h ^= h >> 33
+    h = (h * 0xFF51AFD7ED558CCD) & mask
+    h ^= h >> 33
+    h = (h * 0xC4CEB9FE1A85EC53) & mask
+    return h ^ (h >> 33)
+
+def cave_box_sums(grid):
+    """Sum each cell's 3x3 neighbourhood in a grid of 0/1 rows; cells outside the grid don't count."""
+    width = len(grid[0])
+    edge = [0] * (width + 2)
+    padded = [edge] + [[0] + row + [0] for row in grid] + [edge]
+    sums = []
+    for above, row, below in zip(padded, padded[1:], padded[2:]):
+        column = [a + b + c for a, b, c in zip(above, row, below)]
+        sums.append([a + b + c for a, b, c in zip(column, column[1:], column[2:])])
+    return sums
+
+def cave_box_sums_numpy(grid):
+    """NumPy version of cave_box_sums for a 2D uint8 array."""
+    padded = np.pad(grid, 1, constant_values=0)
+    column = padded[:-2] + padded[1:-1] + padded[2:]
+    return column[:, :-2] + column[:, 1:-1] + column[:, 2:]
+
+def random_block(rng, count):
+    """Draw count floats as a NumPy array, matching count successive rng.random() calls exactly.
+
+    random() builds each double from two 32-bit Mersenne Twister words; getrandbits
+    returns the same words little-endian, so the whole block can be drawn in one call.
+    """
+    words = np.frombuffer(rng.getrandbits(64 * count).to_bytes(8 * count, "little"), dtype="<u4")
+    high = (words[0::2] >> 5).astype(np.float64)
+    low = (words[1::2] >> 6).astype(np.float64)
+    return (high * 67108864.0 + low) * (1.0 / 9007199254740992.0)
+
+def numpy_worldgen_available():
+    """Check that NumPy is installed and random_block reproduces random.Random on this interpreter."""
+    if np is None:
+        return False
+    reference, bulk = random.Random(12345), random.Random(12345)
+    expected = [reference.random() for _ in range(8)]
+    if random_block(bulk, 8).tolist() != expected or bulk.random() != reference.random():
+        return False
+    noise = GradientNoise(12345)
+    return noise.noise_block_array(-40, 37, 16, 16, ORE_NOISE_SCALE).ravel().tolist() == noise.noise_block(-40, 37, 16, 16, ORE_NOISE_SCALE)
+
+class ChunkSpillFile:
+    def __init__(self, chunk_bytes):
+        """Initialize a spill file holding evicted chunks in fixed-size slots."""
+        self.chunk_bytes = chunk_bytes
+        self.file = None
+        self.slots = {}  # (chunk_x, chunk_y): slot index
+        self.failed = False
+
+    def _open(self):
+        """Open the backing temp file on first use; returns False if the platform has no writable temp dir."""
+        if self.file is None and not self.failed:
+            try:
+                self.file = tempfile.TemporaryFile(prefix="yearn_chunks_")
+                logger.info("Opened chunk spill file")
+            except OSError as e:
+                self.failed = True
+                logger.warning("Chunk spill file unavailable, evicted chunks will be regenerated: %s", e)
+        return self.file is not None
+
+    def write(self, chunk_key, chunk):
+        """Write a chunk to its slot, allocating a new slot on first write."""
+        if not self._open():
+            return False
+        slot = self.slots.get(chunk_key)
+        if slot is None:
+            slot = len(self.slots)
+        try:
+            self.file.seek(slot * self.chunk_bytes)
+            self.file.write(chunk)
+        except OSError as e:
+            logger.error("Failed to spill chunk %s: %s", chunk_key, e)
+            return False
+        self.slots[chunk_key] = slot
+        return True
+
+    def read(self, chunk_key):
+        """Read a spilled chunk back, or return None if it was never spilled."""
+        slot = self.slots.get(chunk_key)
+        if slot is None:
+            return None
+        try:
+            self.file.seek(slot * self.chunk_bytes)
+            data = self.file.read(self.chunk_bytes)
+        except OSError as e:
+            logger.error("Failed to page in chunk %s: %s", chunk_key, e)
+            return None
+        if len(data) != self.chunk_bytes:
+            return None
+        return bytearray(data)
+
+    def clear(self):
+        """Forget all spilled chunks, e.g. after the seed or journal changes."""
+        self.slots = {}
+        if self.file is not None:
+            self.file.seek(0)
+            self.file.truncate()
+
 class FallingRock:
+    __slots__ = ("x", "y", "velocity", "active", "ore_type", "row")
+
     def __init__(self):
         """Initialize a falling rock with default properties."""
         self.x = 0
@@ -21,6 +158,7 @@ class FallingRock:
         self.velocity = 0
         self.active = False
         self.ore_type = "stone"
+        self.row = -1  # Tile row last checked for a landing, so the check runs once per row
 
     def activate(self, x, y, velocity, ore_type):
         """Activate the falling rock at the specified position with given velocity and ore type."""
@@ -29,7 +167,8 @@ class FallingRock:
         self.velocity = velocity
         self.ore_type = ore_type
         self.active = True
-        logger.debug(f"Activated FallingRock at ({x}, {y}) with ore {ore_type}")
+        self.row = -1
+        logger.debug("Activated FallingRock at (%s, %s) with ore %s", x, y, ore_type)
 
     def update(self, dt, world, ores):
         """Update the falling rock's position and check for collisions, returning value if it lands."""
@@ -37,22 +176,92 @@ class FallingRock:
             return 0
         self.y += self.velocity * dt
         self.velocity += 0.5  # Gravity effect
-        grid_x = int(self.x // TILE_SIZE)
         grid_y = int(self.y // TILE_SIZE)
+        if grid_y == self.row:
+            return 0
+        self.row = grid_y
+        grid_x = int(self.x // TILE_SIZE)
         if grid_y >= MAX_DEPTH or (0 <= grid_x < NUM_COLS and grid_y < MAX_DEPTH and world.block_at(grid_x, grid_y) != "empty"):
-            logger.debug(f"FallingRock at ({grid_x}, {grid_y}) collided")
+            logger.debug("FallingRock at (%s, %s) collided", grid_x, grid_y)
             self.active = False
             return ores.get(self.ore_type, {"value": 0})["value"] if self.ore_type != "unstable" else 0
         return 0
 
+class ChunkPrefetcher:
+    """Generate chunks the players are about to reach during idle frame time."""
+    def __init__(self, world, lookahead=PREFETCH_LOOKAHEAD):
+        """Initialize an empty prefetch queue for a world."""
+        self.world = world
+        self.lookahead = lookahead
+        self.queue = deque()  # Chunk keys in the order they will be generated
+        self.chunk_cost = 0.002  # Running estimate of seconds per chunk, so a frame's budget is not overrun
+
+    def plan(self, players, camera_x, camera_y):
+        """Queue missing chunks around the view and along each player's predicted path."""
+        world = self.world
+        chunk_px = world.chunk_size * TILE_SIZE
+        max_chunk_x = (NUM_COLS - 1) // world.chunk_size
+        max_chunk_y = (MAX_DEPTH - 1) // world.chunk_size
+        half_width = WIDTH / 2 + chunk_px
+        half_height = HEIGHT / 2 + chunk_px
+        centers = [(camera_x + WIDTH / 2, camera_y + HEIGHT / 2)]
+        for player in players:
+            x, y = player.rect.center
+            for step in range(1, 5):
+                t = self.lookahead * step / 4
+                centers.append((x + player.vx * t, y + player.vy * t))
+        queue = []
+        seen = set()
+        for center_x, center_y in centers:
+            for chunk_y in range(max(0, int((center_y - half_height) // chunk_px)), min(max_chunk_y, int((center_y + half_height) // chunk_px)) + 1):
+                for chunk_x in range(max(0, int((center_x - half_width) // chunk_px)), min(max_chunk_x, int((center_x + half_width) // chunk_px)) + 1):
+                    key = (chunk_x, chunk_y)
+                    if key not in seen and key not in world.chunks:
+                        seen.add(key)
+                        queue.append(key)
+        self.queue = deque(queue)
+
+    def run(self, budget):
+        """Generate queued chunks until the time budget in seconds would be exceeded; return how many were made.
+
+        The first chunk is always generated when there is any budget, so one slow chunk inflating
+        the cost estimate past the budget cannot stall prefetching for good.
+        """
+        if budget <= 0:
+            return 0
+        start = time.perf_counter()
+        generated = 0
+        while self.queue and (not generated or time.perf_counter() - start + self.chunk_cost <= budget):
+            chunk_x, chunk_y = self.queue.popleft()
+            if (chunk_x, chunk_y) in self.world.chunks:
+                continue
+            chunk_start = time.perf_counter()
+            self.world.get_chunk(chunk_x, chunk_y)
+            self.chunk_cost += (time.perf_counter() - chunk_start - self.chunk_cost) * 0.2
+            generated += 1
+        if generated:
+            logger.debug("Prefetched %s chunks, %s still queued", generated, len(self.queue))
+        return generated
+
 class World:
-    def __init__(self):
+    def __init__(self, chunk_budget=CHUNK_CACHE_SIZE, use_numpy=None):
         """Initialize the world with chunks, falling rocks, and depth zones."""
         self.ores = load_ores()
         self.chunk_size = 16
-        self.chunks = {}
+        self.chunks = OrderedDict()  # (chunk_x, chunk_y): bytearray of block IDs, row-major, least recently used first
+        self.chunk_budget = chunk_budget
+        self.focus_chunks = set()  # Chunks near players that eviction must keep
+        self.spill = ChunkSpillFile(self.chunk_size * self.chunk_size)
+        self.prefetcher = ChunkPrefetcher(self)
+        if use_numpy is None:
+            use_numpy = USE_NUMPY_WORLDGEN
+        self.use_numpy = use_numpy and numpy_worldgen_available()
+        self.block_palette = build_block_palette(self.ores)
+        self.block_ids = {name: i for i, name in enumerate(self.block_palette)}
+        self.unstable_id = self.block_ids["unstable"]
         self.seed = random.randint(0, 1000000)
-        self.falling_rocks = [FallingRock() for _ in range(5)]
+        self.noise = GradientNoise(self.seed)
+        self.falling_rocks = [FallingRock() for _ in range(5)]  # Pool; grows when every rock is in flight
         self.block_states = {}  # Track cracking stages (x, y): stage
         self.depth_zones = [
             {"name": "Surface", "depth": 0, "blocks": ["grass", "dirt"], "hazard_chance": 0.0, "color": (135, 206, 235), "cave_chance": 0.0, "cave_size": 0, "value_scale": 1.0},
@@ -62,25 +271,125 @@ class World:
             {"name": "Deep", "depth": 500, "blocks": ["stone", "iron", "silver", "gold", "sapphire", "ruby", "emerald", "amethyst", "platinum", "mithril"], "hazard_chance": 0.02, "color": (47, 79, 79), "cave_chance": 0.1, "cave_size": 4, "value_scale": 3.0},
             {"name": "Abyss", "depth": 1000, "blocks": ["stone", "gold", "sapphire", "ruby", "emerald", "amethyst", "platinum", "mithril", "diamond"], "hazard_chance": 0.03, "color": (25, 25, 112), "cave_chance": 0.15, "cave_size": 6, "value_scale": 5.0}
         ]
-        self.unstable_blocks = {}
-        self.block_cols = {}  # Initialize block_cols for saving/loading
+        self.zone_depths = [zone["depth"] for zone in self.depth_zones]
+        self.ore_tables = self.build_ore_tables()
+        self.unstable_index = {}  # (chunk_x, chunk_y): {(x, y)} of unstable tiles, for every cached chunk
+        self.unstable_blocks = {}  # (x, y): collapse deadline of undermined unstable blocks
+        self.collapse_queue = []  # Heap of (deadline, x, y); entries whose deadline no longer matches are stale
+        self.elapsed = 0.0  # Seconds of world updates, the time base for collapse deadlines
+        self.block_edits = {}  # Player-made changes since generation: (chunk_x, chunk_y): {(x, y): block_type}
+        self.revision = 0  # Bumped on every visible change so cached chunk renders can be invalidated
+        self.base_revision = 0  # Revision of chunks not touched since the last reseed or load
+        self.chunk_revisions = {}  # (chunk_x, chunk_y): revision of the last change to that chunk
         self.ensure_depth(1)
         logger.info("World initialized")
 
-    def load_from_block_cols(self, block_cols):
-        """Load world state from block_cols dictionary."""
-        self.chunks = {}  # Clear existing chunks
-        self.block_cols = block_cols
-        for (x, y), block_type in block_cols.items():
+    def build_ore_tables(self):
+        """Precompute per-zone cumulative ore weights for each depth band where the eligible ores change.
+
+        Returns {zone name: (band start rows, bands, total weight)}, where each band is
+        (cumulative weights, ore names, ore IDs ending with stone) for bisecting a roll.
+        """
+        tables = {}
+        for zone in self.depth_zones:
+            total_weight = sum(self.ores.get(ore, {"weight": 0})["weight"] for ore in zone["blocks"])
+            # Rows where an ore's min_depth first admits it; the eligible set is constant between them
+            starts = sorted({0} | {max(0, -(-self.ores.get(ore, {"min_depth": 0})["min_depth"] // TILE_SIZE)) for ore in zone["blocks"]})
+            bands = []
+            for start_row in starts:
+                names = [ore for ore in zone["blocks"] if start_row * TILE_SIZE >= self.ores.get(ore, {"min_depth": 0})["min_depth"]]
+                cumulative = []
+                current_weight = 0
+                for ore in names:
+                    current_weight += self.ores.get(ore, {"weight": 0})["weight"]
+                    cumulative.append(current_weight)
+                ids = [self.block_id(ore) for ore in names] + [self.block_id("stone")]
+                if self.use_numpy:
+                    cumulative = np.array(cumulative, dtype=np.float64)
+                    ids = np.array(ids, dtype=np.uint8)
+                bands.append((cumulative, names, ids))
+            tables[zone["name"]] = (starts, bands, total_weight)
+        return tables
+
+    def ore_band(self, zone, y):
+        """Return (cumulative weights, ore names, ore IDs, total weight) for a zone at tile row y."""
+        starts, bands, total_weight = self.ore_tables[zone["name"]]
+        cumulative, names, ids = bands[max(bisect_right(starts, y) - 1, 0)]
+        return cumulative, names, ids, total_weight
+
+    def load_from_block_cols(self, block_edits):
+        """Load world state from a {(x, y): block_type} edit journal, replayed as chunks are regenerated."""
+        self.chunks = OrderedDict()  # Clear existing chunks so they regenerate from the seed
+        self.spill.clear()
+        self.reset_revisions()
+        self.reset_stability()
+        self.block_edits = {}
+        for (x, y), block_type in block_edits.items():
             if not (0 <= x < NUM_COLS and 0 <= y < MAX_DEPTH):
                 continue
-            chunk_x, chunk_y = x // self.chunk_size, y // self.chunk_size
-            local_x, local_y = x % self.chunk_size, y % self.chunk_size
-            chunk_key = (chunk_x, chunk_y)
-            if chunk_key not in self.chunks:
-                self.chunks[chunk_key] = [[None for _ in range(self.chunk_size)] for _ in range(self.chunk_size)]
-            self.chunks[chunk_key][local_x][local_y] = block_type
-        logger.info("Loaded world from block_cols")
+            chunk_key = (x // self.chunk_size, y // self.chunk_size)
+            self.block_edits.setdefault(chunk_key, {})[(x, y)] = block_type
+        logger.info("Loaded world edit journal with %s tiles", len(block_edits))
+
+    def iter_block_edits(self):
+        """Yield ((x, y), block_type) for every tile changed since generation."""
+        for edits in self.block_edits.values():
+            yield from edits.items()
+
+    def apply_block_edits(self, chunk_x, chunk_y, chunk):
+        """Replay journaled edits onto a freshly generated chunk."""
+        edits = self.block_edits.get((chunk_x, chunk_y))
+        if not edits:
+            return
+        for (x, y), block_type in edits.items():
+            chunk[(y % self.chunk_size) * self.chunk_size + x % self.chunk_size] = self.block_id(block_type)
+
+    def set_seed(self, seed):
+        """Switch to a new world seed, discarding generated chunks but keeping the edit journal."""
+        self.seed = seed
+        self.noise = GradientNoise(seed)
+        self.chunks = OrderedDict()
+        self.spill.clear()
+        self.reset_revisions()
+        self.reset_stability()
+        logger.info("World seed set to %s", seed)
+
+    def reset_revisions(self):
+        """Mark every chunk as changed, after the whole world has been regenerated."""
+        self.revision += 1
+        self.base_revision = self.revision
+        self.chunk_revisions = {}
+
+    def reset_stability(self):
+        """Forget unstable tiles and pending collapses, after the whole world has been regenerated."""
+        self.unstable_index = {}
+        self.unstable_blocks = {}
+        self.collapse_queue = []
+
+    def touch_chunk(self, chunk_x, chunk_y):
+        """Record a visible change to a chunk."""
+        self.revision += 1
+        self.chunk_revisions[(chunk_x, chunk_y)] = self.revision
+
+    def chunk_revision(self, chunk_x, chunk_y):
+        """Get a number that changes whenever the chunk's blocks or mining states change."""
+        return self.chunk_revisions.get((chunk_x, chunk_y), self.base_revision)
+
+    def chunk_rng(self, chunk_x, chunk_y):
+        """Get a fresh random generator that reproduces the given chunk's contents."""
+        return random.Random(chunk_seed(self.seed, chunk_x, chunk_y))
+
+    def block_id(self, block_type):
+        """Get the palette ID for a block type, registering unknown types on first use."""
+        block_id = self.block_ids.get(block_type)
+        if block_id is None:
+            if len(self.block_palette) >= 256:
+                raise ValueError(f"Block palette is full, cannot add {block_type}")
+            block_id = len(self.block_palette)
+            self.block_palette.append(block_type)
+            self.block_ids[block_type] = block_id
+            logger.debug("Registered block type %s as ID %s", block_type, block_id)
+        return block_id
 
     def block_at(self, x, y):
         """Get the block type at the specified coordinates."""
@@ -89,174 +398,411 @@ class World:
         chunk_x, chunk_y = x // self.chunk_size, y // self.chunk_size
         local_x, local_y = x % self.chunk_size, y % self.chunk_size
         chunk = self.get_chunk(chunk_x, chunk_y)
-        return chunk[local_x][local_y]
+        return self.block_palette[chunk[local_y * self.chunk_size + local_x]]
 
     def set_block(self, x, y, block_type):
-        """Set the block type at the specified coordinates and update block_cols."""
+        """Set the block type at the specified coordinates and record it in the edit journal."""
         if not (0 <= x < NUM_COLS and 0 <= y < MAX_DEPTH):
             return
         chunk_x, chunk_y = x // self.chunk_size, y // self.chunk_size
         local_x, local_y = x % self.chunk_size, y % self.chunk_size
         chunk = self.get_chunk(chunk_x, chunk_y)
-        chunk[local_x][local_y] = block_type
-        self.block_cols[(x, y)] = block_type
+        index = local_y * self.chunk_size + local_x
+        block_id = self.block_id(block_type)
+        old_id = chunk[index]
+        if old_id != block_id:
+            chunk[index] = block_id
+            if old_id == self.unstable_id or block_id == self.unstable_id:
+                self.track_unstable((chunk_x, chunk_y), x, y, old_id)
+            self.block_edits.setdefault((chunk_x, chunk_y), {})[(x, y)] = block_type
+            self.touch_chunk(chunk_x, chunk_y)
         if block_type == "empty":
             if (x, y) in self.block_states:
                 del self.block_states[(x, y)]  # Clean up block state
+                self.touch_chunk(chunk_x, chunk_y)
             self.check_stability(x, y)
-        logger.debug(f"Set block at ({x}, {y}): {block_type}")
+        if logger.isEnabledFor(logging.DEBUG):  # set_block runs per tile during bulk edits
+            logger.debug("Set block at (%s, %s): %s", x, y, block_type)
+
+    def break_block(self, x, y, player, game):
+        """Mine out a block for a player without a server, dropping its ore; return the block type."""
+        block_type = self.block_at(x, y)
+        if not block_type or block_type == "empty":
+            return None
+        self.set_block(x, y, "empty")
+        self.drop_block_ore(x, y, block_type, game)
+        return block_type
+
+    def drop_block_ore(self, x, y, block_type, game):
+        """Spawn the ore item for a mined block and count it towards the game's totals."""
+        if block_type != "grass":
+            spawn_ore_item(game, x * TILE_SIZE, y * TILE_SIZE, block_type)
+            game.ores_mined += 1
+            if block_type == "diamond":
+                game.diamonds_mined += 1
+
+    def apply_region(self, tiles, new_type):
+        """Set every (x, y) in tiles to new_type with one pass per chunk; return [(x, y, old_type)] for tiles that changed."""
+        size = self.chunk_size
+        by_chunk = {}
+        for x, y in tiles:
+            if 0 <= x < NUM_COLS and 0 <= y < MAX_DEPTH:
+                by_chunk.setdefault((x // size, y // size), []).append((x, y))
+        new_id = self.block_id(new_type)
+        unstable_id = self.unstable_id
+        palette = self.block_palette
+        changed = []
+        for chunk_key, chunk_tiles in by_chunk.items():
+            chunk = self.get_chunk(*chunk_key)
+            first_col, first_row = chunk_key[0] * size, chunk_key[1] * size
+            edits = None
+            touched = False
+            for x, y in chunk_tiles:
+                index = (y - first_row) * size + x - first_col
+                old_id = chunk[index]
+                if old_id != new_id:
+                    chunk[index] = new_id
+                    if old_id == unstable_id or new_id == unstable_id:
+                        self.track_unstable(chunk_key, x, y, old_id)
+                    if edits is None:
+                        edits = self.block_edits.setdefault(chunk_key, {})
+                    edits[(x, y)] = new_type
+                    changed.append((x, y, palette[old_id]))
+                    touched = True
+                if new_type == "empty" and self.block_states.pop((x, y), None) is not None:
+                    touched = True
+            if touched:
+                self.touch_chunk(*chunk_key)
+        if new_type == "empty" and changed:
+            # Only the region's outer frontier can hold blocks whose support changed, and each is checked once
+            inside = {(x, y) for x, y, _ in changed}
+            frontier = {(x + dx, y + dy) for x, y, _ in changed for dx, dy in NEIGHBOURS} - inside
+            for nx, ny in frontier:
+                self.mark_if_unstable(nx, ny)
+        logger.debug("Applied %s to %s tiles in %s chunks", new_type, len(changed), len(by_chunk))
+        return changed
+
+    def track_unstable(self, chunk_key, x, y, old_id):
+        """Keep the unstable index and pending collapses in step with an edit that adds or removes an unstable tile."""
+        if old_id == self.unstable_id:
+            self.unstable_index[chunk_key].discard((x, y))
+            self.unstable_blocks.pop((x, y), None)  # Its queued collapse goes stale
+        else:
+            self.unstable_index[chunk_key].add((x, y))
+
+    def break_region(self, tiles, game):
+        """Mine out a region for a player without a server, dropping ore for each block; return the blocks removed."""
+        changed = self.apply_region(tiles, "empty")
+        for x, y, block_type in changed:
+            if block_type:  # Ungenerated tiles hold no ore
+                self.drop_block_ore(x, y, block_type, game)
+        return changed
 
     def set_block_state(self, x, y, stage):
         """Set the mining progress stage for a block."""
         if 0 <= x < NUM_COLS and 0 <= y < MAX_DEPTH:
+            if self.block_states.get((x, y), 0) != stage:
+                self.touch_chunk(x // self.chunk_size, y // self.chunk_size)
             self.block_states[(x, y)] = stage
-            logger.debug(f"Set block state at ({x}, {y}) to stage {stage}")
+            logger.debug("Set block state at (%s, %s) to stage %s", x, y, stage)
 
     def get_block_state(self, x, y):
         """Get the mining progress stage for a block."""
         return self.block_states.get((x, y), 0)
 
+    def is_solid(self, tx, ty):
+        """Check whether the tile at (tx, ty) blocks movement."""
+        if not (0 <= tx < NUM_COLS and 0 <= ty < MAX_DEPTH):
+            return False
+        size = self.chunk_size
+        block = self.get_chunk(tx // size, ty // size)[(ty % size) * size + tx % size]
+        return block != 0 and block != self.block_ids["empty"]
+
+    def solid_tiles_near(self, rect, margin=1):
+        """Yield (tx, ty) for solid tiles within margin tiles of a pixel rect, read straight from chunk data."""
+        size = self.chunk_size
+        empty_id = self.block_ids["empty"]
+        left = max(0, int(rect.left // TILE_SIZE) - margin)
+        right = min(NUM_COLS, int((rect.right - 1) // TILE_SIZE) + margin + 1)
+        top = max(0, int(rect.top // TILE_SIZE) - margin)
+        bottom = min(MAX_DEPTH, int((rect.bottom - 1) // TILE_SIZE) + margin + 1)
+        for ty in range(top, bottom):
+            row = (ty % size) * size
+            chunk_x = None
+            for tx in range(left, right):
+                if tx // size != chunk_x:
+                    chunk_x = tx // size
+                    chunk = self.get_chunk(chunk_x, ty // size)
+                block = chunk[row + tx % size]
+                if block and block != empty_id:
+                    yield tx, ty
+
+    def colliding_tiles(self, rect):
+        """Yield (tx, ty) for solid tiles overlapping a pixel rect, checked against the rect as it is moved."""
+        for tx, ty in self.solid_tiles_near(rect, margin=0):
+            x = tx * TILE_SIZE
+            y = ty * TILE_SIZE
+            if rect.left < x + TILE_SIZE and rect.right > x and rect.top < y + TILE_SIZE and rect.bottom > y:
+                yield tx, ty
+
     def get_surrounding_blocks(self, rect):
         """Get a list of surrounding non-empty block rectangles for collision detection."""
-        blocks = []
-        left = int(rect.left // TILE_SIZE) - 1
-        right = int(rect.right // TILE_SIZE) + 2
-        top = int(rect.top // TILE_SIZE) - 1
-        bottom = int(rect.bottom // TILE_SIZE) + 2
-        for ty in range(max(0, top), min(bottom, MAX_DEPTH)):
-            for tx in range(max(0, left), min(right, NUM_COLS)):
-                block_type = self.block_at(tx, ty)
-                if block_type and block_type != "empty":
-                    blocks.append(pygame.Rect(tx * TILE_SIZE, ty * TILE_SIZE, TILE_SIZE, TILE_SIZE))
-        return blocks
+        return [pygame.Rect(tx * TILE_SIZE, ty * TILE_SIZE, TILE_SIZE, TILE_SIZE) for tx, ty in self.solid_tiles_near(rect)]
 
     def get_chunk(self, chunk_x, chunk_y):
-        """Get or generate a chunk at the specified chunk coordinates."""
+        """Get a chunk, paging it in from the spill file or generating it if it is not cached."""
         chunk_key = (chunk_x, chunk_y)
-        if chunk_key not in self.chunks:
+        chunk = self.chunks.get(chunk_key)
+        if chunk is not None:
+            self.chunks.move_to_end(chunk_key)
+            return chunk
+        chunk = self.spill.read(chunk_key)
+        if chunk is not None:
+            self.index_unstable(chunk_x, chunk_y, chunk)
+            self.chunks[chunk_key] = chunk
+            logger.debug("Paged in chunk %s from spill file", chunk_key)
+        else:
             self.generate_chunk(chunk_x, chunk_y)
-        return self.chunks[chunk_key]
+        chunk = self.chunks[chunk_key]
+        if len(self.chunks) > self.chunk_budget:
+            self.evict_chunks(keep=chunk_key)
+        return chunk
+
+    def set_focus(self, positions):
+        """Mark chunks around the given pixel positions as in use so eviction keeps them."""
+        radius = CHUNK_KEEP_RADIUS
+        span = self.chunk_size * TILE_SIZE
+        focus = set()
+        for px, py in positions:
+            center_x, center_y = int(px // span), int(py // span)
+            for chunk_y in range(center_y - radius, center_y + radius + 1):
+                for chunk_x in range(center_x - radius, center_x + radius + 1):
+                    focus.add((chunk_x, chunk_y))
+        self.focus_chunks = focus
+
+    def evict_chunks(self, keep=None):
+        """Evict least recently used chunks outside the focus area and other than keep, spilling edited ones to disk.
+
+        The cache may stay over budget when the focus area alone needs more room.
+        """
+        target = self.chunk_budget - self.chunk_budget // 8  # Evict in batches to amortize the scan
+        evicted = 0
+        for chunk_key in list(self.chunks):
+            if len(self.chunks) <= target:
+                break
+            if chunk_key in self.focus_chunks or chunk_key == keep:
+                continue
+            chunk = self.chunks.pop(chunk_key)
+            self.unstable_index.pop(chunk_key, None)  # Rebuilt when the chunk is generated or paged in again
+            if chunk_key in self.block_edits:
+                self.spill.write(chunk_key, chunk)  # Edited chunks can also be rebuilt from the journal if this fails
+            evicted += 1
+        logger.debug("Evicted %s chunks, %s cached, %s spilled", evicted, len(self.chunks), len(self.spill.slots))
 
     def generate_chunk(self, chunk_x, chunk_y):
         """Generate a chunk with blocks, caves, and hazards based on depth zone."""
-        chunk = [[None for _ in range(self.chunk_size)] for _ in range(self.chunk_size)]
-        start_y = chunk_y * self.chunk_size
-        end_y = min((chunk_y + 1) * self.chunk_size, MAX_DEPTH)
+        size = self.chunk_size
+        chunk = bytearray(size * size)
+        start_y = chunk_y * size
+        end_y = min((chunk_y + 1) * size, MAX_DEPTH)
         zone = self.get_depth_zone(start_y)
+        rng = self.chunk_rng(chunk_x, chunk_y)
+        if self.use_numpy:
+            self.generate_chunk_numpy(chunk, chunk_x, chunk_y, zone, rng)
+            self.apply_block_edits(chunk_x, chunk_y, chunk)
+            self.index_unstable(chunk_x, chunk_y, chunk)
+            self.chunks[(chunk_x, chunk_y)] = chunk
+            logger.debug("Generated chunk (%s, %s) with NumPy", chunk_x, chunk_y)
+            return
 
         # Initialize chunk with blocks
-        for y in range(max(1, start_y), end_y):
-            for x in range(self.chunk_size):
-                world_x = chunk_x * self.chunk_size + x
+        first_y = max(1, start_y)
+        noise = self.noise.noise_block(chunk_x * size, first_y, size, max(end_y - first_y, 0), ORE_NOISE_SCALE)
+        for y in range(first_y, end_y):
+            row = (y - start_y) * size
+            noise_row = (y - first_y) * size
+            for x in range(size):
+                world_x = chunk_x * size + x
                 world_y = y
                 if chunk_y == 0 and y == 0:
-                    chunk[x][0] = "grass"
+                    block_type = "grass"
                 else:
-                    chunk[x][y - start_y] = self.generate_ore_vein(world_x, world_y, zone)
-                self.block_cols[(world_x, world_y)] = chunk[x][y - start_y]
+                    block_type = self.generate_ore_vein(world_x, world_y, zone, rng, noise[noise_row + x])
+                chunk[row + x] = self.block_id(block_type)
 
-        # Generate caves if applicable
-        if start_y > 10 and random.random() < zone["cave_chance"]:
-            self.generate_cave(chunk, chunk_x, chunk_y, zone)
+        # Carve caves seeded in this chunk or its neighbours
+        self.generate_cave(chunk, chunk_x, chunk_y, zone, rng)
 
         # Add unstable blocks
+        unstable_id = self.block_id("unstable")
         for y in range(max(1, start_y), end_y):
-            for x in range(self.chunk_size):
+            row = (y - start_y) * size
+            for x in range(size):
                 world_y = y
                 hazard_chance = zone["hazard_chance"] * (1 + world_y / 10000)
-                if random.random() < hazard_chance and world_y > 50:
-                    chunk[x][y - start_y] = "unstable"
-                    self.block_cols[(chunk_x * self.chunk_size + x, world_y)] = "unstable"
+                if rng.random() < hazard_chance and world_y > 50:
+                    chunk[row + x] = unstable_id
 
+        self.apply_block_edits(chunk_x, chunk_y, chunk)
+        self.index_unstable(chunk_x, chunk_y, chunk)
         self.chunks[(chunk_x, chunk_y)] = chunk
-        logger.debug(f"Generated chunk ({chunk_x}, {chunk_y})")
+        logger.debug("Generated chunk (%s, %s)", chunk_x, chunk_y)
+
+    def index_unstable(self, chunk_x, chunk_y, chunk):
+        """Record where the unstable tiles are in a chunk entering the cache."""
+        size = self.chunk_size
+        tiles = set()
+        index = chunk.find(self.unstable_id)
+        while index != -1:
+            tiles.add((chunk_x * size + index % size, chunk_y * size + index // size))
+            index = chunk.find(self.unstable_id, index + 1)
+        self.unstable_index[(chunk_x, chunk_y)] = tiles
 
-    def generate_cave(self, chunk, chunk_x, chunk_y, zone):
-        """Generate a cave in the chunk using cellular automaton, preserving rare ores."""
-        temp_grid = [[1 for _ in range(self.chunk_size)] for _ in range(self.chunk_size)]
-        start_y = chunk_y * self.chunk_size
+    def generate_chunk_numpy(self, chunk, chunk_x, chunk_y, zone, rng):
+        """Fill a chunk using whole-chunk array operations; output matches the scalar path for the same seed."""
+        size = self.chunk_size
+        start_y = chunk_y * size
+        first_y = max(1, start_y)
+        end_y = min((chunk_y + 1) * size, MAX_DEPTH)
+        rows = end_y - first_y
+        if rows <= 0:
+            return
+        world_ys = range(first_y, end_y)
+        offset = (first_y - start_y) * size
+        count = rows * size
+
+        # Ore field
+        noise = self.noise.noise_block_array(chunk_x * size, first_y, size, rows, ORE_NOISE_SCALE)
+        total_weight = self.ore_tables[zone["name"]][2]
+        r = (noise + random_block(rng, count).reshape(rows, size)) / 2 * total_weight
+        block_ids = np.empty((rows, size), dtype=np.uint8)
+        for i, y in enumerate(world_ys):
+            cumulative, _, ids, _ = self.ore_band(zone, y)
+            block_ids[i] = ids[np.searchsorted(cumulative, r[i], side="left")]
+        chunk[offset:offset + count] = block_ids.tobytes()
+
+        # Caves draw from the same generator between the ore field and the hazard mask
+        self.generate_cave(chunk, chunk_x, chunk_y, zone, rng)
+
+        # Hazard mask
+        hazard_chance = np.array([zone["hazard_chance"] * (1 + y / 10000) if y > 50 else -1.0 for y in world_ys])
+        hazard = random_block(rng, count).reshape(rows, size) < hazard_chance[:, None]
+        tiles = np.frombuffer(chunk, dtype=np.uint8, count=count, offset=offset).copy().reshape(rows, size)
+        tiles[hazard] = self.block_id("unstable")
+        chunk[offset:offset + count] = tiles.tobytes()
+
+    def cave_seeds(self, chunk_x, chunk_y):
+        """Get the (x, y, radius) cave seeds a chunk starts, from a generator neighbours can reproduce."""
+        size = self.chunk_size
+        start_y = chunk_y * size
+        if start_y <= 10 or not (0 <= chunk_x < NUM_COLS // size and start_y < MAX_DEPTH):
+            return []
+        zone = self.get_depth_zone(start_y)
+        rng = random.Random(chunk_seed(self.seed ^ CAVE_SALT, chunk_x, chunk_y))
+        if rng.random() >= zone["cave_chance"]:
+            return []
         cave_size = zone["cave_size"]
-        num_seeds = random.randint(1, 3)
-        for _ in range(num_seeds):
-            seed_x = random.randint(2, self.chunk_size - 3)
-            seed_y = random.randint(2, self.chunk_size - 3)
-            temp_grid[seed_x][seed_y] = 0
-
-        # Cellular automaton for cave shape
-        for _ in range(4):
-            new_grid = [[1 for _ in range(self.chunk_size)] for _ in range(self.chunk_size)]
-            for y in range(self.chunk_size):
-                for x in range(self.chunk_size):
-                    neighbors = sum(
-                        1 for dx in range(-1, 2) for dy in range(-1, 2)
-                        if 0 <= x + dx < self.chunk_size and 0 <= y + dy < self.chunk_size and temp_grid[x + dx][y + dy] == 1
-                    )
-                    if temp_grid[x][y] == 1 and neighbors < 4:
-                        new_grid[x][y] = 0
-                    elif temp_grid[x][y] == 0 and neighbors >= 5:
-                        new_grid[x][y] = 1
-                    else:
-                        new_grid[x][y] = temp_grid[x][y]
-            temp_grid = new_grid
+        seeds = []
+        for _ in range(rng.randint(1, 3)):
+            seed_x = chunk_x * size + rng.randint(2, size - 3)
+            seed_y = start_y + rng.randint(2, size - 3)
+            seeds.append((seed_x, seed_y, rng.uniform(cave_size / 2, cave_size) + 1))
+        return seeds
+
+    def cave_grid(self, chunk_x, chunk_y):
+        """Build the automaton's starting grid (1 = solid) for a chunk plus a CAVE_PAD border, or None if no cave reaches it."""
+        size = self.chunk_size
+        seeds = [seed for dy in (-1, 0, 1) for dx in (-1, 0, 1) for seed in self.cave_seeds(chunk_x + dx, chunk_y + dy)]
+        if not seeds:
+            return None
+        width = size + 2 * CAVE_PAD
+        origin_x = chunk_x * size - CAVE_PAD
+        origin_y = chunk_y * size - CAVE_PAD
+        grid = [[1] * width for _ in range(width)]
+        for seed_x, seed_y, radius in seeds:
+            reach = int(radius) + 1
+            for y in range(max(seed_y - reach, origin_y), min(seed_y + reach + 1, origin_y + width)):
+                row = grid[y - origin_y]
+                for x in range(max(seed_x - reach, origin_x), min(seed_x + reach + 1, origin_x + width)):
+                    distance = math.hypot(x - seed_x, y - seed_y)
+                    # Rough edges come from a per-tile hash, so neighbouring chunks agree on them
+                    if distance <= radius - 1 or (distance <= radius + 1 and chunk_seed(self.seed ^ CAVE_SALT, x, y) & 1):
+                        row[x - origin_x] = 0
+        return grid
+
+    def generate_cave(self, chunk, chunk_x, chunk_y, zone, rng):
+        """Carve caves seeded in this chunk or its neighbours with a cellular automaton, preserving rare ores."""
+        grid = self.cave_grid(chunk_x, chunk_y)
+        if grid is None:
+            return
+        size = self.chunk_size
+        start_y = chunk_y * size
+        inner = slice(CAVE_PAD, CAVE_PAD + size)
+
+        # The box sum counts the cell itself: walls survive with 4 or more solid cells in their 3x3 block
+        # and open cells close with 5 or more, the original birth/survival rule
+        if self.use_numpy:
+            cells = np.array(grid, dtype=np.uint8)
+            for _ in range(CAVE_ITERATIONS):
+                sums = cave_box_sums_numpy(cells)
+                cells = ((sums >= 5) | ((cells == 1) & (sums >= 4))).astype(np.uint8)
+            walls = cave_box_sums_numpy(cells)[inner, inner]
+            solid = cells[inner, inner].ravel().tolist()
+            walls = (walls < 9).ravel().tolist()
+        else:
+            cells = grid
+            for _ in range(CAVE_ITERATIONS):
+                cells = [[1 if total >= 5 or (cell and total >= 4) else 0 for cell, total in zip(row, totals)]
+                         for row, totals in zip(cells, cave_box_sums(cells))]
+            walls = [total < 9 for row in cave_box_sums(cells)[inner] for total in row[inner]]
+            solid = [cell for row in cells[inner] for cell in row[inner]]
 
         # Apply cave, preserving rare ores
         rare_ores = ["ruby", "sapphire", "emerald", "mithril", "diamond"]
-        for y in range(self.chunk_size):
-            for x in range(self.chunk_size):
-                if temp_grid[x][y] == 0 and chunk[x][y] not in rare_ores:
-                    chunk[x][y] = "empty"
-                    self.block_cols[(chunk_x * self.chunk_size + x, start_y + y)] = "empty"
-                elif temp_grid[x][y] == 1 and chunk[x][y] not in rare_ores:
-                    neighbors = sum(
-                        1 for dx in range(-1, 2) for dy in range(-1, 2)
-                        if 0 <= x + dx < self.chunk_size and 0 <= y + dy < self.chunk_size and temp_grid[x + dx][y + dy] == 0
-                    )
-                    if neighbors > 0 and random.random() < 0.2:
-                        chunk[x][y] = "cave_wall" if zone["name"] != "Crystal Cavern" else "crystal_wall"
-                        self.block_cols[(chunk_x * self.chunk_size + x, start_y + y)] = chunk[x][y]
+        rare_ids = {self.block_id(ore) for ore in rare_ores}
+        empty_id = self.block_id("empty")
+        wall_id = self.block_id("cave_wall" if zone["name"] != "Crystal Cavern" else "crystal_wall")
+        carved = 0
+        for index in range(max(0, 11 - start_y) * size, size * size):
+            if chunk[index] in rare_ids:
+                continue
+            if not solid[index]:
+                chunk[index] = empty_id
+                carved += 1
+            elif walls[index] and rng.random() < 0.2:
+                chunk[index] = wall_id
+        if not carved:
+            return
 
         # Add treasure
-        if random.random() < 0.1 and zone["name"] in ["Crystal Cavern", "Deep", "Abyss"]:
-            treasure_x = random.randint(2, self.chunk_size - 3)
-            treasure_y = random.randint(2, self.chunk_size - 3)
-            if temp_grid[treasure_x][treasure_y] == 0:
-                chunk[treasure_x][treasure_y] = random.choice(rare_ores)
-                self.block_cols[(chunk_x * self.chunk_size + treasure_x, start_y + treasure_y)] = chunk[treasure_x][treasure_y]
-        logger.debug(f"Generated cave in chunk ({chunk_x}, {chunk_y})")
+        if rng.random() < 0.1 and zone["name"] in ["Crystal Cavern", "Deep", "Abyss"]:
+            treasure_x = rng.randint(2, size - 3)
+            treasure_y = rng.randint(2, size - 3)
+            if not solid[treasure_y * size + treasure_x]:
+                chunk[treasure_y * size + treasure_x] = self.block_id(rng.choice(rare_ores))
+        logger.debug("Generated cave in chunk (%s, %s)", chunk_x, chunk_y)
 
     def get_depth_zone(self, y):
         """Get the depth zone for a given y-coordinate."""
-        current_zone = self.depth_zones[0]
-        for zone in self.depth_zones:
-            if y >= zone["depth"]:
-                current_zone = zone
-            else:
-                break
-        return current_zone
+        return self.depth_zones[max(bisect_right(self.zone_depths, y) - 1, 0)]
 
     def get_biome_color(self, depth):
         """Get the biome color for a given depth."""
         zone = self.get_depth_zone(depth)
         return zone["color"]
 
-    def perlin_noise(self, x, y, scale=0.1, threshold=0.5):
-        """Generate Perlin noise for ore vein generation."""
-        random.seed(self.seed + x * 1000 + y)
-        noise = (math.sin(x * scale) + math.sin(y * scale)) / 2
-        return noise + 0.5
-
-    def generate_ore_vein(self, x, y, zone):
-        """Generate an ore type for a position based on depth zone."""
-        total_weight = sum(self.ores.get(ore, {"weight": 0})["weight"] for ore in zone["blocks"])
-        noise = self.perlin_noise(x, y, scale=0.05)
-        r = (noise + random.random()) / 2 * total_weight
-        current_weight = 0
-        for ore_name in zone["blocks"]:
-            if y * TILE_SIZE >= self.ores.get(ore_name, {"min_depth": 0})["min_depth"]:
-                current_weight += self.ores.get(ore_name, {"weight": 0})["weight"]
-                if r <= current_weight:
-                    return ore_name
-        return "stone"
+    def perlin_noise(self, x, y, scale=ORE_NOISE_SCALE):
+        """Sample the world's seeded gradient noise for ore vein generation."""
+        return self.noise.noise(x, y, scale)
+
+    def generate_ore_vein(self, x, y, zone, rng=random, noise=None):
+        """Generate an ore type for a position based on depth zone, drawing from the chunk's generator."""
+        cumulative, names, _, total_weight = self.ore_band(zone, y)
+        if noise is None:
+            noise = self.perlin_noise(x, y)
+        r = (noise + rng.random()) / 2 * total_weight
+        index = bisect_left(cumulative, r)
+        return names[index] if index < len(names) else "stone"
 
     def ensure_depth(self, depth):
         """Ensure the world is generated up to the specified depth."""
@@ -265,49 +811,59 @@ class World:
         for chunk_x in range(NUM_COLS // self.chunk_size):
             for chunk_y in range(target_chunk_y + 1):
                 self.get_chunk(chunk_x, chunk_y)
-        logger.debug(f"Ensured world depth to {target}")
+        logger.debug("Ensured world depth to %s", target)
 
     def check_stability(self, x, y):
         """Check stability of adjacent unstable blocks."""
-        for dx, dy in [(0, 1), (1, 0), (-1, 0), (0, -1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < NUM_COLS and 0 <= ny < MAX_DEPTH:
-                block = self.block_at(nx, ny)
-                if block == "unstable":
-                    adjacent_empty = sum(1 for ddx, ddy in [(0, 1), (1, 0), (-1, 0), (0, -1)] if 0 <= nx + ddx < NUM_COLS and 0 <= ny + ddy < MAX_DEPTH and self.block_at(nx + ddx, ny + ddy) == "empty")
-                    if adjacent_empty >= 2:
-                        self.unstable_blocks[(nx, ny)] = 0.0
+        for dx, dy in NEIGHBOURS:
+            self.mark_if_unstable(x + dx, y + dy)
+
+    def mark_if_unstable(self, x, y):
+        """Schedule the collapse of an unstable block once two of its sides are open."""
+        if not (0 <= x < NUM_COLS and 0 <= y < MAX_DEPTH) or (x, y) in self.unstable_blocks:
+            return
+        chunk_key = (x // self.chunk_size, y // self.chunk_size)
+        if chunk_key not in self.unstable_index:
+            self.get_chunk(*chunk_key)  # Generating the chunk indexes it
+        if (x, y) not in self.unstable_index[chunk_key]:
+            return
+        adjacent_empty = sum(1 for dx, dy in NEIGHBOURS if 0 <= x + dx < NUM_COLS and 0 <= y + dy < MAX_DEPTH and self.block_at(x + dx, y + dy) == "empty")
+        if adjacent_empty >= 2:
+            deadline = self.elapsed + COLLAPSE_DELAY
+            self.unstable_blocks[(x, y)] = deadline
+            heapq.heappush(self.collapse_queue, (deadline, x, y))
 
     def get_hazard_blocks(self):
         """Get a list of unstable block positions."""
         return list(self.unstable_blocks.keys())
 
     def spawn_falling_rock(self, x, y, velocity, ore_type):
-        """Spawn a falling rock at the specified position."""
+        """Spawn a falling rock at the specified position, growing the rock pool if every rock is in flight."""
         for rock in self.falling_rocks:
             if not rock.active:
-                rock.activate(x, y, velocity, ore_type)
-                return True
-        return False
+                break
+        else:
+            rock = FallingRock()
+            self.falling_rocks.append(rock)
+            logger.debug("Grew falling rock pool to %s", len(self.falling_rocks))
+        rock.activate(x, y, velocity, ore_type)
+        return rock
 
     def update(self, dt):
-        """Update falling rocks and unstable blocks, returning total value collected."""
+        """Update falling rocks and collapse unstable blocks whose deadline has passed, returning total value collected."""
         total_value = 0
         for rock in self.falling_rocks:
-            value = rock.update(dt, self, self.ores)
-            total_value += value
-        to_remove = []
-        for (x, y), timer in self.unstable_blocks.items():
-            timer += dt
-            if timer >= 2.0:
-                block = self.block_at(x, y)
-                if self.spawn_falling_rock(x * TILE_SIZE, y * TILE_SIZE, random.randint(200, 400), block):
-                    self.set_block(x, y, "empty")
-                    to_remove.append((x, y))
-            else:
-                self.unstable_blocks[(x, y)] = timer
-        for pos in to_remove:
-            del self.unstable_blocks[pos]
+            if rock.active:
+                total_value += rock.update(dt, self, self.ores)
+        self.elapsed += dt
+        queue = self.collapse_queue
+        while queue and queue[0][0] <= self.elapsed:
+            deadline, x, y = heapq.heappop(queue)
+            if self.unstable_blocks.get((x, y)) != deadline:
+                continue  # Mined out or reset since it was scheduled
+            del self.unstable_blocks[(x, y)]
+            self.spawn_falling_rock(x * TILE_SIZE, y * TILE_SIZE, random.randint(200, 400), "unstable")
+            self.set_block(x, y, "empty")
         return total_value
 
     def get_surface_y(self, x):